@@ -0,0 +1,264 @@
+import timeit
+
+from kmp import kmp_search
+from naive_search import naive_search
+from rabin_karp_engine import read_text
+
+
+def _symbol(wildcard, pattern):
+    """Символ-шаблон у тому ж вигляді, що й елементи pattern (str — символ, bytes — int)."""
+    if wildcard is None:
+        return None
+    if isinstance(pattern, str) != isinstance(wildcard, str) or len(wildcard) != 1:
+        raise TypeError("wildcard має бути одним символом того ж типу, що й pattern")
+    return wildcard[0]
+
+
+def build_masks(pattern, wildcard=None):
+    """
+    Бітові маски символів: біт i маски c встановлено, якщо pattern[i] == c.
+
+    Позиції з символом-шаблоном (wildcard) підходять до будь-якого символу,
+    тож їхні біти входять до кожної маски, а також до маски за замовчуванням
+    для символів, яких у шаблоні немає.
+    """
+    wildcard = _symbol(wildcard, pattern)
+    default = 0
+    for i, char in enumerate(pattern):
+        if char == wildcard:
+            default |= 1 << i
+    masks = {}
+    for i, char in enumerate(pattern):
+        if char != wildcard:
+            masks[char] = masks.get(char, default) | (1 << i)
+    return masks, default
+
+
+class ShiftAndMatcher:
+    """
+    Точний пошук Shift-And (Baeza-Yates–Gonnet) з підтримкою символу-шаблону.
+
+    Стан — ціле число D, де біт i означає "pattern[: i + 1] закінчується на
+    поточному символі тексту". Один символ тексту обробляється кількома
+    бітовими операціями над усім шаблоном одразу: D = ((D << 1) | 1) & B[c].
+    Цілі числа Python не обмежують довжину шаблону 64 бітами.
+
+    feed() зберігає стан між блоками, тож текст можна подавати частинами;
+    кожен блок обробляється одразу, а не ліниво.
+    """
+
+    def __init__(self, pattern, wildcard=None):
+        if not pattern:
+            raise ValueError("шаблон не може бути порожнім")
+        self.pattern = pattern
+        self.masks, self.default = build_masks(pattern, wildcard)
+        self.high = 1 << (len(pattern) - 1)
+        self.reset()
+
+    def reset(self) -> None:
+        self.state = 0
+        self.offset = 0  # скільки символів потоку вже оброблено
+
+    def feed(self, chunk) -> list:
+        """
+        Обробляє наступний блок потоку повністю й повертає список абсолютних
+        позицій початку входжень — стан завжди відповідає всьому поданому тексту.
+        """
+        positions = self._scan(chunk)
+        self.offset += len(chunk)
+        return positions
+
+    def _scan(self, chunk, first_only=False) -> list:
+        masks, default, high = self.masks, self.default, self.high
+        state = self.state
+        start = self.offset - len(self.pattern) + 1
+        positions = []
+        for i, char in enumerate(chunk):
+            state = ((state << 1) | 1) & masks.get(char, default)
+            if state & high:
+                positions.append(start + i)
+                if first_only:
+                    break
+        self.state = state
+        return positions
+
+    def search_all(self, text) -> list:
+        self.reset()
+        return self.feed(text)
+
+    def search(self, text) -> int:
+        # зупиняється на першому входженні; стан після цього неповний,
+        # тому наступний пошук знову починається з reset()
+        self.reset()
+        positions = self._scan(text, first_only=True)
+        return positions[0] if positions else -1
+
+
+class ShiftOrMatcher(ShiftAndMatcher):
+    """
+    Shift-Or — той самий автомат з інвертованими бітами: 0 означає збіг.
+
+    Крок D = (D << 1) | ~B[c] не потребує "| 1", а маски інвертуються один раз
+    при побудові. Нулі, що вдвигаються зсувом, обмежуються маскою довжини шаблону.
+    """
+
+    def __init__(self, pattern, wildcard=None):
+        super().__init__(pattern, wildcard)
+        self.full = (1 << len(pattern)) - 1
+        self.masks = {char: ~mask & self.full for char, mask in self.masks.items()}
+        self.default = ~self.default & self.full
+
+    def reset(self) -> None:
+        super().reset()
+        self.state = -1  # усі біти встановлені: жодного часткового збігу
+
+    def _scan(self, chunk, first_only=False) -> list:
+        masks, default, high, full = self.masks, self.default, self.high, self.full
+        state = self.state
+        start = self.offset - len(self.pattern) + 1
+        positions = []
+        for i, char in enumerate(chunk):
+            state = ((state << 1) | masks.get(char, default)) & full
+            if not state & high:
+                positions.append(start + i)
+                if first_only:
+                    break
+        self.state = state
+        return positions
+
+
+class MyersMatcher:
+    """
+    Наближений пошук з не більше ніж max_errors помилками (вставка, видалення,
+    заміна) — бітово-паралельний алгоритм Маєрса (1999).
+
+    Замість стовпця матриці відстаней Левенштейна зберігаються лише вектори
+    змін сусідніх клітинок (+1 / -1) як біти цілих чисел Pv та Mv, тож
+    стовпець оновлюється за O(1) операцій над цілими числами на символ.
+    Видає пари (кінець входження — позиція після останнього символу, відстань).
+    """
+
+    def __init__(self, pattern, max_errors: int, wildcard=None):
+        if not pattern:
+            raise ValueError("шаблон не може бути порожнім")
+        self.pattern = pattern
+        self.max_errors = max_errors
+        self.masks, self.default = build_masks(pattern, wildcard)
+        self.full = (1 << len(pattern)) - 1
+        self.high = 1 << (len(pattern) - 1)
+        self.reset()
+
+    def reset(self) -> None:
+        self.positive = self.full  # Pv: вертикальні прирости +1
+        self.negative = 0  # Mv: вертикальні прирости -1
+        self.score = len(self.pattern)  # відстань для всього шаблону в поточній позиції
+        self.offset = 0
+
+    def feed(self, chunk) -> list:
+        """Обробляє блок повністю й повертає список пар (кінець входження, відстань)."""
+        masks, default, full, high = self.masks, self.default, self.full, self.high
+        max_errors = self.max_errors
+        positive, negative, score = self.positive, self.negative, self.score
+        matches = []
+        for i, char in enumerate(chunk):
+            eq = masks.get(char, default)
+            xv = eq | negative
+            xh = ((((eq & positive) + positive) & full) ^ positive) | eq
+            ph = negative | (~(xh | positive) & full)
+            mh = positive & xh
+            if ph & high:
+                score += 1
+            elif mh & high:
+                score -= 1
+            # початок входження вільний: рядок 0 матриці — нулі, тож у ph не вдвигаємо 1
+            ph = (ph << 1) & full
+            mh = (mh << 1) & full
+            positive = mh | (~(xv | ph) & full)
+            negative = ph & xv
+            if score <= max_errors:
+                matches.append((self.offset + i + 1, score))
+        self.positive, self.negative, self.score = positive, negative, score
+        self.offset += len(chunk)
+        return matches
+
+    def search_all(self, text) -> list:
+        self.reset()
+        return self.feed(text)
+
+
+def myers_distance(s1, s2) -> int:
+    """Відстань Левенштейна між двома рядками за O(len(s2)) кроків над цілими числами."""
+    if not s1:
+        return len(s2)
+    masks, _ = build_masks(s1)
+    full = (1 << len(s1)) - 1
+    high = 1 << (len(s1) - 1)
+    positive, negative, score = full, 0, len(s1)
+    for char in s2:
+        eq = masks.get(char, 0)
+        xv = eq | negative
+        xh = ((((eq & positive) + positive) & full) ^ positive) | eq
+        ph = negative | (~(xh | positive) & full)
+        mh = positive & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        # на відміну від пошуку, рядок 0 матриці — 0, 1, 2, ..., тож вдвигаємо 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        positive = mh | (~(xv | ph) & full)
+        negative = ph & xv
+    return score
+
+
+def feed_file(matcher, file_path, chunk_size: int = 1 << 16, encoding: str = "cp1251"):
+    """
+    Потоковий пошук у файлі блоками без завантаження всього тексту.
+    Для шаблону str файл декодується з `encoding` (статті курсу — у cp1251).
+    """
+    matcher.reset()
+    if isinstance(matcher.pattern, bytes):
+        file = open(file_path, "rb")
+    else:
+        file = open(file_path, "r", encoding=encoding)
+    with file:
+        while chunk := file.read(chunk_size):
+            yield from matcher.feed(chunk)
+
+
+if __name__ == "__main__":
+    print(ShiftAndMatcher("AB?A", wildcard="?").search_all("ABDABABCABAB ABBA"))
+    print(ShiftOrMatcher(b"ABBA").search_all(b"ABDA BAB CABAB group ABBA is not easy"))
+    print(MyersMatcher("battery", 2).search_all("my battary is low"))
+    words = ["apple", "application", "banana", "band", "battery", "bat"]
+    print([word for word in words if myers_distance(word, "battary") <= 2])
+
+    # потоковий режим: збіг на межі блоків не губиться
+    matcher = ShiftAndMatcher("межі")
+    print([position for chunk in ["на ме", "жі блоків", " і межі"] for position in matcher.feed(chunk)])
+
+    text = read_text()
+    patterns = ["реалізація методів", "Буратіно дурачок"]
+    results = []
+    for pattern in patterns:
+        runs = [
+            ("naive_search", lambda: naive_search(text, pattern)),
+            ("kmp_search", lambda: kmp_search(text, pattern)),
+            ("ShiftAndMatcher", lambda: ShiftAndMatcher(pattern).search(text)),
+            ("ShiftOrMatcher", lambda: ShiftOrMatcher(pattern).search(text)),
+            ("Shift-And, усі входження", lambda: ShiftAndMatcher(pattern).search_all(text)),
+            ("Myers, k=2, усі входження", lambda: MyersMatcher(pattern, 2).search_all(text)),
+        ]
+        for name, run in runs:
+            results.append((name, pattern, timeit.timeit(run, number=10)))
+
+    print(f"\n{'Алгоритм':<26} | {'Підрядок':<20} | {'Час (сек)':<10}")
+    print("-" * 62)
+    for name, pattern, elapsed in results:
+        print(f"{name:<26} | {pattern:<20} | {elapsed:<10.6f}")
+
+    # пошук з помилками: "алгоритм" з друкарськими помилками
+    for typo in ["алгорітм", "алгортм", "алгоритмм"]:
+        matches = MyersMatcher(typo, 1).search_all(text)
+        print(f"{typo!r}: {len(matches)} закінчень входжень з 1 помилкою")
@@ -10,10 +10,11 @@ def build_shift_table(pattern):
     return table
 
 
-def boyer_moore_search(text, pattern):
+def boyer_moore_search(text, pattern, search_all=False):
     # Створюємо таблицю зсувів для патерну (підрядка)
     shift_table = build_shift_table(pattern)
     i = 0  # Ініціалізуємо початковий індекс для основного тексту
+    matches = []  # усі знайдені позиції, якщо search_all=True
 
     # Проходимо по основному тексту, порівнюючи з підрядком
     while i <= len(text) - len(pattern):
@@ -25,14 +26,16 @@ def boyer_moore_search(text, pattern):
 
         # Якщо весь підрядок збігається, повертаємо його позицію в тексті
         if j < 0:
-            return i  # Підрядок знайдено
+            if not search_all:
+                return i  # Підрядок знайдено
+            matches.append(i)
 
         # Зсуваємо індекс i на основі таблиці зсувів
         # Це дозволяє "перестрибувати" над неспівпадаючими частинами тексту
         i += shift_table.get(text[i + len(pattern) - 1], len(pattern))
 
     # Якщо підрядок не знайдено, повертаємо -1
-    return -1
+    return matches if search_all else -1
 
 
 if __name__ == '__main__':
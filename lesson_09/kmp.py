@@ -18,7 +18,7 @@ def compute_lps(pattern):
     return lps
 
 
-def kmp_search(main_string, pattern):
+def kmp_search(main_string, pattern, search_all=False):
     M = len(pattern)
     N = len(main_string)
 
@@ -26,6 +26,7 @@ def kmp_search(main_string, pattern):
     # print(lps)
     i = 0
     j = 0
+    matches = []
 
     while i < N:
         if pattern[j] == main_string[i]:
@@ -37,9 +38,92 @@ def kmp_search(main_string, pattern):
             i += 1
 
         if j == M:
-            return i - j
+            if not search_all:
+                return i - j
+            matches.append(i - j)
+            # продовжуємо з найдовшого власного префікса-суфікса
+            j = lps[j - 1]
+
+    return matches if search_all else -1  # якщо підрядок не знайдено
+
+
+class KMPMatcher:
+    """
+    Потоковий пошук КМП: текст подається блоками, а стан автомата (скільки
+    символів шаблону вже збіглося) зберігається між викликами feed().
 
-    return -1  # якщо підрядок не знайдено
+    Входження, розрізане межею блоків, не губиться, а пам'ять не залежить від
+    розміру потоку — тож так можна переглядати логи з файлу чи сокета.
+    Шаблон і блоки мають бути одного типу: str або bytes.
+    """
+
+    def __init__(self, pattern):
+        if not pattern:
+            raise ValueError("шаблон не може бути порожнім")
+        self.pattern = pattern
+        self.lps = compute_lps(pattern)
+        self.reset()
+
+    def reset(self):
+        self.matched = 0  # довжина префікса шаблону, що збігся з кінцем потоку
+        self.offset = 0  # скільки символів потоку вже оброблено
+
+    def feed(self, chunk):
+        """
+        Обробляє наступний блок повністю й повертає список абсолютних позицій
+        початку входжень. Блок обробляється одразу, а не ліниво, тож стан між
+        викликами завжди відповідає всьому поданому тексту.
+        """
+        pattern, lps = self.pattern, self.lps
+        M = len(pattern)
+        N = len(chunk)
+        first = pattern[0]
+        j = self.matched
+        i = 0
+        positions = []
+        while i < N:
+            if j == 0:
+                # на початку шаблону перестрибуємо до наступного входження першого символу
+                i = chunk.find(first, i)
+                if i == -1:
+                    break
+            if pattern[j] == chunk[i]:
+                i += 1
+                j += 1
+                if j == M:
+                    positions.append(self.offset + i - M)
+                    j = lps[j - 1]
+            elif j != 0:
+                j = lps[j - 1]
+            else:
+                i += 1
+        self.matched = j
+        self.offset += N
+        return positions
+
+    def scan(self, source, chunk_size=1 << 16):
+        """
+        Пошук у потоці: файловий об'єкт (read), сокет (recv) або ітератор блоків.
+        """
+        self.reset()
+        if hasattr(source, "recv"):
+            while chunk := source.recv(chunk_size):
+                yield from self.feed(chunk)
+        elif hasattr(source, "read"):
+            while chunk := source.read(chunk_size):
+                yield from self.feed(chunk)
+        else:
+            for chunk in source:
+                yield from self.feed(chunk)
+
+    def scan_file(self, file_path, chunk_size=1 << 16, encoding="cp1251"):
+        """Пошук у файлі; для шаблону str файл декодується з `encoding`."""
+        if isinstance(self.pattern, bytes):
+            file = open(file_path, "rb")
+        else:
+            file = open(file_path, "r", encoding=encoding)
+        with file:
+            yield from self.scan(file, chunk_size)
 
 
 if __name__ == '__main__':
@@ -48,6 +132,11 @@ if __name__ == '__main__':
     print(compute_lps(pattern))
     print(kmp_search(main_string, pattern))
 
+    # потоковий режим: "ABBA" розрізано між блоками, позиції — від початку потоку
+    matcher = KMPMatcher(b"ABBA")
+    chunks = [b"ABDA BAB CABAB group AB", b"BA is ABB", b"ABBA not easy"]
+    print(list(matcher.scan(chunks)))
+
     # main_string = "teter"
     # pattern = "tetur"
     # print(compute_lps(pattern))
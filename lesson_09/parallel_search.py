@@ -0,0 +1,112 @@
+import mmap
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from boyer_moore_search import boyer_moore_search
+from kmp import kmp_search
+from rabina_karp import rabin_karp_search
+
+SEARCH_FUNCTIONS = {
+    "boyer_moore": boyer_moore_search,
+    "kmp": kmp_search,
+    "rabin_karp": rabin_karp_search,
+}
+
+
+def find_all(search_func, text, pattern) -> list:
+    """Усі входження за один прохід тексту (режим search_all, без копій залишку)."""
+    return search_func(text, pattern, search_all=True)
+
+
+def split_chunks(file_size: int, pattern_length: int, chunk_size: int):
+    """
+    Ділить файл на блоки [start, end). Кожен блок читається з перекриттям
+    pattern_length - 1 символів, тож входження на межі не губиться, а
+    зараховується лише тому блоку, в якому воно починається.
+    """
+    overlap = pattern_length - 1
+    for start in range(0, file_size, chunk_size):
+        end = min(start + chunk_size, file_size)
+        yield start, end, min(end + overlap, file_size)
+
+
+def search_chunk(task):
+    """Задача для процесу: пошук у блоці файлу, відображеного через mmap."""
+    file_path, start, end, read_end, pattern, algorithm = task
+    with open(file_path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        # latin-1 відображає кожен байт в один символ, тож позиції в рядку — це зміщення в байтах
+        text = mapped[start:read_end].decode("latin-1")
+    positions = find_all(SEARCH_FUNCTIONS[algorithm], text, pattern.decode("latin-1"))
+    return file_path, [start + index for index in positions if start + index < end]
+
+
+def parallel_search(file_paths, pattern: bytes, algorithm: str = "boyer_moore",
+                    max_workers=None, chunk_size: int = 1 << 20) -> dict:
+    """
+    Пошук усіх входжень pattern у наборі файлів на пулі процесів.
+
+    Великі файли діляться на блоки з перекриттям, малі йдуть однією задачею.
+    Повертає {шлях: впорядкований список зміщень у байтах без повторів}.
+    """
+    if isinstance(pattern, str):
+        pattern = pattern.encode("utf-8")
+    if algorithm not in SEARCH_FUNCTIONS:
+        raise ValueError(f"невідомий алгоритм: {algorithm}")
+    tasks = []
+    for file_path in file_paths:
+        file_size = os.path.getsize(file_path)
+        for start, end, read_end in split_chunks(file_size, len(pattern), chunk_size):
+            tasks.append((file_path, start, end, read_end, pattern, algorithm))
+
+    results = {file_path: set() for file_path in file_paths}
+    if max_workers == 1:
+        outputs = map(search_chunk, tasks)  # без пулу: зручно для порівняння
+        for file_path, positions in outputs:
+            results[file_path].update(positions)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for file_path, positions in executor.map(search_chunk, tasks, chunksize=4):
+                results[file_path].update(positions)
+    return {file_path: sorted(positions) for file_path, positions in results.items()}
+
+
+def make_test_file(file_path, size: int, pattern: bytes, occurrences: int):
+    """Випадковий текст з англійських "слів" і вставленими входженнями pattern."""
+    rng = random.Random(42)
+    alphabet = b"abcdefghijklmnopqrstuvwxyz      \n"
+    data = bytearray(rng.choices(alphabet, k=size))
+    for _ in range(occurrences):
+        position = rng.randrange(size - len(pattern))
+        data[position : position + len(pattern)] = pattern
+    with open(file_path, "wb") as file:
+        file.write(data)
+
+
+if __name__ == "__main__":
+    pattern = b"needle in a haystack"
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    file_path = os.path.join(tempfile.gettempdir(), "parallel_search.txt")
+    make_test_file(file_path, size_mb << 20, pattern, occurrences=1000)
+    with open(file_path, "rb") as file:
+        data = file.read()
+    expected = [i for i in range(len(data)) if data.startswith(pattern, i)]
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpu_count})
+    print(f"Файл {size_mb} МБ, ядер: {cpu_count}")
+    print(f"{'Алгоритм':<12} | {'Процесів':<8} | {'Час (сек)':<10} | {'Прискорення':<11}")
+    print("-" * 50)
+    for algorithm in ["boyer_moore", "kmp", "rabin_karp"]:
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            result = parallel_search([file_path], pattern, algorithm, max_workers=workers)
+            elapsed = time.perf_counter() - start
+            assert result[file_path] == expected
+            baseline = baseline or elapsed
+            print(f"{algorithm:<12} | {workers:<8} | {elapsed:<10.3f} | {baseline / elapsed:<11.2f}")
+    os.remove(file_path)
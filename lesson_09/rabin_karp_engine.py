@@ -0,0 +1,153 @@
+import os
+import random
+import timeit
+from itertools import islice
+
+from rabina_karp import rabin_karp_search
+
+# Просте число Мерсенна 2^61 - 1: хеші майже не збігаються випадково,
+# тож порівняння зрізів відбувається лише для справжніх входжень
+MODULUS = (1 << 61) - 1
+
+
+class RabinKarpEngine:
+    """
+    Пошук Рабіна–Карпа для багатьох шаблонів різної довжини одночасно.
+
+    Шаблони групуються за довжиною; для кожної довжини тримається один
+    ковзний хеш вікна тексту, який перевіряється в словнику хешів шаблонів
+    цієї довжини. Основа хешу випадкова, а модуль — велике просте число,
+    тому ймовірність хибного збігу для одного вікна близько 1 / 2^61.
+    """
+
+    def __init__(self, patterns, base=None):
+        self.base = base if base is not None else random.randrange(256, MODULUS - 1)
+        self.by_length = {}  # довжина -> {хеш: [шаблони]}
+        for pattern in dict.fromkeys(patterns):
+            if pattern:
+                targets = self.by_length.setdefault(len(pattern), {})
+                targets.setdefault(self.hash(pattern), []).append(pattern)
+        # таблиця степенів основи: powers[k] = base^k mod MODULUS
+        max_length = max(self.by_length, default=0)
+        self.powers = [1] * (max_length + 1)
+        for k in range(1, max_length + 1):
+            self.powers[k] = self.powers[k - 1] * self.base % MODULUS
+        self.collisions = 0  # хеш збігся, а рядок — ні
+
+    def hash(self, s) -> int:
+        hash_value = 0
+        for char in s:
+            hash_value = (hash_value * self.base + ord(char)) % MODULUS
+        return hash_value
+
+    def _search_length(self, text, length, targets):
+        if length > len(text):
+            return
+        base = self.base
+        # base^length — вага символу, що виходить з вікна після множення на base
+        high = self.powers[length]
+        window_hash = 0
+        for char in islice(text, length):
+            window_hash = (window_hash * base + ord(char)) % MODULUS
+        if window_hash in targets:
+            yield from self._verify(text, 0, length, targets[window_hash])
+        # ковзний хеш: пара (символ, що виходить; символ, що входить) без копій тексту
+        for i, (old, new) in enumerate(zip(text, islice(text, length, None)), 1):
+            window_hash = (window_hash * base + ord(new) - ord(old) * high) % MODULUS
+            if window_hash in targets:
+                yield from self._verify(text, i, length, targets[window_hash])
+
+    def _verify(self, text, i, length, candidates):
+        window = text[i : i + length]
+        matched = False
+        for pattern in candidates:
+            if window == pattern:
+                matched = True
+                yield i, pattern
+        if not matched:
+            self.collisions += 1
+
+    def iter_matches(self, text):
+        """Видає пари (позиція, шаблон); порядок — за довжиною шаблону, потім за позицією."""
+        for length, targets in self.by_length.items():
+            yield from self._search_length(text, length, targets)
+
+    def search_all(self, text) -> list:
+        """Усі входження всіх шаблонів, відсортовані за позицією."""
+        return sorted(self.iter_matches(text))
+
+    def search(self, text) -> int:
+        """Позиція першого входження будь-якого шаблону або -1."""
+        return min((i for i, _ in self.iter_matches(text)), default=-1)
+
+
+def count_collisions(text, pattern, modulus):
+    """Скільки вікон мають хеш шаблону, але не збігаються з ним (base=256)."""
+    length = len(pattern)
+    target = 0
+    for char in pattern:
+        target = (target * 256 + ord(char)) % modulus
+    high = pow(256, length - 1, modulus)
+    current_hash = 0
+    for char in text[:length]:
+        current_hash = (current_hash * 256 + ord(char)) % modulus
+    collisions = 0
+    for i in range(len(text) - length + 1):
+        if current_hash == target and text[i : i + length] != pattern:
+            collisions += 1
+        if i < len(text) - length:
+            current_hash = ((current_hash - ord(text[i]) * high) * 256 + ord(text[i + length])) % modulus
+    return collisions
+
+
+def read_text():
+    file_path = os.path.join(os.path.dirname(__file__), "..", "practical_01", "стаття 2.txt")
+    with open(file_path, "r", encoding="cp1251") as file:
+        return file.read()
+
+
+if __name__ == "__main__":
+    main_string = "Being a developer is not easy"
+    engine = RabinKarpEngine(["developer", "is not", "easy", "hard"])
+    print(engine.search(main_string), engine.search_all(main_string))
+
+    text = read_text()
+    existing_pattern = "реалізація методів"
+    non_existing_pattern = "Буратіно дурачок"
+
+    print(f"\n{'Модуль':<10} | {'Підрядок':<20} | {'Хибних збігів хешу':<18}")
+    print("-" * 54)
+    for modulus in [100, MODULUS]:
+        for pattern in [existing_pattern, non_existing_pattern]:
+            print(f"{modulus:<10} | {pattern:<20} | {count_collisions(text, pattern, modulus):<18}")
+
+    print(f"\n{'Алгоритм':<28} | {'Підрядок':<20} | {'Час (сек)':<10}")
+    print("-" * 64)
+    for pattern in [existing_pattern, non_existing_pattern]:
+        engine = RabinKarpEngine([pattern])
+        timings = [
+            ("rabin_karp_search (mod 100)", timeit.timeit(lambda: rabin_karp_search(text, pattern), number=10)),
+            ("RabinKarpEngine.search", timeit.timeit(lambda: engine.search(text), number=10)),
+        ]
+        for name, elapsed in timings:
+            print(f"{name:<28} | {pattern:<20} | {elapsed:<10.6f}")
+
+    # Пакетний пошук: шаблони різної довжини (слова та групи слів з тексту),
+    # кожен другий перевернуто, щоб половини шаблонів у тексті не було
+    words = text.split()
+    print(f"\n{'Шаблонів':<8} | {'Довжин':<6} | {'rabin_karp_search x N':<22} | {'RabinKarpEngine':<16}")
+    print("-" * 62)
+    for count in [1, 10, 100, 1000]:
+        patterns = list(dict.fromkeys(
+            " ".join(words[i : i + 1 + i % 3])[:: 1 if i % 4 else -1]
+            for i in range(0, len(words) - 3, 2)
+        ))[:count]
+        engine = RabinKarpEngine(patterns)
+        # стара версія повертає лише перше входження, тож вона ще й у виграші
+        old_time = (
+            timeit.timeit(lambda: [rabin_karp_search(text, p) for p in patterns], number=1)
+            if count <= 100 else None
+        )
+        new_time = timeit.timeit(lambda: engine.search_all(text), number=1)
+        old_cell = "—" if old_time is None else f"{old_time:.6f}"
+        print(f"{len(patterns):<8} | {len(engine.by_length):<6} | {old_cell:<22} | {new_time:<16.6f}")
@@ -10,7 +10,7 @@ def polynomial_hash(s, base=256, modulus=101):
     return hash_value
 
 
-def rabin_karp_search(main_string, substring):
+def rabin_karp_search(main_string, substring, search_all=False):
     # Довжини основного рядка та підрядка пошуку
     substring_length = len(substring)
     main_string_length = len(main_string)
@@ -26,11 +26,16 @@ def rabin_karp_search(main_string, substring):
     # Попереднє значення для перерахунку хешу
     h_multiplier = base ** (substring_length - 1) % modulus
 
+    # Усі знайдені позиції, якщо search_all=True
+    matches = []
+
     # Проходимо крізь основний рядок
     for i in range(main_string_length - substring_length + 1):
         if substring_hash == current_slice_hash:
             if main_string[i:i + substring_length] == substring:
-                return i
+                if not search_all:
+                    return i
+                matches.append(i)
 
         if i < main_string_length - substring_length:
             # Видаляємо старий символ (лівий), що виходить з вікна:
@@ -40,7 +45,7 @@ def rabin_karp_search(main_string, substring):
             if current_slice_hash < 0:
                 current_slice_hash += modulus
 
-    return -1
+    return matches if search_all else -1
 
 
 if __name__ == '__main__':
@@ -0,0 +1,70 @@
+from collections import deque
+
+
+class AhoCorasick:
+    """
+    Автомат Ахо–Корасік для одночасного пошуку багатьох підрядків.
+
+    Будується префіксне дерево (trie) всіх шаблонів, а кожен вузол отримує
+    "посилання невдачі" (fail link) — на найдовший власний суфікс, що теж є
+    вузлом дерева. Це узагальнення таблиці lps з алгоритму КМП на множину
+    шаблонів: текст проходиться один раз, за O(n + m + кількість збігів),
+    незалежно від кількості шаблонів.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = [pattern for pattern in dict.fromkeys(patterns) if pattern]
+        self.goto = [{}]  # переходи вузлів дерева
+        self.fail = [0]
+        self.output = [[]]  # номери шаблонів, що закінчуються у вузлі (з урахуванням fail)
+        for index, pattern in enumerate(self.patterns):
+            self._insert(pattern, index)
+        self._build_fail_links()
+
+    def _insert(self, pattern, index: int) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            state = next_state
+        self.output[state].append(index)
+
+    def _build_fail_links(self) -> None:
+        # обхід у ширину: fail-посилання вузла вказує на менш глибокий вузол
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                # збіги суфікса — теж збіги поточного вузла
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def iter_matches(self, text):
+        """Видає пари (позиція, шаблон) для всіх входжень, зокрема тих, що перекриваються."""
+        goto, fail, output, patterns = self.goto, self.fail, self.output, self.patterns
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                pattern = patterns[index]
+                yield i - len(pattern) + 1, pattern
+
+    def search_all(self, text) -> list:
+        return list(self.iter_matches(text))
+
+
+if __name__ == "__main__":
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    print(automaton.search_all("ahishers"))
+    # [(1, 'his'), (3, 'she'), (4, 'he'), (4, 'hers')]
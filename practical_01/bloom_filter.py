@@ -1,26 +1,282 @@
+import math
+import mmap
+import os
+import struct
+import tempfile
+
 import mmh3
 
+MASK_64 = (1 << 64) - 1
+
+# Формат файлу: заголовок + сирі байти бітового масиву.
+# magic, num_hashes, size, bits_set, count, capacity (0 = None), target_fp_rate (0 = None)
+FILE_HEADER = struct.Struct("<4sIQQQQd")
+FILE_MAGIC = b"BLM1"
+# розмір блоку для побітових операцій над великими фільтрами
+CHUNK_SIZE = 1 << 20
+# дійсні ключі хешуються як 8 байтів IEEE 754 (див. as_key)
+FLOAT_KEY = struct.Struct("<d")
+
+
+def as_key(item):
+    """
+    Ключ для хешування: str і bytes лишаються як є, скаляри NumPy спершу
+    стають значеннями Python через item().
+
+    Решта типів кодується в bytes з префіксом 0xFF (у UTF-8 такого байта
+    немає, тож ключ не збігається з ключем жодного рядка) і міткою типу:
+    ціле — int.to_bytes, дійсне — 8 байтів IEEE 754, інше — ім'я типу та str().
+    Отже 1, 1.0 і "1" — три різні ключі, а True, як і в Python, дорівнює 1.
+    """
+    if isinstance(item, (str, bytes)):
+        return item
+    if hasattr(item, "dtype") and hasattr(item, "item"):
+        item = item.item()
+        if isinstance(item, (str, bytes)):
+            return item
+    if isinstance(item, int):
+        return b"\xffi" + item.to_bytes(item.bit_length() // 8 + 1, "little", signed=True)
+    if isinstance(item, float):
+        return b"\xfff" + FLOAT_KEY.pack(item)
+    return b"\xffo" + f"{type(item).__qualname__}:{item}".encode("utf-8")
+
+
+def as_keys(items):
+    """Ітератор ключів з ітерованого об'єкта або масиву NumPy (див. as_key)."""
+    if hasattr(items, "tolist"):
+        # масив NumPy: спершу в об'єкти Python одним викликом, а не item() на кожен
+        items = items.tolist()
+    return map(as_key, items)
+
 
 class BloomFilter:
+    # сигнатура файлу та атрибут зі сховищем позицій — підкласи їх перевизначають
+    FILE_MAGIC = FILE_MAGIC
+    STORAGE = "bit_array"
+
     def __init__(self, size: int, num_hashes: int):
         self.size = size
         self.num_hashes = num_hashes
-        self.bit_array = [0] * size
+        # один біт на позицію: 8 позицій в одному байті
+        self.bit_array = bytearray((size + 7) // 8)
+        self.bits_set = 0  # кількість одиничних бітів — для оцінки хибних спрацювань
+        self.count = 0  # кількість викликів додавання
+        self.capacity = None
+        self.target_fp_rate = None
+        self.mmap = None  # відображений у пам'ять файл, якщо фільтр завантажено з mmap_mode
+        self.mmap_mode = None
+
+    @classmethod
+    def from_capacity(cls, expected_items: int, fp_rate: float) -> "BloomFilter":
+        """
+        Створює фільтр оптимального розміру для `expected_items` елементів
+        з цільовою ймовірністю хибно-позитивного результату `fp_rate`:
+
+        m = -n * ln(p) / (ln 2)^2,  k = (m / n) * ln 2
+        """
+        size = math.ceil(-expected_items * math.log(fp_rate) / math.log(2) ** 2)
+        num_hashes = max(1, round(size / expected_items * math.log(2)))
+        bloom_filter = cls(size, num_hashes)
+        bloom_filter.capacity = expected_items
+        bloom_filter.target_fp_rate = fp_rate
+        return bloom_filter
+
+    def false_positive_rate(self) -> float:
+        """Поточна оцінка ймовірності хибного спрацювання: (частка одиниць)^k."""
+        return (self.bits_set / self.size) ** self.num_hashes
+
+    def _indexes(self, item):
+        # Один 128-бітний хеш MurmurHash3 замість num_hashes окремих викликів.
+        # Подвійне хешування: index_i = (h1 + i * h2) % size
+        digest = mmh3.hash128(as_key(item))
+        h1 = digest & MASK_64
+        h2 = digest >> 64
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.num_hashes)]
 
     def add(self, item: str):
-        for i in range(self.num_hashes):
-            index = mmh3.hash(item, i) % self.size
-            self.bit_array[index] = 1
+        bit_array = self.bit_array
+        for index in self._indexes(item):
+            mask = 1 << (index & 7)
+            if not bit_array[index >> 3] & mask:
+                bit_array[index >> 3] |= mask
+                self.bits_set += 1
+        self.count += 1
 
     def contains(self, item: str):
-        for i in range(self.num_hashes):
-            index = mmh3.hash(item, i) % self.size
-            if self.bit_array[index] == 0:
+        bit_array = self.bit_array
+        for index in self._indexes(item):
+            if not bit_array[index >> 3] & (1 << (index & 7)):
                 return False
         return True
 
+    def add_many(self, items):
+        """
+        Додає всі елементи з ітерованого об'єкта або масиву NumPy.
+
+        Хешування лишається поелементним (mmh3 не має пакетного API): виграш
+        дає цикл без викликів методів і з локальними змінними.
+        """
+        bit_array = self.bit_array
+        size = self.size
+        num_hashes = self.num_hashes
+        hash128 = mmh3.hash128
+        bits_set = self.bits_set
+        count = 0
+        for item in as_keys(items):
+            digest = hash128(item)
+            index = (digest & MASK_64) % size
+            step = (digest >> 64) % size
+            for _ in range(num_hashes):
+                byte = bit_array[index >> 3]
+                mask = 1 << (index & 7)
+                if not byte & mask:
+                    bit_array[index >> 3] = byte | mask
+                    bits_set += 1
+                index += step
+                if index >= size:
+                    index -= size
+            count += 1
+        self.bits_set = bits_set
+        self.count += count
+
+    def contains_many(self, items) -> list:
+        """Повертає список bool: чи може кожен з елементів бути у фільтрі."""
+        bit_array = self.bit_array
+        size = self.size
+        num_hashes = self.num_hashes
+        hash128 = mmh3.hash128
+        result = []
+        for item in as_keys(items):
+            digest = hash128(item)
+            index = (digest & MASK_64) % size
+            step = (digest >> 64) % size
+            found = True
+            for _ in range(num_hashes):
+                if not bit_array[index >> 3] & (1 << (index & 7)):
+                    found = False
+                    break
+                index += step
+                if index >= size:
+                    index -= size
+            result.append(found)
+        return result
+
     def visualize(self):
-        return "".join(["x" if bit == 1 else "0" for bit in self.bit_array])
+        bit_array = self.bit_array
+        return "".join(
+            "x" if bit_array[i >> 3] & (1 << (i & 7)) else "0" for i in range(self.size)
+        )
+
+    @staticmethod
+    def _storage_bytes(size: int) -> int:
+        """Скільки байтів займає сховище для `size` позицій."""
+        return (size + 7) // 8
+
+    def _header(self) -> bytes:
+        return FILE_HEADER.pack(
+            self.FILE_MAGIC,
+            self.num_hashes,
+            self.size,
+            self.bits_set,
+            self.count,
+            self.capacity or 0,
+            self.target_fp_rate or 0.0,
+        )
+
+    def save(self, file_path) -> None:
+        """Зберігає фільтр у компактний двійковий файл."""
+        with open(file_path, "wb") as file:
+            file.write(self._header())
+            file.write(getattr(self, self.STORAGE))
+
+    @classmethod
+    def load(cls, file_path, mmap_mode=None) -> "BloomFilter":
+        """
+        Завантажує фільтр, збережений методом save().
+
+        mmap_mode=None — бітовий масив читається в пам'ять повністю;
+        mmap_mode="r"  — файл відображається в пам'ять (mmap) лише для читання,
+                         і contains() читає біти прямо з файлу;
+        mmap_mode="r+" — те саме, але add() змінює файл; викличте flush()/close().
+        """
+        if mmap_mode not in (None, "r", "r+"):
+            raise ValueError(f"Невідомий mmap_mode: {mmap_mode!r}")
+        with open(file_path, "rb" if mmap_mode != "r+" else "r+b") as file:
+            header = file.read(FILE_HEADER.size)
+            magic, num_hashes, size, bits_set, count, capacity, fp_rate = FILE_HEADER.unpack(header)
+            if magic != cls.FILE_MAGIC:
+                raise ValueError(f"{file_path} не є файлом {cls.__name__}")
+            bloom_filter = cls(0, num_hashes)
+            if mmap_mode is None:
+                storage = bytearray(file.read())
+            else:
+                access = mmap.ACCESS_READ if mmap_mode == "r" else mmap.ACCESS_WRITE
+                bloom_filter.mmap_mode = mmap_mode
+                bloom_filter.mmap = mmap.mmap(file.fileno(), 0, access=access)
+                storage = memoryview(bloom_filter.mmap)[FILE_HEADER.size :]
+        if len(storage) != cls._storage_bytes(size):
+            raise ValueError(f"{file_path}: розмір масиву не збігається із заголовком")
+        setattr(bloom_filter, cls.STORAGE, storage)
+        bloom_filter.size = size
+        bloom_filter.bits_set = bits_set
+        bloom_filter.count = count
+        bloom_filter.capacity = capacity or None
+        bloom_filter.target_fp_rate = fp_rate or None
+        return bloom_filter
+
+    def flush(self) -> None:
+        """Записує лічильники в заголовок файлу, відкритого з mmap_mode="r+"."""
+        if self.mmap is None or self.mmap_mode != "r+":
+            return
+        self.mmap[: FILE_HEADER.size] = self._header()
+        self.mmap.flush()
+
+    def close(self) -> None:
+        if self.mmap is None:
+            return
+        self.flush()
+        getattr(self, self.STORAGE).release()
+        self.mmap.close()
+        self.mmap = None
+
+    def _check_compatible(self, other: "BloomFilter") -> None:
+        if type(other) is not type(self):
+            raise TypeError(
+                f"Не можна поєднати {type(self).__name__} з {type(other).__name__}"
+            )
+        if self.size != other.size or self.num_hashes != other.num_hashes:
+            raise ValueError("Об'єднувати можна лише фільтри однакового розміру та з однаковим k")
+
+    def _combine(self, other: "BloomFilter", operation) -> "BloomFilter":
+        self._check_compatible(other)
+        result = BloomFilter(self.size, self.num_hashes)
+        result.capacity = self.capacity
+        result.target_fp_rate = self.target_fp_rate
+        bits_set = 0
+        # обробляємо блоками як великі цілі числа, щоб не тримати весь фільтр у вигляді int
+        for start in range(0, len(self.bit_array), CHUNK_SIZE):
+            end = min(start + CHUNK_SIZE, len(self.bit_array))
+            a = int.from_bytes(self.bit_array[start:end], "little")
+            b = int.from_bytes(other.bit_array[start:end], "little")
+            combined = operation(a, b)
+            result.bit_array[start:end] = combined.to_bytes(end - start, "little")
+            bits_set += bin(combined).count("1")
+        result.bits_set = bits_set
+        return result
+
+    def union(self, other: "BloomFilter") -> "BloomFilter":
+        """Фільтр, що містить елементи обох фільтрів (побітове OR)."""
+        result = self._combine(other, lambda a, b: a | b)
+        result.count = self.count + other.count
+        return result
+
+    def intersection(self, other: "BloomFilter") -> "BloomFilter":
+        """Наближення перетину множин (побітове AND); FP-оцінка може бути завищеною."""
+        result = self._combine(other, lambda a, b: a & b)
+        result.count = min(self.count, other.count)
+        return result
+
 
 if __name__ == "__main__":
     bloom_filter = BloomFilter(1000, 3)
@@ -37,3 +293,26 @@ if __name__ == "__main__":
     print(bloom_filter.contains("grape"))
     print(bloom_filter.contains("kiwi"))
 
+    # Пакетні операції
+    bloom_filter.add_many(["grape", "kiwi"])
+    print(bloom_filter.contains_many(["grape", "kiwi", "mango"]))
+    print(f"Розмір бітового масиву: {len(bloom_filter.bit_array)} байт на {bloom_filter.size} біт")
+
+    # Автоматичний підбір m та k під очікувану кількість елементів
+    sized_filter = BloomFilter.from_capacity(expected_items=10_000, fp_rate=0.01)
+    sized_filter.add_many(f"user-{i}" for i in range(10_000))
+    print(
+        f"m = {sized_filter.size}, k = {sized_filter.num_hashes}, "
+        f"оцінка FP = {sized_filter.false_positive_rate():.4f}"
+    )
+
+    # Збереження, відображення файлу в пам'ять та об'єднання фільтрів
+    other_filter = BloomFilter.from_capacity(expected_items=10_000, fp_rate=0.01)
+    other_filter.add_many(f"user-{i}" for i in range(10_000, 20_000))
+    merged = sized_filter.union(other_filter)
+    file_path = os.path.join(tempfile.gettempdir(), "bloom_filter.bin")
+    merged.save(file_path)
+    mapped = BloomFilter.load(file_path, mmap_mode="r")
+    print(mapped.contains("user-5"), mapped.contains("user-15000"))
+    print(f"оцінка FP після об'єднання = {mapped.false_positive_rate():.4f}")
+    mapped.close()
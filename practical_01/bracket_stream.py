@@ -0,0 +1,382 @@
+import io
+import os
+import re
+import sys
+import time
+from typing import NamedTuple, Optional
+
+OPENING = b"([{"
+CLOSING = b")]}"
+PAIRS = {close: open for open, close in zip(OPENING, CLOSING)}
+CLOSE_FOR = {open: chr(close) for open, close in zip(OPENING, CLOSING)}
+PAIR_TOKENS = [bytes([open, close]) for open, close in zip(OPENING, CLOSING)]
+BRACKET_RE = re.compile(rb"[()\[\]{}]")
+
+# Таблиця для bytes.translate: видаляє всі байти, крім дужок.
+# Так цикл на Python проходить лише по дужках, а не по кожному символу.
+NON_BRACKETS = bytes(b for b in range(256) if b not in OPENING + CLOSING)
+
+
+class BracketCheckResult(NamedTuple):
+    balanced: bool
+    offset: int  # зміщення в байтах першої помилки; -1, якщо все симетрично
+    found: Optional[str] = None  # зайва або невідповідна закриваюча дужка
+    expected: Optional[str] = None  # закриваюча дужка, яку очікували
+
+
+class SyntaxRules:
+    """
+    Правила, за якими пропускаються рядкові літерали та коментарі.
+
+    - `strings` — однобайтові символи, що відкривають і закривають рядок;
+    - `escape` — однобайтовий символ екранування всередині рядка (None — без
+      екранування, як у SQL, де лапка подвоюється: 'it''s');
+    - `line_comments` — початки однорядкових коментарів;
+    - `block_comments` — пари (початок, кінець) багаторядкових коментарів.
+
+    З правил будуються регулярні вирази, тож рядки й коментарі пропускаються
+    всередині рушія `re`, а не посимвольним циклом на Python.
+    """
+
+    def __init__(self, strings=(), escape=None, line_comments=(), block_comments=()):
+        self.strings = tuple(strings)
+        self.escape = escape
+        self.line_comments = tuple(line_comments)
+        self.block_comments = dict(block_comments)
+        e = re.escape
+        openers = list(self.strings) + list(self.line_comments) + list(self.block_comments)
+        self.openers = openers
+
+        def constructs(final):
+            """Повні (закриті) рядки та коментарі."""
+            patterns = []
+            for quote in self.strings:
+                if escape is not None:
+                    # "розгорнутий" цикл: [^"\\]*(?:\\.[^"\\]*)* — без зайвого відкату
+                    plain = b"[^" + e(quote) + e(escape) + b"]*"
+                    body = plain + b"(?:" + e(escape) + b"." + plain + b")*"
+                else:
+                    body = b"[^" + e(quote) + b"]*"
+                patterns.append(e(quote) + body + e(quote))
+            for start in self.line_comments:
+                patterns.append(e(start) + (rb"[^\n]*(?:\n|\Z)" if final else rb"[^\n]*\n"))
+            for start, end in self.block_comments.items():
+                patterns.append(e(start) + b".*?" + e(end))
+            return patterns
+
+        def tails(final):
+            """Незакритий рядок чи коментар до кінця буфера, а поки потік не
+            скінчився — ще й початок токена, розрізаний межею блоку."""
+            patterns = [e(token) + rb".*\Z" for token in openers]
+            if not final:
+                for token in openers:
+                    patterns += [e(token[:k]) + rb"\Z" for k in range(1, len(token))]
+            return b"(" + b"|".join(patterns) + b")"
+
+        def split_re(final):
+            return re.compile(b"|".join(constructs(final) + [tails(final)]), re.DOTALL)
+
+        # split() цими виразами вирізає всі рядки й коментарі всередині рушія re,
+        # а єдина захоплююча група повертає незакритий хвіст буфера
+        self.split_re = split_re(final=False)
+        self.final_split_re = split_re(final=True)
+        # рядки й коментарі або дужки — для точного пошуку місця помилки
+        self.token_re = re.compile(
+            b"|".join(constructs(final=True) + [BRACKET_RE.pattern]), re.DOTALL
+        )
+        # тіло рядка без закриваючої лапки — щоб продовжити рядок з нового блоку
+        if escape is not None:
+            self.string_bodies = {
+                quote: re.compile(
+                    b"[^" + e(quote) + e(escape) + b"]*(?:" + e(escape) + b".[^"
+                    + e(quote) + e(escape) + b"]*)*",
+                    re.DOTALL,
+                )
+                for quote in self.strings
+            }
+
+        # Один вид лапок і жодних коментарів (JSON): рядки вирізаються без
+        # regex — див. _split_quoted. Інакше — split() виразом split_re.
+        self.quote = None
+        if len(self.strings) == 1 and not (self.line_comments or self.block_comments):
+            self.quote = self.strings[0]
+            syntax = OPENING + CLOSING + self.quote + (escape or b"")
+            self.non_syntax = bytes(b for b in range(256) if b not in syntax)
+
+    def split_code(self, code: bytes, final: bool):
+        """
+        Розбирає текст поза рядком чи коментарем: повертає (дужки поза рядками
+        й коментарями, незакритий хвіст або обрізок токена в кінці `code`).
+        """
+        if self.quote is not None:
+            split = self._split_quoted(code)
+            if split is not None:
+                return split
+        parts = (self.final_split_re if final else self.split_re).split(code)
+        # parts = [текст, група, текст, група, ..., текст]; група не None лише
+        # для незакритого хвоста, і він завжди останній збіг
+        tail = parts[-2] if len(parts) >= 3 and parts[-2] is not None else b""
+        brackets = b"".join(parts[0::2]).translate(None, NON_BRACKETS)
+        return brackets, tail
+
+    def _split_quoted(self, code: bytes):
+        """
+        split_code для одного виду лапок без коментарів лише операціями над
+        bytes, що виконуються на C: без об'єкта на кожен рядковий літерал.
+
+        Подвоєний символ екранування видаляється, а екранована лапка
+        замінюється самотнім символом екранування — після цього жодна лапка
+        не екранована. Далі translate лишає тільки дужки, лапки й символ
+        екранування, і split по лапці дає ділянки поза рядками на парних
+        місцях. Екранування має сенс лише всередині рядка: якщо його символ
+        трапився поза рядками, повертається None, і блок розбирає split_re.
+        """
+        quote, escape = self.quote, self.escape
+        stripped = code
+        if escape is not None and escape in code:
+            stripped = stripped.replace(escape + escape, b"").replace(escape + quote, escape)
+        pieces = stripped.translate(None, self.non_syntax).split(quote)
+        brackets = b"".join(pieces[0::2])
+        if escape is not None and escape in brackets:
+            return None
+        if len(pieces) % 2:
+            return brackets, b""
+        # непарна кількість лапок: останній рядок не закрито, і він починається
+        # з останньої лапки, перед якою парна кількість символів екранування
+        index = len(code)
+        while True:
+            index = code.rfind(quote, 0, index)
+            run = 0
+            while escape is not None and code[index - run - 1 : index - run] == escape:
+                run += 1
+            if run % 2 == 0:
+                return brackets, code[index:]
+
+    def opener_of(self, tail: bytes):
+        """Токен, яким починається незакритий хвіст, або None для обрізка токена."""
+        return max((token for token in self.openers if tail.startswith(token)), key=len, default=None)
+
+    def resume(self, opener: bytes, data: bytes, pos: int):
+        """
+        Продовжує з позиції `pos` рядок чи коментар, відкритий токеном `opener`.
+
+        Повертає (закрито, індекс): індекс одразу після кінця конструкції або,
+        якщо вона не закрилась, початок байтів, що переносяться в наступний
+        блок, — це лише обрізок кінцевого токена чи незавершене екранування.
+        """
+        if opener in self.block_comments:
+            end = self.block_comments[opener]
+            index = data.find(end, pos)
+            if index == -1:
+                return False, max(pos, len(data) - len(end) + 1)
+            return True, index + len(end)
+        if opener in self.line_comments:
+            index = data.find(b"\n", pos)
+            return (False, len(data)) if index == -1 else (True, index + 1)
+        if self.escape is None:
+            index = data.find(opener, pos)
+            return (False, len(data)) if index == -1 else (True, index + 1)
+        # тіло зупиняється на лапці, на кінці даних або перед самотнім символом екранування
+        index = self.string_bodies[opener].match(data, pos).end()
+        if data[index : index + 1] == opener:
+            return True, index + 1
+        return False, index
+
+    def is_trivial(self) -> bool:
+        return not (self.strings or self.line_comments or self.block_comments)
+
+
+JSON_RULES = SyntaxRules(strings=(b'"',), escape=b"\\")
+SQL_RULES = SyntaxRules(
+    strings=(b"'", b'"'), line_comments=(b"--",), block_comments=((b"/*", b"*/"),)
+)
+PYTHON_RULES = SyntaxRules(strings=(b"'", b'"'), escape=b"\\", line_comments=(b"#",))
+
+
+def iter_chunks(source, chunk_size: int = 1 << 20):
+    """Видає блоки байтів зі шляху до файлу, файлового об'єкта або ітератора блоків."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield from iter_chunks(file, chunk_size)
+        return
+    if isinstance(source, (bytes, bytearray)):
+        yield bytes(source)
+        return
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+    for chunk in source:
+        yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+
+
+def _mismatch(stack, close, offset) -> BracketCheckResult:
+    expected = CLOSE_FOR[stack[-1]] if stack else None
+    return BracketCheckResult(False, offset, chr(close), expected)
+
+
+def _scan_exact(chunk, stack, base):
+    """Посимвольна перевірка блоку; повертає помилку з точним зміщенням або None."""
+    for match in BRACKET_RE.finditer(chunk):
+        char = chunk[match.start()]
+        if char in PAIRS:
+            if not stack or stack[-1] != PAIRS[char]:
+                return _mismatch(stack, char, base + match.start())
+            stack.pop()
+        else:
+            stack.append(char)
+    return None
+
+
+def _reduce(brackets: bytes):
+    """Видаляє пари "()", "[]", "{}" силами bytes.replace, поки це вдається.
+
+    Повертає None, якщо вкладеність надто глибока і скорочення йде повільно.
+    """
+    while True:
+        shorter = brackets
+        for token in PAIR_TOKENS:
+            shorter = shorter.replace(token, b"")
+        if len(shorter) == len(brackets):
+            return brackets
+        if len(brackets) - len(shorter) < len(brackets) // 8:
+            return None
+        brackets = shorter
+
+
+def _check_plain(chunks):
+    stack = bytearray()
+    base = 0
+    for chunk in chunks:
+        start_stack = bytearray(stack)
+        if not _apply_reduced(chunk, stack):
+            # є помилка (або глибока вкладеність) — перевіряємо блок посимвольно
+            stack = start_stack
+            error = _scan_exact(chunk, stack, base)
+            if error:
+                return error
+        base += len(chunk)
+    if stack:
+        return BracketCheckResult(False, base, None, CLOSE_FOR[stack[-1]])
+    return BracketCheckResult(True, -1)
+
+
+def _apply_reduced(chunk, stack) -> bool:
+    """Швидко застосовує блок до стеку; False — потрібна точна перевірка."""
+    reduced = _reduce(chunk.translate(None, NON_BRACKETS))
+    if reduced is None:
+        return False
+    # після скорочення коректний блок має вигляд ")]}...([{" :
+    # спершу закриваючі дужки для стеку, далі — нові відкриваючі
+    openers = reduced.lstrip(CLOSING)
+    closers = reduced[: len(reduced) - len(openers)]
+    if len(closers) > len(stack) or openers.translate(None, CLOSING) != openers:
+        return False
+    for char in closers:
+        if stack.pop() != PAIRS[char]:
+            return False
+    stack += openers
+    return True
+
+
+def _scan_rules_exact(prefix, stack, base, rules: SyntaxRules):
+    """Точна перевірка префікса з рядками й коментарями; повертає помилку або None."""
+    for match in rules.token_re.finditer(prefix):
+        if match.end() - match.start() != 1:
+            continue  # рядок або коментар
+        char = prefix[match.start()]
+        if char in PAIRS:
+            if not stack or stack[-1] != PAIRS[char]:
+                return _mismatch(stack, char, base + match.start())
+            stack.pop()
+        elif char in OPENING:
+            stack.append(char)
+    return None
+
+
+def _check_with_rules(chunks, rules: SyntaxRules):
+    stack = bytearray()
+    base = 0  # зміщення початку буфера у потоці
+    # Між блоками переноситься стан лексера (токен, яким відкрито незакритий
+    # рядок чи коментар, або None), а не сирий текст: у буфері лишається хіба
+    # що обрізок токена, тож довгий літерал не перечитується з кожним блоком.
+    state = None
+    buffer = b""
+    chunks = iter(chunks)
+    final = False
+    while not final:
+        chunk = next(chunks, None)
+        final = chunk is None
+        buffer += chunk or b""
+        pos = 0
+        while True:
+            if state is not None:
+                closed, pos = rules.resume(state, buffer, pos)
+                if not closed:
+                    break
+                state = None
+            code = buffer[pos:]
+            brackets, tail = rules.split_code(code, final)
+            end = len(code) - len(tail)
+            start_stack = bytearray(stack)
+            if not _apply_reduced(brackets, stack):
+                stack = start_stack
+                error = _scan_rules_exact(code[:end], stack, base + pos, rules)
+                if error:
+                    return error
+            pos += end
+            state = rules.opener_of(tail) if tail else None
+            if state is None:
+                # кінець буфера або обрізок токена, що доповниться наступним блоком
+                break
+            pos += len(state)
+        base += pos
+        buffer = buffer[pos:]
+    # наприкінці потоку незакритий рядок чи коментар просто пропускаємо
+    base += len(buffer)
+    if stack:
+        return BracketCheckResult(False, base, None, CLOSE_FOR[stack[-1]])
+    return BracketCheckResult(True, -1)
+
+
+def check_brackets_stream(source, rules: Optional[SyntaxRules] = None, chunk_size: int = 1 << 20):
+    """
+    Потокова перевірка симетричності дужок у великому файлі.
+
+    `source` — шлях до файлу, файловий об'єкт або ітератор блоків bytes/str.
+    Рядкові літерали та коментарі пропускаються згідно з `rules`
+    (див. JSON_RULES, SQL_RULES, PYTHON_RULES). Повертає BracketCheckResult
+    зі зміщенням у байтах першої невідповідної закриваючої дужки; якщо ж
+    потік закінчився з незакритими дужками — зі зміщенням кінця потоку.
+    """
+    chunks = iter_chunks(source, chunk_size)
+    if rules is None or rules.is_trivial():
+        return _check_plain(chunks)
+    return _check_with_rules(chunks, rules)
+
+
+if __name__ == "__main__":
+    examples = ["( ){[ 1 ]( 1 + 3 )( ){ }}", "( 23 ( 2 - 3);", "( 11 }", "([()])"]
+    for example in examples:
+        print(f"{example}: {check_brackets_stream(example.encode())}")
+
+    print(check_brackets_stream(b'{"text": "smile :) ]", "list": [1, 2, {"a": 3}]}', JSON_RULES))
+    print(check_brackets_stream(b"SELECT f('(') -- )\nFROM t WHERE (a = ']'", SQL_RULES))
+
+    # JSON, щільний на рядки з дужками та екрануванням усередині
+    record = b'{"id": 1, "name": "user (1)", "tags": ["a]b", "c\\\\\\"d", "e{f"], "note": "lorem ipsum"}'
+    data = b"[" + b", ".join([record] * 400_000) + b"]"
+    start = time.perf_counter()
+    result = check_brackets_stream(io.BytesIO(data), JSON_RULES)
+    elapsed = time.perf_counter() - start
+    print(f"JSON, {len(data) / 1e6:.1f} МБ: {result}, {len(data) / 1e6 / elapsed:.1f} МБ/с")
+
+    file_path = sys.argv[1] if len(sys.argv) > 1 else None
+    if file_path:
+        start = time.perf_counter()
+        result = check_brackets_stream(file_path, JSON_RULES)
+        elapsed = time.perf_counter() - start
+        size_mb = os.path.getsize(file_path) / 1e6
+        print(f"{file_path}: {result}, {size_mb / elapsed:.1f} МБ/с")
@@ -0,0 +1,77 @@
+import random
+import sys
+import time
+
+from cache_policies import ARCCache, TwoQueueCache, WTinyLFUCache
+from lru import LRUCache
+from lru_array import ArrayLRUCache
+
+
+def zipf_trace(num_keys: int, length: int, s: float = 1.0, seed: int = 42):
+    """Потік ключів з розподілом Ципфа: ключ рангу r має вагу 1 / r^s."""
+    rng = random.Random(seed)
+    cum_weights = []
+    total = 0.0
+    for rank in range(1, num_keys + 1):
+        total += 1 / rank**s
+        cum_weights.append(total)
+    keys = list(range(num_keys))
+    rng.shuffle(keys)
+    return rng.choices(keys, cum_weights=cum_weights, k=length)
+
+
+def scan_trace(num_keys: int, length: int, scan_length: int, period: int, seed: int = 42):
+    """Ципфівський потік, у який кожні `period` звернень вставлено сканування
+    `scan_length` нових ключів, що більше ніколи не повторюються."""
+    hot = zipf_trace(num_keys, length, seed=seed)
+    trace = []
+    next_scan_key = num_keys
+    for start in range(0, length, period):
+        trace.extend(hot[start : start + period])
+        trace.extend(range(next_scan_key, next_scan_key + scan_length))
+        next_scan_key += scan_length
+    return trace
+
+
+def read_trace(file_path):
+    """Трасу можна передати файлом: один ключ на рядок."""
+    with open(file_path, "r", encoding="utf-8") as file:
+        return [line.strip() for line in file if line.strip()]
+
+
+def replay(cache, trace):
+    """Програє трасу як типовий read-through кеш: get, а при промаху — put."""
+    hits = 0
+    start = time.perf_counter()
+    for key in trace:
+        if cache.get(key) == -1:
+            cache.put(key, key)
+        else:
+            hits += 1
+    elapsed = time.perf_counter() - start
+    return hits / len(trace), len(trace) / elapsed
+
+
+if __name__ == "__main__":
+    capacity = 1_000
+    policies = [LRUCache, ArrayLRUCache, TwoQueueCache, ARCCache, WTinyLFUCache]
+
+    if len(sys.argv) > 1:
+        traces = {sys.argv[1]: read_trace(sys.argv[1])}
+    else:
+        traces = {
+            "Zipf": zipf_trace(num_keys=50_000, length=300_000),
+            "Zipf + скани": scan_trace(
+                num_keys=50_000, length=300_000, scan_length=5_000, period=20_000
+            ),
+        }
+
+    print(f"{'Траса':<15} | {'Політика':<15} | {'Влучання':<10} | {'Операцій/сек':<15}")
+    print("-" * 64)
+    for trace_name, trace in traces.items():
+        for cache_class in policies:
+            hit_ratio, ops_per_sec = replay(cache_class(capacity), trace)
+            print(
+                f"{trace_name:<15} | {cache_class.__name__:<15} | "
+                f"{hit_ratio:<10.2%} | {ops_per_sec:<15,.0f}"
+            )
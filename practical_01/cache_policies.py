@@ -0,0 +1,335 @@
+from array import array
+
+from lru import DoublyLinkedList
+
+
+class LRUList:
+    """
+    Упорядкований набір ключів на основі DoublyLinkedList з lru.py.
+
+    Голова списку — найсвіжіший запис (MRU), хвіст — найстаріший (LRU).
+    Використовується як будівельний блок для складніших політик витіснення.
+    """
+
+    def __init__(self):
+        self.nodes = {}
+        self.list = DoublyLinkedList()
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, key) -> bool:
+        return key in self.nodes
+
+    def push(self, key, value=None) -> None:
+        self.nodes[key] = self.list.push(key, value)
+
+    def touch(self, key) -> None:
+        self.list.move_to_front(self.nodes[key])
+
+    def value(self, key):
+        return self.nodes[key].data[1]
+
+    def set(self, key, value) -> None:
+        self.nodes[key].data = (key, value)
+
+    def pop(self, key):
+        node = self.nodes.pop(key)
+        self.list.remove(node)
+        return node.data[1]
+
+    def pop_lru(self):
+        node = self.list.remove_last()
+        del self.nodes[node.data[0]]
+        return node.data
+
+    def lru_key(self):
+        return self.list.tail.data[0]
+
+
+class TwoQueueCache:
+    """
+    Політика 2Q (Johnson, Shasha).
+
+    Нові ключі спершу потрапляють у FIFO-чергу `a1_in`. Витіснені з неї ключі
+    запам'ятовуються без значень у "примарній" черзі `a1_out`, і лише повторне
+    звернення до такого ключа переносить його в основний LRU-список `am`.
+    Тому одноразове послідовне сканування не витісняє гарячі ключі з `am`.
+    """
+
+    def __init__(self, capacity: int, in_ratio: float = 0.25, out_ratio: float = 0.5):
+        self.capacity = capacity
+        self.k_in = max(1, int(capacity * in_ratio))
+        self.k_out = max(1, int(capacity * out_ratio))
+        self.a1_in = LRUList()
+        self.a1_out = LRUList()
+        self.am = LRUList()
+
+    def __len__(self) -> int:
+        return len(self.a1_in) + len(self.am)
+
+    def __contains__(self, key) -> bool:
+        return key in self.am or key in self.a1_in
+
+    def get(self, key: int) -> int:
+        if key in self.am:
+            self.am.touch(key)
+            return self.am.value(key)
+        if key in self.a1_in:
+            # у FIFO-черзі порядок не змінюємо
+            return self.a1_in.value(key)
+        return -1
+
+    def _reclaim(self) -> None:
+        if len(self) < self.capacity:
+            return
+        if len(self.a1_in) > self.k_in or not self.am:
+            key, _ = self.a1_in.pop_lru()
+            self.a1_out.push(key)
+            if len(self.a1_out) > self.k_out:
+                self.a1_out.pop_lru()
+        else:
+            self.am.pop_lru()
+
+    def put(self, key: int, value: int) -> None:
+        if self.capacity <= 0:
+            return
+        if key in self.am:
+            self.am.set(key, value)
+            self.am.touch(key)
+        elif key in self.a1_in:
+            self.a1_in.set(key, value)
+        elif key in self.a1_out:
+            self.a1_out.pop(key)
+            self._reclaim()
+            self.am.push(key, value)
+        else:
+            self._reclaim()
+            self.a1_in.push(key, value)
+
+
+class ARCCache:
+    """
+    Adaptive Replacement Cache (Megiddo, Modha).
+
+    `t1` — ключі, до яких звертались один раз, `t2` — щонайменше двічі.
+    `b1`/`b2` — примарні списки ключів, нещодавно витіснених з `t1`/`t2`.
+    Влучання в примарний список зсуває цільовий розмір `p` частини `t1`,
+    тож кеш сам підлаштовується між "свіжістю" та "частотою".
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.p = 0
+        self.t1 = LRUList()
+        self.t2 = LRUList()
+        self.b1 = LRUList()
+        self.b2 = LRUList()
+
+    def __len__(self) -> int:
+        return len(self.t1) + len(self.t2)
+
+    def __contains__(self, key) -> bool:
+        return key in self.t1 or key in self.t2
+
+    def get(self, key: int) -> int:
+        if key in self.t1:
+            value = self.t1.pop(key)
+            self.t2.push(key, value)
+            return value
+        if key in self.t2:
+            self.t2.touch(key)
+            return self.t2.value(key)
+        return -1
+
+    def _replace(self, in_b2: bool) -> None:
+        if len(self) < self.capacity:
+            return
+        if self.t1 and (len(self.t1) > self.p or (in_b2 and len(self.t1) == self.p)):
+            key, _ = self.t1.pop_lru()
+            self.b1.push(key)
+        else:
+            key, _ = self.t2.pop_lru()
+            self.b2.push(key)
+
+    def put(self, key: int, value: int) -> None:
+        c = self.capacity
+        if c <= 0:
+            return
+        if key in self.t1 or key in self.t2:
+            self.get(key)
+            self.t2.set(key, value)
+        elif key in self.b1:
+            self.p = min(c, self.p + max(len(self.b2) // len(self.b1), 1))
+            self._replace(False)
+            self.b1.pop(key)
+            self.t2.push(key, value)
+        elif key in self.b2:
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            self._replace(True)
+            self.b2.pop(key)
+            self.t2.push(key, value)
+        else:
+            l1 = len(self.t1) + len(self.b1)
+            total = l1 + len(self.t2) + len(self.b2)
+            if l1 >= c:
+                if len(self.t1) < c:
+                    self.b1.pop_lru()
+                    self._replace(False)
+                else:
+                    self.t1.pop_lru()
+            elif total >= c:
+                if total >= 2 * c:
+                    self.b2.pop_lru()
+                self._replace(False)
+            self.t1.push(key, value)
+
+
+class CountMinSketch:
+    """
+    Count-min sketch для оцінки частоти ключів.
+
+    `depth` рядків по `width` лічильників; оцінка частоти — мінімум по рядках.
+    Після `sample_size` інкрементів усі лічильники діляться навпіл ("старіння"),
+    щоб давно популярні ключі поступово втрачали вагу. Лічильники зберігаються
+    в байтах, але, як 4-бітні лічильники TinyLFU, насичуються на 15.
+    """
+
+    MAX_COUNT = 15
+
+    def __init__(self, width: int, depth: int = 4, sample_size=None):
+        size = 1
+        while size < width:
+            size <<= 1
+        self.width = size
+        self.mask = size - 1
+        self.depth = depth
+        self.rows = [array("B", bytes(size)) for _ in range(depth)]
+        self.sample_size = sample_size or 10 * size
+        self.additions = 0
+
+    def _hashes(self, key):
+        # перемішуємо хеш, бо hash(i) == i для малих цілих
+        h = (hash(key) * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        return h & 0xFFFFFFFF, (h >> 32) | 1
+
+    def increment(self, key) -> None:
+        h1, h2 = self._hashes(key)
+        mask = self.mask
+        for row in self.rows:
+            index = h1 & mask
+            if row[index] < self.MAX_COUNT:
+                row[index] += 1
+            h1 += h2
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key) -> int:
+        h1, h2 = self._hashes(key)
+        mask = self.mask
+        result = self.MAX_COUNT
+        for row in self.rows:
+            count = row[h1 & mask]
+            if count < result:
+                result = count
+            h1 += h2
+        return result
+
+    def _age(self) -> None:
+        for i, row in enumerate(self.rows):
+            self.rows[i] = array("B", (count >> 1 for count in row))
+        self.additions //= 2
+
+
+class WTinyLFUCache:
+    """
+    W-TinyLFU (як у бібліотеці Caffeine).
+
+    Нові ключі потрапляють у маленьке LRU-"вікно" (~1% місткості). Ключ,
+    витіснений з вікна, стає кандидатом до основної частини (сегментований LRU:
+    `probation` + `protected`) і допускається туди лише тоді, коли фільтр
+    TinyLFU (count-min sketch) оцінює його частоту вище за частоту жертви.
+    Частота рахується на кожному `get`, включно з промахами.
+    """
+
+    def __init__(self, capacity: int, window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        self.capacity = capacity
+        self.window_capacity = max(1, int(capacity * window_ratio))
+        self.main_capacity = max(0, capacity - self.window_capacity)
+        self.protected_capacity = int(self.main_capacity * protected_ratio)
+        self.window = LRUList()
+        self.probation = LRUList()
+        self.protected = LRUList()
+        self.sketch = CountMinSketch(max(16, capacity))
+
+    def __len__(self) -> int:
+        return len(self.window) + len(self.probation) + len(self.protected)
+
+    def __contains__(self, key) -> bool:
+        return key in self.window or key in self.probation or key in self.protected
+
+    def _hit(self, key):
+        if key in self.window:
+            self.window.touch(key)
+            return self.window.value(key)
+        if key in self.protected:
+            self.protected.touch(key)
+            return self.protected.value(key)
+        # повторне звернення переводить ключ з probation у protected
+        value = self.probation.pop(key)
+        self.protected.push(key, value)
+        if len(self.protected) > self.protected_capacity:
+            demoted_key, demoted_value = self.protected.pop_lru()
+            self.probation.push(demoted_key, demoted_value)
+        return value
+
+    def get(self, key: int) -> int:
+        self.sketch.increment(key)
+        if key not in self:
+            return -1
+        return self._hit(key)
+
+    def _admit(self, key, value) -> None:
+        if len(self.probation) + len(self.protected) < self.main_capacity:
+            self.probation.push(key, value)
+            return
+        if self.main_capacity == 0:
+            return
+        victims = self.probation if self.probation else self.protected
+        victim = victims.lru_key()
+        if self.sketch.estimate(key) > self.sketch.estimate(victim):
+            victims.pop(victim)
+            self.probation.push(key, value)
+
+    def put(self, key: int, value: int) -> None:
+        if self.capacity <= 0:
+            return
+        if key in self:
+            self._hit(key)
+            for segment in (self.window, self.probation, self.protected):
+                if key in segment:
+                    segment.set(key, value)
+                    break
+            return
+        self.window.push(key, value)
+        if len(self.window) > self.window_capacity:
+            candidate, candidate_value = self.window.pop_lru()
+            self._admit(candidate, candidate_value)
+
+
+if __name__ == "__main__":
+    for cache_class in [TwoQueueCache, ARCCache, WTinyLFUCache]:
+        cache = cache_class(8)
+        hot = ["Банан", "Груша"]
+        for round in range(5):
+            # гарячі ключі чергуються з разовими зверненнями
+            for key in hot + [f"шум-{round}-{i}" for i in range(4)]:
+                if cache.get(key) == -1:
+                    cache.put(key, key.upper())
+        # послідовне сканування одноразових ключів
+        for i in range(20):
+            if cache.get(f"скан-{i}") == -1:
+                cache.put(f"скан-{i}", i)
+        survived = [fruit for fruit in hot if fruit in cache]
+        print(f"{cache_class.__name__:<15} після сканування лишились: {survived}")
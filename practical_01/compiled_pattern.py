@@ -0,0 +1,296 @@
+import timeit
+from abc import ABC, abstractmethod
+
+from text_search import read_file
+
+
+class CompiledPattern(ABC):
+    """
+    Попередньо оброблений підрядок для багаторазового пошуку, як re.compile.
+
+    Таблиці зсувів будуються один раз у конструкторі, а не при кожному
+    виклику пошуку. Працює з str та bytes (тип тексту має збігатися з типом
+    підрядка). find_all та count враховують і входження, що перекриваються.
+    """
+
+    def __init__(self, pattern):
+        if isinstance(pattern, (bytearray, memoryview)):
+            pattern = bytes(pattern)
+        if not isinstance(pattern, (str, bytes)):
+            raise TypeError(f"очікується str або bytes, отримано {type(pattern).__name__}")
+        self.pattern = pattern
+
+    def _check(self, text, start, end):
+        if isinstance(text, str) != isinstance(self.pattern, str):
+            raise TypeError(
+                f"тип тексту {type(text).__name__} не відповідає підрядку "
+                f"{type(self.pattern).__name__}"
+            )
+        n = len(text) if end is None else min(end, len(text))
+        return max(start, 0), n
+
+    @abstractmethod
+    def _iter_positions(self, text, start: int, n: int):
+        """Генератор позицій входжень непорожнього підрядка в text[start:n]."""
+
+    def finditer(self, text, start: int = 0, end=None):
+        start, n = self._check(text, start, end)
+        if not self.pattern:
+            return iter(range(start, n + 1))
+        return self._iter_positions(text, start, n)
+
+    def find(self, text, start: int = 0, end=None) -> int:
+        return next(self.finditer(text, start, end), -1)
+
+    def find_all(self, text, start: int = 0, end=None) -> list:
+        return list(self.finditer(text, start, end))
+
+    def count(self, text, start: int = 0, end=None) -> int:
+        return sum(1 for _ in self.finditer(text, start, end))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.pattern!r})"
+
+
+class HorspoolPattern(CompiledPattern):
+    """Боєр–Мур–Хорспул: лише таблиця поганого символу за останнім символом вікна."""
+
+    def __init__(self, pattern):
+        super().__init__(pattern)
+        m = len(self.pattern)
+        self.shift_table = {char: m - index - 1 for index, char in enumerate(self.pattern[:-1])}
+
+    def _iter_positions(self, text, start, n):
+        pattern = self.pattern
+        m = len(pattern)
+        shift_table = self.shift_table
+        last = n - m
+        i = start
+        while i <= last:
+            j = m - 1
+            while j >= 0 and text[i + j] == pattern[j]:
+                j -= 1
+            if j < 0:
+                yield i
+            i += shift_table.get(text[i + m - 1], m)
+
+
+class BoyerMoorePattern(CompiledPattern):
+    """
+    Повний алгоритм Боєра–Мура: правило поганого символу та правило
+    хорошого суфікса; береться більший з двох зсувів.
+    """
+
+    def __init__(self, pattern):
+        super().__init__(pattern)
+        # остання позиція кожного символу в підрядку
+        self.last_occurrence = {char: index for index, char in enumerate(self.pattern)}
+        self.good_suffix = self._build_good_suffix(self.pattern)
+
+    @staticmethod
+    def _build_good_suffix(pattern) -> list:
+        """good_suffix[j] — зсув, якщо суфікс pattern[j:] збігся, а pattern[j - 1] ні."""
+        m = len(pattern)
+        shift = [0] * (m + 1)
+        border = [0] * (m + 1)  # border[i] — початок найширшої межі суфікса pattern[i:]
+        i, j = m, m + 1
+        border[i] = j
+        while i > 0:
+            while j <= m and pattern[i - 1] != pattern[j - 1]:
+                if shift[j] == 0:
+                    shift[j] = j - i
+                j = border[j]
+            i -= 1
+            j -= 1
+            border[i] = j
+        # суфікси, що не трапляються більше ніде, — зсув до найширшої межі всього підрядка
+        j = border[0]
+        for i in range(m + 1):
+            if shift[i] == 0:
+                shift[i] = j
+            if i == j:
+                j = border[j]
+        return shift
+
+    def _iter_positions(self, text, start, n):
+        pattern = self.pattern
+        m = len(pattern)
+        last_occurrence = self.last_occurrence
+        good_suffix = self.good_suffix
+        last = n - m
+        i = start
+        while i <= last:
+            j = m - 1
+            while j >= 0 and text[i + j] == pattern[j]:
+                j -= 1
+            if j < 0:
+                yield i
+                i += good_suffix[0]
+            else:
+                bad_char_shift = j - last_occurrence.get(text[i + j], -1)
+                i += max(good_suffix[j + 1], bad_char_shift)
+
+
+class SundayPattern(CompiledPattern):
+    """Сандей (Quick Search): зсув за символом, що йде одразу після вікна."""
+
+    def __init__(self, pattern):
+        super().__init__(pattern)
+        m = len(self.pattern)
+        self.shift_table = {char: m - index for index, char in enumerate(self.pattern)}
+
+    def _iter_positions(self, text, start, n):
+        pattern = self.pattern
+        m = len(pattern)
+        shift_table = self.shift_table
+        last = n - m
+        i = start
+        while i <= last:
+            j = 0
+            while j < m and text[i + j] == pattern[j]:
+                j += 1
+            if j == m:
+                yield i
+            if i == last:
+                return
+            i += shift_table.get(text[i + m], m + 1)
+
+
+class TwoWayPattern(CompiledPattern):
+    """
+    Двосторонній алгоритм Крошмора–Перрена (на ньому побудовано str.find у CPython).
+
+    Підрядок ділиться в критичній точці на ліву та праву частини; права
+    порівнюється зліва направо, ліва — справа наліво. Потрібна лише O(1)
+    додаткової пам'яті, а час пошуку лінійний у найгіршому випадку.
+    """
+
+    def __init__(self, pattern):
+        super().__init__(pattern)
+        pattern = self.pattern
+        m = len(pattern)
+        ell_less, period_less = self._maximal_suffix(pattern, reverse=False)
+        ell_greater, period_greater = self._maximal_suffix(pattern, reverse=True)
+        if ell_less > ell_greater:
+            self.ell, self.period = ell_less, period_less
+        else:
+            self.ell, self.period = ell_greater, period_greater
+        ell = self.ell
+        self.periodic = pattern[: ell + 1] == pattern[self.period : self.period + ell + 1]
+        if not self.periodic:
+            self.period = max(ell + 1, m - ell - 1) + 1
+
+    @staticmethod
+    def _maximal_suffix(pattern, reverse: bool):
+        """Початок (мінус один) максимального суфікса та його період."""
+        m = len(pattern)
+        ms, j, k, period = -1, 0, 1, 1
+        while j + k < m:
+            a, b = pattern[j + k], pattern[ms + k]
+            if (a > b) if reverse else (a < b):
+                j += k
+                k = 1
+                period = j - ms
+            elif a == b:
+                if k != period:
+                    k += 1
+                else:
+                    j += period
+                    k = 1
+            else:
+                ms, j, k, period = j, j + 1, 1, 1
+        return ms, period
+
+    def _iter_positions(self, text, start, n):
+        pattern = self.pattern
+        m = len(pattern)
+        ell, period = self.ell, self.period
+        last = n - m
+        j = start
+        if self.periodic:
+            # memory — скільки символів префікса вже точно збігається після зсуву на період
+            memory = -1
+            while j <= last:
+                i = max(ell, memory) + 1
+                while i < m and pattern[i] == text[i + j]:
+                    i += 1
+                if i >= m:
+                    i = ell
+                    while i > memory and pattern[i] == text[i + j]:
+                        i -= 1
+                    if i <= memory:
+                        yield j
+                    j += period
+                    memory = m - period - 1
+                else:
+                    j += i - ell
+                    memory = -1
+        else:
+            while j <= last:
+                i = ell + 1
+                while i < m and pattern[i] == text[i + j]:
+                    i += 1
+                if i >= m:
+                    i = ell
+                    while i >= 0 and pattern[i] == text[i + j]:
+                        i -= 1
+                    if i < 0:
+                        yield j
+                    j += period
+                else:
+                    j += i - ell
+
+
+ALGORITHMS = {
+    "boyer_moore": BoyerMoorePattern,
+    "horspool": HorspoolPattern,
+    "sunday": SundayPattern,
+    "two_way": TwoWayPattern,
+}
+
+
+def compile_pattern(pattern, algorithm: str = "boyer_moore") -> CompiledPattern:
+    try:
+        return ALGORITHMS[algorithm](pattern)
+    except KeyError:
+        raise ValueError(f"невідомий алгоритм: {algorithm}") from None
+
+
+def builtin_find_all(text, pattern) -> list:
+    """Еталон: повторні виклики str.find (алгоритм two-way на C у CPython)."""
+    positions = []
+    i = text.find(pattern)
+    while i != -1:
+        positions.append(i)
+        i = text.find(pattern, i + 1)
+    return positions
+
+
+if __name__ == "__main__":
+    compiled = compile_pattern("ABAB")
+    print(compiled, compiled.find_all("ABABABCABAB"), compiled.count("ABABAB"))
+    print(compile_pattern(b"ab", "two_way").find_all(b"xabab"))
+
+    texts = {name: read_file(f"{name}.txt") for name in ["стаття 1", "стаття 2"]}
+    texts["обидві x4"] = (texts["стаття 1"] + texts["стаття 2"]) * 4
+    patterns = ["реалізація методів", "Буратіно дурачок", "алгоритм", "та"]
+
+    print(f"{'Текст':<10} | {'Підрядок':<20} | {'Збігів':<6} | " + " | ".join(f"{a:<11}" for a in [*ALGORITHMS, "str.find"]))
+    print("-" * 114)
+    for text_name, text in texts.items():
+        encoded = text.encode("cp1251")
+        for pattern in patterns:
+            cells = []
+            expected = None
+            for algorithm in ALGORITHMS:
+                compiled = compile_pattern(pattern, algorithm)
+                positions = compiled.find_all(text)
+                assert expected is None or positions == expected
+                # на bytes позиції ті самі, бо cp1251 — однобайтове кодування
+                assert compile_pattern(pattern.encode("cp1251"), algorithm).find_all(encoded) == positions
+                expected = positions
+                cells.append(timeit.timeit(lambda: compiled.find_all(text), number=5))
+            assert builtin_find_all(text, pattern) == expected
+            cells.append(timeit.timeit(lambda: builtin_find_all(text, pattern), number=5))
+            row = " | ".join(f"{elapsed:<11.6f}" for elapsed in cells)
+            print(f"{text_name:<10} | {pattern:<20} | {len(expected):<6} | {row}")
@@ -0,0 +1,162 @@
+import mmh3
+
+from bloom_filter import CHUNK_SIZE, MASK_64, BloomFilter, as_keys
+
+
+def _saturating_add(a: int, b: int, ones: int) -> int:
+    """Побайтова сума лічильників з насиченням на 15."""
+    total = a + b  # у кожному байті не більше 30, переносу в сусідній немає
+    overflow = total & ones << 4
+    # байти, де сума досягла 16, заповнюються до 0x0F
+    return (total | (overflow - (overflow >> 4))) & ones * 0xF
+
+
+def _minimum(a: int, b: int, ones: int) -> int:
+    """Побайтовий мінімум лічильників."""
+    top = ones << 4
+    # у кожному байті (a + 16 - b) >= 1, а біт 4 встановлено, коли a >= b
+    a_not_less = ((a | top) - b) & top
+    take_b = a_not_less - (a_not_less >> 4)
+    return (b & take_b) | (a & ~take_b)
+
+
+class CountingBloomFilter(BloomFilter):
+    """
+    Фільтр Блума з лічильниками замість бітів, що дозволяє видаляти елементи.
+
+    Кожна позиція — 4-бітний лічильник, два лічильники в одному байті.
+    Лічильник, що досяг 15, "залипає": його більше не зменшують, інакше
+    після переповнення видалення могло б дати хибно-негативний результат.
+    """
+
+    MAX_COUNT = 15
+    FILE_MAGIC = b"CBF1"
+    STORAGE = "counters"
+
+    def __init__(self, size: int, num_hashes: int):
+        super().__init__(size, num_hashes)
+        self.bit_array = None
+        self.counters = bytearray((size + 1) // 2)
+
+    @staticmethod
+    def _storage_bytes(size: int) -> int:
+        return (size + 1) // 2
+
+    def _get(self, index: int) -> int:
+        return (self.counters[index >> 1] >> ((index & 1) << 2)) & 0xF
+
+    def _set(self, index: int, value: int) -> None:
+        shift = (index & 1) << 2
+        byte = self.counters[index >> 1]
+        self.counters[index >> 1] = (byte & ~(0xF << shift)) | (value << shift)
+
+    def add(self, item: str):
+        for index in self._indexes(item):
+            count = self._get(index)
+            if count == 0:
+                self.bits_set += 1
+            if count < self.MAX_COUNT:
+                self._set(index, count + 1)
+        self.count += 1
+
+    def contains(self, item: str):
+        for index in self._indexes(item):
+            if self._get(index) == 0:
+                return False
+        return True
+
+    def remove(self, item: str) -> bool:
+        """Видаляє елемент; повертає False, якщо його точно немає у фільтрі."""
+        indexes = self._indexes(item)
+        if any(self._get(index) == 0 for index in indexes):
+            return False
+        for index in indexes:
+            count = self._get(index)
+            if count < self.MAX_COUNT:
+                self._set(index, count - 1)
+                if count == 1:
+                    self.bits_set -= 1
+        self.count -= 1
+        return True
+
+    def add_many(self, items):
+        for item in as_keys(items):
+            self.add(item)
+
+    def contains_many(self, items) -> list:
+        counters = self.counters
+        size = self.size
+        num_hashes = self.num_hashes
+        hash128 = mmh3.hash128
+        result = []
+        for item in as_keys(items):
+            digest = hash128(item)
+            index = (digest & MASK_64) % size
+            step = (digest >> 64) % size
+            found = True
+            for _ in range(num_hashes):
+                if not (counters[index >> 1] >> ((index & 1) << 2)) & 0xF:
+                    found = False
+                    break
+                index += step
+                if index >= size:
+                    index -= size
+            result.append(found)
+        return result
+
+    def remove_many(self, items) -> list:
+        return [self.remove(item) for item in as_keys(items)]
+
+    def _combine(self, other: "CountingBloomFilter", operation) -> "CountingBloomFilter":
+        """
+        Поєднує лічильники блоками по CHUNK_SIZE байтів як великі цілі числа.
+
+        Молодші та старші 4-бітні лічильники розкладаються в окремі числа, де
+        кожен байт — один лічильник 0..15. `operation(a, b, ones)` (ones — 0x01
+        у кожному байті) обробляє всі байти одразу, без переносів між ними.
+        """
+        self._check_compatible(other)
+        result = CountingBloomFilter(self.size, self.num_hashes)
+        result.capacity = self.capacity
+        result.target_fp_rate = self.target_fp_rate
+        bits_set = 0
+        for start in range(0, len(self.counters), CHUNK_SIZE):
+            end = min(start + CHUNK_SIZE, len(self.counters))
+            ones = int.from_bytes(b"\x01" * (end - start), "little")
+            nibbles = ones * 0xF
+            a = int.from_bytes(self.counters[start:end], "little")
+            b = int.from_bytes(other.counters[start:end], "little")
+            low = operation(a & nibbles, b & nibbles, ones)
+            high = operation(a >> 4 & nibbles, b >> 4 & nibbles, ones)
+            result.counters[start:end] = (low | high << 4).to_bytes(end - start, "little")
+            # +15 у байті встановлює біт 4 рівно для ненульових лічильників
+            bits_set += bin((low + nibbles) & ones << 4).count("1")
+            bits_set += bin((high + nibbles) & ones << 4).count("1")
+        result.bits_set = bits_set
+        return result
+
+    def union(self, other: "CountingBloomFilter") -> "CountingBloomFilter":
+        """Сума лічильників (з насиченням на MAX_COUNT) — мультимножина обох фільтрів."""
+        result = self._combine(other, _saturating_add)
+        result.count = self.count + other.count
+        return result
+
+    def intersection(self, other: "CountingBloomFilter") -> "CountingBloomFilter":
+        """Мінімум лічильників — наближення перетину."""
+        result = self._combine(other, _minimum)
+        result.count = min(self.count, other.count)
+        return result
+
+    def visualize(self):
+        return "".join(format(self._get(i), "x") for i in range(self.size))
+
+
+if __name__ == "__main__":
+    counting_filter = CountingBloomFilter(100, 3)
+    counting_filter.add("apple")
+    counting_filter.add("banana")
+    print(counting_filter.visualize())
+    print(counting_filter.contains("apple"), counting_filter.contains("banana"))
+    counting_filter.remove("apple")
+    print(counting_filter.visualize())
+    print(counting_filter.contains("apple"), counting_filter.contains("banana"))
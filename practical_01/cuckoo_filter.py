@@ -0,0 +1,159 @@
+import random
+from array import array
+
+import mmh3
+
+from bloom_filter import MASK_64, as_key, as_keys
+
+
+class CuckooFilter:
+    """
+    Фільтр зозулі (Fan et al., 2014) з підтримкою видалення.
+
+    Замість бітів зберігаються короткі відбитки (fingerprints) елементів у
+    кошиках по `bucket_size` слотів. Кожен елемент має два можливі кошики:
+    i1 = hash(x) та i2 = i1 XOR hash(fingerprint), тож другий кошик
+    обчислюється з першого та відбитка без доступу до самого елемента.
+    Якщо обидва кошики повні, випадковий відбиток "виштовхується" в його
+    альтернативний кошик — як пташеня зозулі з гнізда.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        fingerprint_bits: int = 16,
+        bucket_size: int = 4,
+        max_kicks: int = 500,
+    ):
+        if not 1 <= fingerprint_bits <= 16:
+            raise ValueError("fingerprint_bits має бути від 1 до 16")
+        # кількість кошиків — степінь двійки, щоб XOR не виводив за межі
+        num_buckets = 1
+        while num_buckets * bucket_size * 0.95 < capacity:
+            num_buckets <<= 1
+        self.num_buckets = num_buckets
+        self.mask = num_buckets - 1
+        self.bucket_size = bucket_size
+        self.max_kicks = max_kicks
+        self.fingerprint_bits = fingerprint_bits
+        self.fingerprint_max = (1 << fingerprint_bits) - 1
+        # 0 означає порожній слот
+        typecode = "B" if fingerprint_bits <= 8 else "H"
+        self.slots = array(typecode, [0]) * (num_buckets * bucket_size)
+        self.count = 0
+        self.victim = None  # (кошик, відбиток), якому не знайшлося місця
+
+    def _fingerprint_and_index(self, item):
+        digest = mmh3.hash128(as_key(item))
+        fingerprint = (digest >> 64) % self.fingerprint_max + 1
+        return fingerprint, digest & MASK_64 & self.mask
+
+    def _alt_index(self, index: int, fingerprint: int) -> int:
+        return (index ^ ((fingerprint * 0x5BD1E995) & MASK_64)) & self.mask
+
+    def _insert_into(self, index: int, fingerprint: int) -> bool:
+        start = index * self.bucket_size
+        slots = self.slots
+        for slot in range(start, start + self.bucket_size):
+            if slots[slot] == 0:
+                slots[slot] = fingerprint
+                return True
+        return False
+
+    def _bucket_has(self, index: int, fingerprint: int) -> bool:
+        start = index * self.bucket_size
+        return fingerprint in self.slots[start : start + self.bucket_size]
+
+    def _delete_from(self, index: int, fingerprint: int) -> bool:
+        start = index * self.bucket_size
+        slots = self.slots
+        for slot in range(start, start + self.bucket_size):
+            if slots[slot] == fingerprint:
+                slots[slot] = 0
+                return True
+        return False
+
+    def add(self, item: str) -> bool:
+        """Додає елемент; повертає False, якщо фільтр переповнений."""
+        if self.victim is not None:
+            return False
+        fingerprint, i1 = self._fingerprint_and_index(item)
+        i2 = self._alt_index(i1, fingerprint)
+        self.count += 1
+        if self._insert_into(i1, fingerprint) or self._insert_into(i2, fingerprint):
+            return True
+        # обидва кошики повні — виштовхуємо відбитки
+        index = random.choice((i1, i2))
+        for _ in range(self.max_kicks):
+            slot = index * self.bucket_size + random.randrange(self.bucket_size)
+            fingerprint, self.slots[slot] = self.slots[slot], fingerprint
+            index = self._alt_index(index, fingerprint)
+            if self._insert_into(index, fingerprint):
+                return True
+        # відбиток, що залишився без місця, зберігаємо окремо, щоб не втратити
+        self.victim = (index, fingerprint)
+        return True
+
+    def contains(self, item: str) -> bool:
+        fingerprint, i1 = self._fingerprint_and_index(item)
+        i2 = self._alt_index(i1, fingerprint)
+        if self._bucket_has(i1, fingerprint) or self._bucket_has(i2, fingerprint):
+            return True
+        if self.victim is not None:
+            victim_index, victim_fingerprint = self.victim
+            return victim_fingerprint == fingerprint and victim_index in (i1, i2)
+        return False
+
+    def remove(self, item: str) -> bool:
+        """Видаляє одну копію елемента; повертає False, якщо його немає у фільтрі.
+
+        Видаляти можна лише елементи, що справді додавались: інакше можна
+        стерти такий самий відбиток іншого елемента.
+        """
+        fingerprint, i1 = self._fingerprint_and_index(item)
+        i2 = self._alt_index(i1, fingerprint)
+        if self._delete_from(i1, fingerprint) or self._delete_from(i2, fingerprint):
+            self.count -= 1
+            if self.victim is not None:
+                # звільнилося місце — пробуємо повернути відкладений відбиток
+                victim_index, victim_fingerprint = self.victim
+                self.victim = None
+                self._reinsert(victim_index, victim_fingerprint)
+            return True
+        if self.victim is not None:
+            victim_index, victim_fingerprint = self.victim
+            if victim_fingerprint != fingerprint or victim_index not in (i1, i2):
+                return False
+            self.victim = None
+            self.count -= 1
+            return True
+        return False
+
+    def _reinsert(self, index: int, fingerprint: int) -> None:
+        if self._insert_into(index, fingerprint):
+            return
+        if self._insert_into(self._alt_index(index, fingerprint), fingerprint):
+            return
+        self.victim = (index, fingerprint)
+
+    def add_many(self, items) -> list:
+        return [self.add(item) for item in as_keys(items)]
+
+    def contains_many(self, items) -> list:
+        return [self.contains(item) for item in as_keys(items)]
+
+    def remove_many(self, items) -> list:
+        return [self.remove(item) for item in as_keys(items)]
+
+    def load_factor(self) -> float:
+        return self.count / (self.num_buckets * self.bucket_size)
+
+
+if __name__ == "__main__":
+    cuckoo_filter = CuckooFilter(capacity=1_000, fingerprint_bits=8)
+    for fruit in ["apple", "banana", "orange"]:
+        cuckoo_filter.add(fruit)
+    print(cuckoo_filter.contains("apple"), cuckoo_filter.contains("grape"))
+    cuckoo_filter.remove("apple")
+    print(cuckoo_filter.contains("apple"), cuckoo_filter.contains("banana"))
+    print(f"Заповненість: {cuckoo_filter.load_factor():.2%}")
@@ -0,0 +1,64 @@
+import time
+
+from bloom_filter import BloomFilter
+from counting_bloom_filter import CountingBloomFilter
+from cuckoo_filter import CuckooFilter
+
+
+def storage_bytes(membership_filter) -> int:
+    if isinstance(membership_filter, CuckooFilter):
+        slots = membership_filter.slots
+        return len(slots) * slots.itemsize
+    if isinstance(membership_filter, CountingBloomFilter):
+        return len(membership_filter.counters)
+    return len(membership_filter.bit_array)
+
+
+def benchmark(name, membership_filter, keys, absent_keys):
+    start = time.perf_counter()
+    membership_filter.add_many(keys)
+    insert_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    present = membership_filter.contains_many(keys)
+    absent = membership_filter.contains_many(absent_keys)
+    lookup_time = time.perf_counter() - start
+
+    assert all(present), f"{name}: хибно-негативний результат"
+    return (
+        name,
+        storage_bytes(membership_filter) / len(keys),
+        sum(absent) / len(absent_keys),
+        len(keys) / insert_time,
+        (len(keys) + len(absent_keys)) / lookup_time,
+    )
+
+
+if __name__ == "__main__":
+    n = 200_000
+    fp_rate = 0.01
+    keys = [f"key-{i}" for i in range(n)]
+    absent_keys = [f"absent-{i}" for i in range(n)]
+
+    results = [
+        benchmark("BloomFilter", BloomFilter.from_capacity(n, fp_rate), keys, absent_keys),
+        benchmark(
+            "CountingBloomFilter",
+            CountingBloomFilter.from_capacity(n, fp_rate),
+            keys,
+            absent_keys,
+        ),
+        benchmark("CuckooFilter (8 біт)", CuckooFilter(n, fingerprint_bits=8), keys, absent_keys),
+        benchmark("CuckooFilter (16 біт)", CuckooFilter(n, fingerprint_bits=16), keys, absent_keys),
+    ]
+
+    print(
+        f"{'Фільтр':<22} | {'Байт/ключ':<10} | {'FP':<8} | "
+        f"{'Вставок/сек':<12} | {'Пошуків/сек':<12}"
+    )
+    print("-" * 76)
+    for name, bytes_per_key, measured_fp, inserts, lookups in results:
+        print(
+            f"{name:<22} | {bytes_per_key:<10.2f} | {measured_fp:<8.4f} | "
+            f"{inserts:<12,.0f} | {lookups:<12,.0f}"
+        )
@@ -56,6 +56,12 @@ class LRUCache:
         self.capacity = capacity
         self.cache = {}
         self.list = DoublyLinkedList()
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def __contains__(self, key) -> bool:
+        return key in self.cache
     
     def get(self, key: int) -> int:
         if key not in self.cache:
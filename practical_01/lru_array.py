@@ -0,0 +1,157 @@
+import random
+import timeit
+import tracemalloc
+from array import array
+
+from lru import LRUCache
+
+
+class ArrayLRUCache:
+    """
+    LRU-кеш без окремого об'єкта Node на кожен запис.
+
+    Зв'язки двозв'язного списку зберігаються у заздалегідь виділених масивах
+    цілих чисел `prev`/`next`, а ключі та значення — у паралельних списках
+    `keys`/`values` (слоти). Слот з індексом `capacity` — сторожовий вузол:
+    `next[capacity]` вказує на голову списку, `prev[capacity]` — на хвіст.
+    Вільні слоти зв'язані в однозв'язний список через той самий масив `next`.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.cache = {}  # ключ -> номер слота
+        self.sentinel = capacity
+        self.prev = array("l", [capacity]) * (capacity + 1)
+        self.next = array("l", [capacity]) * (capacity + 1)
+        self.keys = [None] * capacity
+        self.values = [None] * capacity
+        # Список вільних слотів: 0 -> 1 -> ... -> capacity - 1 -> -1
+        for slot in range(capacity - 1):
+            self.next[slot] = slot + 1
+        if capacity:
+            self.next[capacity - 1] = -1
+        self.free = 0 if capacity else -1
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def __contains__(self, key) -> bool:
+        return key in self.cache
+
+    def _unlink(self, slot: int) -> None:
+        prev, next = self.prev, self.next
+        p, n = prev[slot], next[slot]
+        next[p] = n
+        prev[n] = p
+
+    def _link_front(self, slot: int) -> None:
+        prev, next = self.prev, self.next
+        head = next[self.sentinel]
+        prev[slot] = self.sentinel
+        next[slot] = head
+        prev[head] = slot
+        next[self.sentinel] = slot
+
+    def get(self, key: int) -> int:
+        slot = self.cache.get(key)
+        if slot is None:
+            return -1
+        if self.next[self.sentinel] != slot:
+            self._unlink(slot)
+            self._link_front(slot)
+        return self.values[slot]
+
+    def put(self, key: int, value: int) -> None:
+        slot = self.cache.get(key)
+        if slot is not None:
+            # ключ вже існує: оновлюємо значення на місці, без нового кортежу
+            self.values[slot] = value
+            if self.next[self.sentinel] != slot:
+                self._unlink(slot)
+                self._link_front(slot)
+            return
+        if self.capacity <= 0:
+            return
+        if self.free != -1:
+            # беремо слот зі списку вільних
+            slot = self.free
+            self.free = self.next[slot]
+        else:
+            # витісняємо хвіст і перевикористовуємо його слот
+            slot = self.prev[self.sentinel]
+            self._unlink(slot)
+            del self.cache[self.keys[slot]]
+        self.keys[slot] = key
+        self.values[slot] = value
+        self.cache[key] = slot
+        self._link_front(slot)
+
+    def items(self):
+        """Пари (ключ, значення) від найновішої до найстарішої."""
+        slot = self.next[self.sentinel]
+        while slot != self.sentinel:
+            yield self.keys[slot], self.values[slot]
+            slot = self.next[slot]
+
+
+def explain(cache: ArrayLRUCache):
+    print("-----------------------")
+    for key, value in cache.items():
+        print(f"{key}: {value}")
+    print("-----------------------")
+
+
+def measure_memory(cache_class, n):
+    tracemalloc.start()
+    cache = cache_class(n)
+    for i in range(n):
+        cache.put(i, i)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current
+
+
+def measure_ops(cache_class, n, ops, seed=42):
+    """
+    Операцій/сек і частка влучань на Zipf-подібному потоці ключів.
+
+    Ключів удвічі більше, ніж місця в кеші: популярні ключі влучають, а
+    рідкісні промахуються й витісняють інші — тож у замір потрапляють і
+    влучання, і промахи з витісненням. Ключі генеруються поза заміром.
+    """
+    cache = cache_class(n)
+    rng = random.Random(seed)
+    keys = rng.choices(range(2 * n), weights=[1 / (rank + 1) for rank in range(2 * n)], k=ops)
+    misses = 0
+
+    def workload():
+        nonlocal misses
+        for i, key in enumerate(keys):
+            if cache.get(key) == -1:
+                misses += 1
+                cache.put(key, i)
+
+    seconds = timeit.timeit(workload, number=1)
+    # кожне звернення — get, кожен промах — ще й put
+    return (ops + misses) / seconds, 1 - misses / ops
+
+
+if __name__ == "__main__":
+    cache = ArrayLRUCache(3)
+    cache.put(1, "Банан")
+    cache.put(2, "Груша")
+    cache.put(3, "Яблуко")
+    print(cache.get(1))  # виведе "Банан"
+    cache.put(4, "Диня")
+    explain(cache)
+    print(cache.get(2))  # виведе -1 (не знайдено)
+
+    n = 200_000
+    ops = 500_000
+    memory_header = "Пам'ять, байт/запис"
+    print(f"{'Реалізація':<25} | {memory_header:<20} | {'Операцій/сек':<15} | {'Влучань':<8}")
+    print("-" * 77)
+    for cache_class in [LRUCache, ArrayLRUCache]:
+        per_entry = measure_memory(cache_class, n) / n
+        ops_per_sec, hit_ratio = measure_ops(cache_class, n, ops)
+        print(f"{cache_class.__name__:<25} | {per_entry:<20.1f} | {ops_per_sec:<15,.0f} | {hit_ratio:<8.1%}")
@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from lru import LRUCache
+
+
+class Shard:
+    """Один незалежний LRU-кеш зі своїм замком та лічильниками."""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default):
+        # викликати лише під self.lock
+        if key in self.cache:
+            self.hits += 1
+            return self.cache.get(key)
+        self.misses += 1
+        return default
+
+    def put(self, key, value) -> None:
+        # викликати лише під self.lock
+        cache = self.cache
+        if cache.capacity <= 0:
+            return  # шард без місця (capacity < num_shards) нічого не зберігає
+        if key not in cache and len(cache) >= cache.capacity:
+            self.evictions += 1
+        cache.put(key, value)
+
+
+class ShardedLRUCache:
+    """
+    Потокобезпечний LRU-кеш, поділений на `num_shards` незалежних шардів.
+
+    Ключ потрапляє в шард за `hash(key) % num_shards`, і кожен шард має
+    власний замок, тож потоки, що працюють з різними шардами, не блокують
+    один одного. Навіть `get` бере замок, бо переміщує вузол на початок списку.
+    `cache_factory` дозволяє підставити іншу реалізацію з тим самим API,
+    наприклад `ArrayLRUCache` з lru_array.py.
+    """
+
+    def __init__(self, capacity: int, num_shards: int = 16, cache_factory=LRUCache):
+        self.capacity = capacity
+        self.num_shards = num_shards
+        # залишок ділення роздаємо першим шардам по одному слоту,
+        # тож сумарна місткість рівно capacity
+        base_capacity, extra = divmod(capacity, num_shards)
+        self.shards = [
+            Shard(cache_factory(base_capacity + (index < extra)))
+            for index in range(num_shards)
+        ]
+
+    def _shard(self, key) -> Shard:
+        return self.shards[hash(key) % self.num_shards]
+
+    def __len__(self) -> int:
+        return sum(len(shard.cache) for shard in self.shards)
+
+    def get(self, key, default=-1):
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.get(key, default)
+
+    def put(self, key, value) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            shard.put(key, value)
+
+    def _group_by_shard(self, keys):
+        groups = defaultdict(list)
+        for key in keys:
+            groups[hash(key) % self.num_shards].append(key)
+        return groups
+
+    def get_many(self, keys) -> dict:
+        """Повертає словник {ключ: значення} для знайдених ключів.
+
+        Ключі групуються за шардами, і замок кожного шарда береться один раз.
+        """
+        missing = object()
+        result = {}
+        for index, shard_keys in self._group_by_shard(keys).items():
+            shard = self.shards[index]
+            with shard.lock:
+                for key in shard_keys:
+                    value = shard.get(key, missing)
+                    if value is not missing:
+                        result[key] = value
+        return result
+
+    def put_many(self, items) -> None:
+        """Записує пари (ключ, значення) зі словника або ітерованого об'єкта."""
+        if isinstance(items, dict):
+            items = items.items()
+        groups = defaultdict(list)
+        for key, value in items:
+            groups[hash(key) % self.num_shards].append((key, value))
+        for index, shard_items in groups.items():
+            shard = self.shards[index]
+            with shard.lock:
+                for key, value in shard_items:
+                    shard.put(key, value)
+
+    def stats(self) -> dict:
+        hits = misses = evictions = 0
+        for shard in self.shards:
+            with shard.lock:
+                hits += shard.hits
+                misses += shard.misses
+                evictions += shard.evictions
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "size": len(self),
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+
+def worker(cache: ShardedLRUCache, worker_id: int, ops: int) -> None:
+    for i in range(ops):
+        key = (i * 31 + worker_id) % 5_000
+        if cache.get(key) == -1:
+            cache.put(key, f"значення {key}")
+
+
+if __name__ == "__main__":
+    cache = ShardedLRUCache(capacity=2_000, num_shards=8)
+    cache.put_many({1: "Банан", 2: "Груша", 3: "Яблуко"})
+    print(cache.get_many([1, 2, 3, 4]))  # ключа 4 немає в кеші
+    print(cache.get(1))  # виведе "Банан"
+
+    num_threads = 8
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        futures = [
+            executor.submit(worker, cache, worker_id, 50_000)
+            for worker_id in range(num_threads)
+        ]
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - start
+
+    print(f"Потоків: {num_threads}, час: {elapsed:.3f} с")
+    for name, value in cache.stats().items():
+        print(f"{name:<10}: {value}")
@@ -0,0 +1,142 @@
+import heapq
+import itertools
+import sys
+import time
+
+from lru import LRUCache, explain
+
+
+class TTLLRUCache(LRUCache):
+    """
+    LRU-кеш з часом життя записів (TTL) та обмеженням за розміром у байтах.
+
+    - `capacity` — максимальна кількість записів (None — без обмеження);
+    - `ttl` — час життя запису за замовчуванням у секундах (None — безстроково);
+    - `max_bytes` — бюджет пам'яті; розмір значення рахує функція `sizeof`.
+
+    Прострочені записи видаляються ліниво під час звернення до них, а також
+    порціями по `sweep_batch` штук на кожній операції: дедлайни лежать у купі,
+    тому перевірка "чи є що прибирати" коштує O(1).
+    """
+
+    def __init__(
+        self,
+        capacity=None,
+        ttl=None,
+        max_bytes=None,
+        sizeof=sys.getsizeof,
+        clock=time.monotonic,
+        sweep_batch: int = 16,
+    ):
+        super().__init__(capacity if capacity is not None else float("inf"))
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.clock = clock
+        self.sweep_batch = sweep_batch
+        self.used_bytes = 0
+        self.sizes = {}  # ключ -> розмір значення в байтах
+        self.expires = {}  # ключ -> момент, після якого запис недійсний
+        self.deadlines = []  # купа (дедлайн, порядковий номер, ключ)
+        self.counter = itertools.count()
+
+    def _remove(self, key) -> None:
+        node = self.cache.pop(key)
+        self.list.remove(node)
+        self.used_bytes -= self.sizes.pop(key, 0)
+        self.expires.pop(key, None)
+
+    def _is_expired(self, key, now) -> bool:
+        deadline = self.expires.get(key)
+        return deadline is not None and deadline <= now
+
+    def __contains__(self, key) -> bool:
+        if key not in self.cache:
+            return False
+        if self._is_expired(key, self.clock()):
+            self._remove(key)
+            return False
+        return True
+
+    def sweep(self, limit=None) -> int:
+        """Видаляє прострочені записи (не більше `limit`), повертає їх кількість."""
+        now = self.clock()
+        removed = 0
+        deadlines = self.deadlines
+        while deadlines and deadlines[0][0] <= now:
+            if limit is not None and removed >= limit:
+                break
+            deadline, _, key = heapq.heappop(deadlines)
+            # у купі можуть лишатися застарілі дедлайни перезаписаних ключів
+            if self.expires.get(key) == deadline:
+                self._remove(key)
+                removed += 1
+        # якщо застарілих дедлайнів назбиралося забагато — перебудовуємо купу
+        if len(deadlines) > 2 * len(self.expires) + 64:
+            self.deadlines = [
+                (deadline, next(self.counter), key)
+                for key, deadline in self.expires.items()
+            ]
+            heapq.heapify(self.deadlines)
+        return removed
+
+    def get(self, key: int, default=-1) -> int:
+        self.sweep(self.sweep_batch)
+        if key not in self:
+            return default
+        node = self.cache[key]
+        self.list.move_to_front(node)
+        return node.data[1]
+
+    def put(self, key: int, value: int, ttl=None) -> None:
+        self.sweep(self.sweep_batch)
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            # значення більше за весь бюджет — не кешуємо його взагалі
+            if key in self.cache:
+                self._remove(key)
+            return
+
+        if key in self.cache:
+            node = self.cache[key]
+            node.data = (key, value)
+            self.list.move_to_front(node)
+            self.used_bytes -= self.sizes.get(key, 0)
+        else:
+            self.cache[key] = self.list.push(key, value)
+        if self.max_bytes is not None:
+            self.sizes[key] = size
+            self.used_bytes += size
+
+        ttl = self.ttl if ttl is None else ttl
+        if ttl is not None:
+            deadline = self.clock() + ttl
+            self.expires[key] = deadline
+            heapq.heappush(self.deadlines, (deadline, next(self.counter), key))
+        else:
+            self.expires.pop(key, None)
+
+        # витісняємо з хвоста, доки не вкладемося в обидва обмеження
+        while len(self.cache) > self.capacity or (
+            self.max_bytes is not None and self.used_bytes > self.max_bytes
+        ):
+            self._remove(self.list.tail.data[0])
+
+
+if __name__ == "__main__":
+    cache = TTLLRUCache(capacity=3, ttl=0.2)
+    cache.put(1, "Банан")
+    cache.put(2, "Груша", ttl=10)
+    cache.put(3, "Яблуко")
+    explain(cache)
+    time.sleep(0.3)
+    print(cache.get(1))  # виведе -1: час життя минув
+    print(cache.get(2))  # виведе "Груша"
+    explain(cache)
+
+    # Бюджет у байтах: значення різного розміру, розмір рахуємо як len()
+    sized = TTLLRUCache(max_bytes=1_000, sizeof=len)
+    sized.put("small", "x" * 100)
+    sized.put("medium", "y" * 400)
+    sized.put("large", "z" * 600)  # витіснить "small"
+    print(list(sized.cache), sized.used_bytes)
@@ -0,0 +1,195 @@
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from lru_ttl import TTLLRUCache
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "waits", "maxsize", "currsize"])
+
+_KWARGS_MARK = object()
+_MISSING = object()  # відсутність запису в кеші; -1 з TTLLRUCache.get — легітимний результат
+
+
+def make_key(args, kwargs, typed: bool):
+    """Будує ключ кешу з аргументів виклику, як functools.lru_cache.
+
+    При `typed=True` виклики f(3) та f(3.0) кешуються окремо.
+    """
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(kwargs.items())
+    if typed:
+        key += tuple(type(value) for value in args)
+        if kwargs:
+            key += tuple(type(value) for value in kwargs.values())
+    return key
+
+
+class _Call:
+    """Обчислення, що вже виконується: інші виклики з тим самим ключем чекають на нього."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def memoize(maxsize=128, ttl=None, typed: bool = False, clock=time.monotonic):
+    """
+    Декоратор мемоїзації на основі LRU-кешу з lru_ttl.py.
+
+    - `maxsize` — максимальна кількість записів (None — без обмеження);
+    - `ttl` — час життя результату в секундах (None — безстроково);
+    - `typed` — чи розрізняти аргументи різних типів;
+    - `clock` — джерело часу для TTL (підміняється в тестах).
+
+    Захист від "тисняви" (cache stampede): якщо кілька викликів одночасно
+    промахуються по одному ключу, функцію обчислює лише перший, а решта
+    чекають на його результат (або виняток). Працює і для звичайних функцій
+    (потоки), і для `async def` корутин (одна подія asyncio на ключ).
+    Статистика доступна через `cache_info()`, очищення — `cache_clear()`.
+    """
+
+    def decorator(func):
+        cache = TTLLRUCache(capacity=maxsize, ttl=ttl, clock=clock)
+        stats = {"hits": 0, "misses": 0, "waits": 0}
+        lock = threading.Lock()
+        in_flight = {}
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs, typed)
+                with lock:
+                    # один пошук: запис не може простигнути між перевіркою і читанням
+                    cached = cache.get(key, _MISSING)
+                    if cached is not _MISSING:
+                        stats["hits"] += 1
+                        return cached
+                    future = in_flight.get(key)
+                    if future is None:
+                        stats["misses"] += 1
+                        future = asyncio.get_running_loop().create_future()
+                        in_flight[key] = future
+                        leader = True
+                    else:
+                        stats["waits"] += 1
+                        leader = False
+                if not leader:
+                    # shield: скасування одного з тих, хто чекає, не скасовує решту
+                    return await asyncio.shield(future)
+                try:
+                    result = await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except BaseException as error:
+                    future.set_exception(error)
+                    future.exception()  # позначаємо виняток як отриманий
+                    raise
+                else:
+                    with lock:
+                        cache.put(key, result)
+                    future.set_result(result)
+                    return result
+                finally:
+                    with lock:
+                        del in_flight[key]
+
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs, typed)
+                with lock:
+                    # один пошук: запис не може простигнути між перевіркою і читанням
+                    cached = cache.get(key, _MISSING)
+                    if cached is not _MISSING:
+                        stats["hits"] += 1
+                        return cached
+                    call = in_flight.get(key)
+                    if call is None:
+                        stats["misses"] += 1
+                        call = in_flight[key] = _Call()
+                        leader = True
+                    else:
+                        stats["waits"] += 1
+                        leader = False
+                if not leader:
+                    call.event.wait()
+                    if call.error is not None:
+                        raise call.error
+                    return call.result
+                try:
+                    call.result = func(*args, **kwargs)
+                except BaseException as error:
+                    call.error = error
+                    raise
+                else:
+                    with lock:
+                        cache.put(key, call.result)
+                    return call.result
+                finally:
+                    with lock:
+                        del in_flight[key]
+                    call.event.set()
+
+        def cache_info() -> CacheInfo:
+            with lock:
+                return CacheInfo(
+                    stats["hits"], stats["misses"], stats["waits"], maxsize, len(cache)
+                )
+
+        def cache_clear() -> None:
+            nonlocal cache
+            with lock:
+                cache = TTLLRUCache(capacity=maxsize, ttl=ttl, clock=clock)
+                stats.update(hits=0, misses=0, waits=0)
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+@memoize(maxsize=None)
+def fibonacci(n):
+    if n <= 1:
+        return n
+    return fibonacci(n - 1) + fibonacci(n - 2)
+
+
+@memoize(maxsize=1_000, ttl=60)
+def slow_square(x):
+    time.sleep(0.2)  # імітація дорогого обчислення
+    return x * x
+
+
+@memoize(maxsize=100)
+async def slow_square_async(x):
+    await asyncio.sleep(0.2)
+    return x * x
+
+
+async def main_async():
+    results = await asyncio.gather(*(slow_square_async(7) for _ in range(10)))
+    print(results[0], slow_square_async.cache_info())
+
+
+if __name__ == "__main__":
+    print(fibonacci(200))
+    print(fibonacci.cache_info())
+
+    # 10 потоків одночасно просять те саме значення — рахується лише раз
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(slow_square, [12] * 10))
+    print(results[0], f"{time.perf_counter() - start:.2f} с", slow_square.cache_info())
+
+    asyncio.run(main_async())
@@ -1,3 +1,7 @@
+import heapq
+import random
+import timeit
+
 def merge_lists(list1, list2):
     i, j = 0, 0
     result_list = []
@@ -23,8 +27,84 @@ def merge_k_lists(lists: list[list[int]]):
     return result_list
 
 
+def merge_k_iterators(*iterables, key=None, reverse=False):
+    """
+    Ліниве злиття k відсортованих послідовностей за O(N log k).
+
+    Приймає будь-які ітератори (списки, генератори, відкриті файли) і видає
+    елементи по одному, тримаючи в купі лише по одному елементу з кожного
+    джерела — тож можна зливати відсортовані серії, більші за оперативну пам'ять.
+    `key` та `reverse` мають той самий зміст, що й у sorted(); при reverse=True
+    кожне джерело має бути відсортоване за спаданням.
+    """
+    # У купі лежать [ключ, номер джерела, елемент, ітератор]. Номер джерела
+    # унікальний, тож при рівних ключах порівняння не дійде до самих елементів.
+    heap = []
+    for index, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            heap.append([_heap_key(value, key, reverse), index, value, iterator])
+            break
+    heapq.heapify(heap)
+
+    while len(heap) > 1:
+        entry = heap[0]
+        yield entry[2]
+        for value in entry[3]:
+            entry[0] = _heap_key(value, key, reverse)
+            entry[2] = value
+            heapq.heapreplace(heap, entry)
+            break
+        else:
+            heapq.heappop(heap)  # джерело вичерпане
+
+    if heap:
+        # лишилось одне джерело — віддаємо його без купи
+        _, _, value, iterator = heap[0]
+        yield value
+        yield from iterator
+
+
+class _Reversed:
+    """Обгортка, що інвертує порівняння, — для reverse=True з довільними ключами."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def _heap_key(value, key, reverse):
+    result = value if key is None else key(value)
+    return _Reversed(result) if reverse else result
+
+
+def read_sorted_run(file_path):
+    """Генератор чисел з файлу відсортованої серії (одне число в рядку)."""
+    with open(file_path, "r", encoding="utf-8") as file:
+        for line in file:
+            yield int(line)
+
+
 if __name__ == "__main__":
     # Приклад виклику функції
     lists: list[list[int]] = [[1, 4, 5], [1, 3, 4], [2, 6]]
     merged_list = merge_k_lists(lists)
     print("Відсортований список:", merged_list)
+    print("Ліниве злиття:", list(merge_k_iterators(*lists)))
+    print("За спаданням:", list(merge_k_iterators([5, 4, 1], [4, 3, 1], [6, 2], reverse=True)))
+
+    # Порівняння з попарним згортанням
+    print(f"{'k':<6} | {'merge_k_lists, с':<18} | {'merge_k_iterators, с':<20}")
+    print("-" * 50)
+    for k in [4, 16, 64, 256]:
+        runs = [sorted(random.randint(0, 10**6) for _ in range(200_000 // k)) for _ in range(k)]
+        fold_time = timeit.timeit(lambda: merge_k_lists(runs), number=3)
+        heap_time = timeit.timeit(lambda: list(merge_k_iterators(*runs)), number=3)
+        print(f"{k:<6} | {fold_time:<18.4f} | {heap_time:<20.4f}")
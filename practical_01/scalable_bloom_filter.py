@@ -0,0 +1,86 @@
+from bloom_filter import BloomFilter, as_keys
+
+
+class ScalableBloomFilter:
+    """
+    Масштабований фільтр Блума (Almeida et al., 2007).
+
+    Коли поточний фільтр заповнюється до своєї місткості, додається новий,
+    у `growth` разів більший, з жорсткішою цільовою ймовірністю помилки
+    p_i = p_0 * r^i. Сумарна ймовірність хибного спрацювання
+    1 - П(1 - p_i) тоді не перевищує `fp_rate`, скільки б елементів не додали.
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 1_000,
+        fp_rate: float = 0.01,
+        growth: int = 2,
+        tightening_ratio: float = 0.85,
+    ):
+        self.initial_capacity = initial_capacity
+        self.fp_rate = fp_rate
+        self.growth = growth
+        self.tightening_ratio = tightening_ratio
+        self.filters = []
+        self._add_filter()
+
+    def _add_filter(self) -> None:
+        i = len(self.filters)
+        capacity = self.initial_capacity * self.growth**i
+        # сума геометричного ряду p_0 * r^i дорівнює fp_rate
+        fp_rate = self.fp_rate * (1 - self.tightening_ratio) * self.tightening_ratio**i
+        self.filters.append(BloomFilter.from_capacity(capacity, fp_rate))
+
+    def __len__(self) -> int:
+        return sum(bloom_filter.count for bloom_filter in self.filters)
+
+    def contains(self, item: str) -> bool:
+        return any(bloom_filter.contains(item) for bloom_filter in self.filters)
+
+    def add(self, item: str) -> bool:
+        """Додає елемент; повертає False, якщо він (ймовірно) вже є у фільтрі."""
+        if self.contains(item):
+            return False
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            self._add_filter()
+            current = self.filters[-1]
+        current.add(item)
+        return True
+
+    def add_many(self, items) -> None:
+        for item in as_keys(items):
+            self.add(item)
+
+    def contains_many(self, items) -> list:
+        items = list(as_keys(items))
+        result = [False] * len(items)
+        for bloom_filter in self.filters:
+            pending = [i for i, found in enumerate(result) if not found]
+            if not pending:
+                break
+            hits = bloom_filter.contains_many([items[i] for i in pending])
+            for i, found in zip(pending, hits):
+                result[i] = found
+        return result
+
+    def false_positive_rate(self) -> float:
+        """Поточна оцінка ймовірності хибного спрацювання для всього ланцюжка."""
+        probability_correct = 1.0
+        for bloom_filter in self.filters:
+            probability_correct *= 1 - bloom_filter.false_positive_rate()
+        return 1 - probability_correct
+
+
+if __name__ == "__main__":
+    dedup = ScalableBloomFilter(initial_capacity=1_000, fp_rate=0.01)
+    for step in range(1, 6):
+        dedup.add_many(f"event-{i}" for i in range(step * 10_000))
+        print(
+            f"елементів: {len(dedup):>6}, фільтрів: {len(dedup.filters)}, "
+            f"оцінка FP: {dedup.false_positive_rate():.4f}"
+        )
+
+    false_positives = sum(dedup.contains_many([f"other-{i}" for i in range(50_000)]))
+    print(f"Виміряна частка хибних спрацювань: {false_positives / 50_000:.4f}")
@@ -0,0 +1,289 @@
+import mmap
+import os
+import struct
+import tempfile
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+
+from compiled_pattern import builtin_find_all
+from text_search import boyer_moore_search, read_file
+
+FILE_HEADER = struct.Struct("<4sIQ16s")
+FILE_MAGIC = b"SFX1"
+SENTINEL = 0  # байт-обмежувач: менший за всі символи тексту
+OCC_STEP = 64  # крок контрольних точок таблиці входжень FM-індексу
+
+
+def build_suffix_array(data: bytes) -> array:
+    """
+    Суфіксний масив методом подвоєння префіксів (Manber–Myers).
+
+    На кроці k суфікси впорядковані за першими 2k символами: ключ суфікса i —
+    пара рангів (rank[i], rank[i + k]). Кроків не більше log n, і цикл
+    зупиняється, щойно всі ранги стають різними.
+    """
+    n = len(data)
+    sa = list(range(n))
+    # початкові ранги — номери байтів серед присутніх, щоб ключі вміщались у n + 1
+    alphabet = {byte: rank for rank, byte in enumerate(sorted(set(data)))}
+    rank = [alphabet[byte] for byte in data]
+    k = 1
+    while True:
+        keys = [rank[i] * (n + 1) + (rank[i + k] + 1 if i + k < n else 0) for i in range(n)]
+        sa.sort(key=keys.__getitem__)
+        new_rank = [0] * n
+        current = 0
+        for prev, suffix in zip(sa, sa[1:]):
+            if keys[suffix] != keys[prev]:
+                current += 1
+            new_rank[suffix] = current
+        rank = new_rank
+        if current == n - 1 or k >= n:
+            return array("i", sa)
+        k *= 2
+
+
+def build_lcp_array(data: bytes, sa) -> array:
+    """Масив LCP алгоритмом Касаї: lcp[i] — спільний префікс суфіксів sa[i - 1] та sa[i]."""
+    n = len(data)
+    rank = [0] * n
+    for row, suffix in enumerate(sa):
+        rank[suffix] = row
+    lcp = array("i", [0]) * n
+    h = 0
+    for suffix in range(n):
+        row = rank[suffix]
+        if row == 0:
+            h = 0
+            continue
+        previous = sa[row - 1]
+        while suffix + h < n and previous + h < n and data[suffix + h] == data[previous + h]:
+            h += 1
+        lcp[row] = h
+        if h:
+            h -= 1
+    return lcp
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+class SuffixIndex:
+    """
+    Індекс тексту для багаторазових запитів: суфіксний масив, LCP та FM-індекс.
+
+    Текст зберігається як bytes в однобайтовому кодуванні (cp1251 для статей),
+    тож зміщення в байтах збігаються з позиціями символів у рядку. До тексту
+    дописується байт-обмежувач 0, тому сам текст не може містити нульових байтів.
+
+    - count(pattern) — кількість входжень за O(m) кроків зворотного пошуку по BWT;
+    - locate(pattern) — позиції входжень (рядки суфіксного масиву того самого діапазону);
+    - find_range_sa(pattern) — діапазон двійковим пошуком по суфіксному масиву, O(m log n).
+    """
+
+    def __init__(self, text, encoding: str = "cp1251"):
+        self.encoding = encoding
+        self.mmap = None
+        self._views = []
+        if text is None:  # заповнюється в load()
+            return
+        data = text.encode(encoding) if isinstance(text, str) else bytes(text)
+        if SENTINEL in data:
+            raise ValueError("текст не може містити нульових байтів")
+        self.text = data + bytes([SENTINEL])
+        self.sa = build_suffix_array(self.text)
+        self.lcp = build_lcp_array(self.text, self.sa)
+        self._build_fm_index()
+
+    def _build_fm_index(self) -> None:
+        text, sa = self.text, self.sa
+        # BWT: символ перед кожним суфіксом у порядку суфіксного масиву
+        self.bwt = bytes(text[suffix - 1] for suffix in sa)
+        counts = Counter(text)
+        # first[c] — скільки символів тексту менші за c
+        self.first = array("I", [0]) * 257
+        for c in range(256):
+            self.first[c + 1] = self.first[c] + counts.get(c, 0)
+        # occ[b * 256 + c] — кількість c у bwt[: b * OCC_STEP]
+        blocks = len(self.bwt) // OCC_STEP + 1
+        self.occ = array("I", [0]) * (blocks * 256)
+        running = [0] * 256
+        for block in range(1, blocks):
+            for c, count in Counter(self.bwt[(block - 1) * OCC_STEP : block * OCC_STEP]).items():
+                running[c] += count
+            self.occ[block * 256 : (block + 1) * 256] = array("I", running)
+
+    def __len__(self):
+        return len(self.text) - 1
+
+    def _encode(self, pattern) -> bytes:
+        return pattern.encode(self.encoding) if isinstance(pattern, str) else bytes(pattern)
+
+    def _occ(self, c: int, row: int) -> int:
+        block = row // OCC_STEP
+        start = block * OCC_STEP
+        return self.occ[block * 256 + c] + bytes(self.bwt[start:row]).count(c)
+
+    def find_range(self, pattern):
+        """Діапазон [lo, hi) рядків суфіксного масиву, що починаються з pattern (FM-індекс)."""
+        pattern = self._encode(pattern)
+        lo, hi = 0, len(self.text)
+        for c in reversed(pattern):
+            lo = self.first[c] + self._occ(c, lo)
+            hi = self.first[c] + self._occ(c, hi)
+            if lo >= hi:
+                return lo, lo
+        return lo, hi
+
+    def find_range_sa(self, pattern):
+        """Той самий діапазон двійковим пошуком по суфіксному масиву."""
+        pattern = self._encode(pattern)
+        text, sa, m = self.text, self.sa, len(pattern)
+
+        def prefix(row):
+            return bytes(text[sa[row] : sa[row] + m])
+
+        lo = bisect_left(range(len(sa)), pattern, key=prefix)
+        hi = bisect_right(range(len(sa)), pattern, lo=lo, key=prefix)
+        return lo, hi
+
+    def count(self, pattern) -> int:
+        lo, hi = self.find_range(pattern)
+        return hi - lo
+
+    def locate(self, pattern) -> list:
+        lo, hi = self.find_range(pattern)
+        return sorted(self.sa[lo:hi])
+
+    def longest_repeated_substring(self) -> str:
+        """Найдовший підрядок, що трапляється в тексті щонайменше двічі (максимум LCP)."""
+        row = max(range(len(self.lcp)), key=self.lcp.__getitem__)
+        start = self.sa[row]
+        return bytes(self.text[start : start + self.lcp[row]]).decode(self.encoding)
+
+    def save(self, file_path) -> None:
+        """
+        Зберігає індекс: заголовок, далі текст, BWT, SA, LCP, first та occ.
+
+        Масиви вирівняні на 8 байтів і записані в рідному порядку байтів,
+        тож load(mmap_mode="r") відображає їх через memoryview.cast без копіювання.
+        """
+        header = FILE_HEADER.pack(
+            FILE_MAGIC, OCC_STEP, len(self.text), self.encoding.encode("ascii")
+        )
+        with open(file_path, "wb") as file:
+            file.write(header)
+            for name, offset, _, typecode in self._sections(len(self.text)):
+                value = getattr(self, name)
+                file.write(b"\0" * (offset - file.tell()))
+                file.write(bytes(value) if typecode == "B" else array(typecode, value).tobytes())
+
+    @staticmethod
+    def _sections(n: int):
+        """(атрибут, зміщення, кількість, typecode) кожного масиву у файлі."""
+        blocks = n // OCC_STEP + 1
+        layout = [("text", n, "B"), ("bwt", n, "B"), ("sa", n, "i"), ("lcp", n, "i"),
+                  ("first", 257, "I"), ("occ", blocks * 256, "I")]
+        offset = FILE_HEADER.size
+        sections = []
+        for name, length, typecode in layout:
+            offset = _align(offset)
+            sections.append((name, offset, length, typecode))
+            offset += length * array(typecode).itemsize
+        return sections
+
+    @classmethod
+    def load(cls, file_path, mmap_mode=None) -> "SuffixIndex":
+        """
+        Завантажує індекс, збережений методом save().
+
+        mmap_mode=None — усі масиви читаються в пам'ять;
+        mmap_mode="r"  — файл відображається в пам'ять лише для читання, і запити
+                         читають з нього лише потрібні сторінки; викличте close().
+        """
+        if mmap_mode not in (None, "r"):
+            raise ValueError(f"Невідомий mmap_mode: {mmap_mode!r}")
+        with open(file_path, "rb") as file:
+            magic, step, n, encoding = FILE_HEADER.unpack(file.read(FILE_HEADER.size))
+            if magic != FILE_MAGIC:
+                raise ValueError(f"{file_path} не є файлом SuffixIndex")
+            if step != OCC_STEP:
+                raise ValueError(f"{file_path}: інший крок контрольних точок ({step})")
+            index = cls(None, encoding.rstrip(b"\0").decode("ascii"))
+            if mmap_mode is None:
+                buffer = file.read()
+                base = FILE_HEADER.size
+            else:
+                index.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                buffer = memoryview(index.mmap)
+                index._views.append(buffer)
+                base = 0
+        for name, offset, length, typecode in cls._sections(n):
+            size = length * array(typecode).itemsize
+            chunk = buffer[offset - base : offset - base + size]
+            if len(chunk) != size:
+                raise ValueError(f"{file_path}: файл обрізано")
+            if index.mmap is None:
+                value = chunk if typecode == "B" else array(typecode, chunk)
+            else:
+                value = chunk if typecode == "B" else chunk.cast(typecode)
+                index._views.append(chunk)
+                if typecode != "B":
+                    index._views.append(value)
+            setattr(index, name, value)
+        return index
+
+    def close(self) -> None:
+        if self.mmap is None:
+            return
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self.mmap.close()
+        self.mmap = None
+
+
+if __name__ == "__main__":
+    index = SuffixIndex("banana")
+    print(list(index.sa), list(index.lcp), index.bwt)
+    print(index.count("ana"), index.locate("ana"), index.longest_repeated_substring())
+
+    text = read_file("стаття 1.txt") + "\n" + read_file("стаття 2.txt")
+    start = time.perf_counter()
+    index = SuffixIndex(text)
+    print(f"\nПобудова індексу для {len(text)} символів: {time.perf_counter() - start:.3f} сек")
+    print(f"Найдовший повторюваний підрядок: {index.longest_repeated_substring()[:60]!r}")
+
+    file_path = os.path.join(tempfile.gettempdir(), "articles.sfx")
+    index.save(file_path)
+    mapped = SuffixIndex.load(file_path, mmap_mode="r")
+    print(f"Файл індексу: {os.path.getsize(file_path) / 1024:.0f} КБ")
+
+    words = text.split()
+    queries = [w for w in dict.fromkeys(words) if len(w) > 3][:1000] + ["Буратіно дурачок"]
+    for query in queries:
+        expected = builtin_find_all(text, query)
+        assert index.locate(query) == expected == mapped.locate(query)
+        lo, hi = index.find_range_sa(query)
+        assert hi - lo == index.count(query)
+
+    timings = [
+        ("boyer_moore_search", lambda: [boyer_moore_search(text, q, search_all=True) for q in queries]),
+        ("str.find (перегляд тексту)", lambda: [builtin_find_all(text, q) for q in queries]),
+        ("SA двійковий пошук", lambda: [index.find_range_sa(q) for q in queries]),
+        ("FM count", lambda: [index.count(q) for q in queries]),
+        ("FM locate", lambda: [index.locate(q) for q in queries]),
+        ("FM locate (mmap)", lambda: [mapped.locate(q) for q in queries]),
+    ]
+    print(f"\n{'Метод':<28} | {'Запитів':<8} | {'мкс/запит':<10}")
+    print("-" * 52)
+    for name, run in timings:
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<28} | {len(queries):<8} | {elapsed / len(queries) * 1e6:<10.1f}")
+    mapped.close()
+    os.remove(file_path)
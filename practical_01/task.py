@@ -6,13 +6,15 @@ def are_brackets_balanced(s):
         "[": "]",
         "{": "}",
     }
+    # множина закриваючих дужок будується один раз, а не на кожен символ
+    closing = set(brackets.values())
 
     for char in s:
         # якщо символ є відкриваючим дужкою, додаємо його до стеку
         if char in brackets:
             stack.append(char)
         # якщо символ є закриваючою дужкою, перевіряємо, чи відповідає вона останній відкриваючій дужці
-        elif char in brackets.values():
+        elif char in closing:
             # якщо стек порожній або остання відкриваюча дужка не відповідає закриваючій, повертаємо False
             if not stack or brackets[stack.pop()] != char:
                 return False
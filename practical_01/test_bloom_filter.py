@@ -0,0 +1,253 @@
+"""
+Тести фільтра Блума: нормалізація ключів, збереження та поєднання фільтрів,
+зокрема для CountingBloomFilter.
+"""
+
+import random
+
+import pytest
+
+from bloom_filter import BloomFilter, as_key, as_keys
+from counting_bloom_filter import CountingBloomFilter
+
+
+class TestKeyNormalisation:
+    """Ключі однакові в add/contains і add_many/contains_many, а типи не змішуються."""
+
+    def test_single_and_batch_paths_agree(self) -> None:
+        """Ключ, доданий пакетно, знаходиться одиночним contains і навпаки."""
+        bloom_filter = BloomFilter(10_000, 4)
+        bloom_filter.add_many([1, 2, "three", 4.5])
+        bloom_filter.add(4)
+        assert bloom_filter.contains(1) and bloom_filter.contains(4.5)
+        assert bloom_filter.contains("three")
+        assert bloom_filter.contains_many([4, 2, 4.5]) == [True, True, True]
+
+    def test_int_key_differs_from_its_string(self) -> None:
+        """add(1) і add("1") встановлюють різні біти: число не є своїм рядком."""
+        by_int = BloomFilter(1_000, 3)
+        by_str = BloomFilter(1_000, 3)
+        by_int.add(1)
+        by_str.add("1")
+        assert by_int.bit_array != by_str.bit_array
+
+    @pytest.mark.parametrize("item", [0, 1, -1, 255, 256, -129, 2**70, 1.0, 0.5, -0.0, None, (1, 2)])
+    def test_non_string_keys_are_distinct_from_strings(self, item) -> None:
+        """Ключ не-рядка — bytes з префіксом 0xFF, якого немає в UTF-8 жодного рядка."""
+        key = as_key(item)
+        assert isinstance(key, bytes) and key.startswith(b"\xff")
+        assert key != as_key(str(item)).encode("utf-8")
+
+    def test_int_and_float_keys_differ(self) -> None:
+        """1 і 1.0 мають різні ключі, а великі й від'ємні цілі не збігаються."""
+        keys = [as_key(item) for item in [1, 1.0, -1, 255, -255, 2**64, -(2**64)]]
+        assert len(set(keys)) == len(keys)
+        assert as_key(True) == as_key(1)
+
+    def test_numpy_scalars_use_python_value(self) -> None:
+        """Скаляри NumPy (мають dtype та item()) хешуються як значення Python."""
+
+        class Scalar:
+            dtype = "int64"
+
+            def __init__(self, value):
+                self.value = value
+
+            def item(self):
+                return self.value
+
+        assert as_key(Scalar(7)) == as_key(7)
+        assert as_key(Scalar(2.5)) == as_key(2.5)
+        assert as_key(Scalar("text")) == "text"
+
+    def test_as_keys_converts_array_like(self) -> None:
+        """Об'єкти з tolist() (масиви NumPy) розгортаються перед нормалізацією."""
+
+        class ArrayLike:
+            def tolist(self):
+                return [1, b"raw", "text"]
+
+        assert list(as_keys(ArrayLike())) == [as_key(1), b"raw", "text"]
+
+
+class TestPersistence:
+    """save/load звичайного фільтра, зокрема через mmap."""
+
+    def make(self) -> BloomFilter:
+        bloom_filter = BloomFilter.from_capacity(expected_items=500, fp_rate=0.01)
+        bloom_filter.add_many(f"user-{i}" for i in range(500))
+        return bloom_filter
+
+    @pytest.mark.parametrize("mmap_mode", [None, "r", "r+"])
+    def test_save_load_roundtrip(self, tmp_path, mmap_mode) -> None:
+        """Завантажений фільтр має ті самі біти, лічильники й параметри."""
+        bloom_filter = self.make()
+        bloom_filter.save(tmp_path / "plain.bin")
+
+        loaded = BloomFilter.load(tmp_path / "plain.bin", mmap_mode=mmap_mode)
+        assert bytes(loaded.bit_array) == bytes(bloom_filter.bit_array)
+        assert (loaded.size, loaded.num_hashes) == (bloom_filter.size, bloom_filter.num_hashes)
+        assert (loaded.bits_set, loaded.count) == (bloom_filter.bits_set, bloom_filter.count)
+        assert (loaded.capacity, loaded.target_fp_rate) == (500, 0.01)
+        assert all(loaded.contains_many(f"user-{i}" for i in range(500)))
+        loaded.close()
+
+    def test_mmap_write_mode_persists_after_close(self, tmp_path) -> None:
+        """Зміни через mmap_mode="r+" разом із заголовком потрапляють у файл."""
+        file_path = tmp_path / "plain.bin"
+        self.make().save(file_path)
+
+        writable = BloomFilter.load(file_path, mmap_mode="r+")
+        writable.add("new-user")
+        writable.flush()
+        assert BloomFilter.load(file_path).contains("new-user")
+        writable.add("another-user")
+        writable.close()
+
+        reloaded = BloomFilter.load(file_path)
+        assert reloaded.contains("new-user") and reloaded.contains("another-user")
+        assert reloaded.count == 502
+        assert reloaded.bits_set == bin(int.from_bytes(reloaded.bit_array, "little")).count("1")
+
+    def test_unknown_mmap_mode_raises(self, tmp_path) -> None:
+        self.make().save(tmp_path / "plain.bin")
+        with pytest.raises(ValueError):
+            BloomFilter.load(tmp_path / "plain.bin", mmap_mode="w")
+
+
+class TestCombine:
+    """union/intersection звичайних фільтрів."""
+
+    def make(self, items, size: int = 2_000) -> BloomFilter:
+        bloom_filter = BloomFilter(size, 3)
+        bloom_filter.add_many(items)
+        return bloom_filter
+
+    def test_union_is_bitwise_or(self) -> None:
+        """Об'єднання містить елементи обох фільтрів і рахує встановлені біти."""
+        left = self.make(["apple", "banana"])
+        right = self.make(["banana", "cherry"])
+        merged = left.union(right)
+        expected = bytes(a | b for a, b in zip(left.bit_array, right.bit_array))
+        assert bytes(merged.bit_array) == expected
+        assert merged.contains_many(["apple", "banana", "cherry"]) == [True, True, True]
+        assert merged.bits_set == bin(int.from_bytes(expected, "little")).count("1")
+        assert merged.count == 4
+
+    def test_intersection_is_bitwise_and(self) -> None:
+        """Перетин лишає спільні елементи; count — менший із двох."""
+        left = self.make(["apple", "banana", "kiwi"])
+        right = self.make(["banana", "cherry"])
+        common = left.intersection(right)
+        expected = bytes(a & b for a, b in zip(left.bit_array, right.bit_array))
+        assert bytes(common.bit_array) == expected
+        assert common.contains("banana")
+        assert common.bits_set == bin(int.from_bytes(expected, "little")).count("1")
+        assert common.count == 2
+
+    @pytest.mark.parametrize("other", [BloomFilter(1_000, 3), BloomFilter(2_000, 4)])
+    def test_incompatible_shape_raises_value_error(self, other) -> None:
+        """Фільтри різного розміру або з різним k поєднувати не можна."""
+        with pytest.raises(ValueError):
+            self.make(["apple"]).union(other)
+        with pytest.raises(ValueError):
+            self.make(["apple"]).intersection(other)
+
+
+class TestCountingPersistence:
+    """save/load для фільтра з лічильниками зберігають лічильники, а не біти."""
+
+    @pytest.mark.parametrize("mmap_mode", [None, "r"])
+    def test_save_load_roundtrip(self, tmp_path, mmap_mode) -> None:
+        """Завантажений фільтр має ті самі лічильники й відповіді."""
+        counting_filter = CountingBloomFilter(1_001, 3)
+        counting_filter.add_many(["apple", "banana", "apple"])
+        file_path = tmp_path / "counting.bin"
+        counting_filter.save(file_path)
+
+        loaded = CountingBloomFilter.load(file_path, mmap_mode=mmap_mode)
+        assert bytes(loaded.counters) == bytes(counting_filter.counters)
+        assert loaded.size == 1_001 and loaded.count == 3
+        assert loaded.contains("apple") and loaded.contains("banana")
+        loaded.close()
+
+    def test_loaded_filter_supports_remove(self, tmp_path) -> None:
+        """Після завантаження видалення працює, бо лічильники відновлено."""
+        counting_filter = CountingBloomFilter(1_000, 3)
+        counting_filter.add("apple")
+        counting_filter.save(tmp_path / "counting.bin")
+        loaded = CountingBloomFilter.load(tmp_path / "counting.bin")
+        assert loaded.remove("apple")
+        assert not loaded.contains("apple")
+
+    def test_file_types_are_not_interchangeable(self, tmp_path) -> None:
+        """Файл звичайного фільтра не читається як фільтр з лічильниками і навпаки."""
+        BloomFilter(100, 3).save(tmp_path / "plain.bin")
+        CountingBloomFilter(100, 3).save(tmp_path / "counting.bin")
+        with pytest.raises(ValueError):
+            CountingBloomFilter.load(tmp_path / "plain.bin")
+        with pytest.raises(ValueError):
+            BloomFilter.load(tmp_path / "counting.bin")
+
+
+class TestCountingCombine:
+    """union/intersection над лічильниками."""
+
+    def make(self, items) -> CountingBloomFilter:
+        counting_filter = CountingBloomFilter(2_000, 3)
+        counting_filter.add_many(items)
+        return counting_filter
+
+    def test_union_adds_counters(self) -> None:
+        """Об'єднання містить елементи обох фільтрів і дозволяє видалити кожен."""
+        left = self.make(["apple", "banana"])
+        right = self.make(["banana", "cherry"])
+        merged = left.union(right)
+        assert isinstance(merged, CountingBloomFilter)
+        assert merged.contains_many(["apple", "banana", "cherry"]) == [True, True, True]
+        assert merged.count == 4
+        # "banana" додано двічі — після одного видалення вона лишається
+        assert merged.remove("banana")
+        assert merged.contains("banana")
+
+    def test_union_saturates(self) -> None:
+        """Сума лічильників не перевищує MAX_COUNT."""
+        left = self.make(["apple"] * 10)
+        merged = left.union(self.make(["apple"] * 10))
+        assert max(merged._get(i) for i in range(merged.size)) == CountingBloomFilter.MAX_COUNT
+
+    def test_intersection_takes_minimum(self) -> None:
+        """Перетин лишає спільні елементи та рахує bits_set за ненульовими лічильниками."""
+        left = self.make(["apple", "banana"])
+        right = self.make(["banana", "cherry"])
+        common = left.intersection(right)
+        assert common.contains("banana")
+        assert not common.contains("apple") or not common.contains("cherry")
+        assert common.bits_set == sum(1 for i in range(common.size) if common._get(i))
+
+    @pytest.mark.parametrize("size", [1, 999, 4_001])
+    def test_combine_matches_per_counter_reference(self, size) -> None:
+        """Блокова обробка дає ті самі лічильники, що й поелементна."""
+        rng = random.Random(size)
+        left = CountingBloomFilter(size, 3)
+        right = CountingBloomFilter(size, 3)
+        for counting_filter in (left, right):
+            for index in range(size):
+                counting_filter._set(index, rng.choice([0, 0, 1, 7, 8, 15]))
+        merged = left.union(right)
+        common = left.intersection(right)
+        for index in range(size):
+            a, b = left._get(index), right._get(index)
+            assert merged._get(index) == min(a + b, CountingBloomFilter.MAX_COUNT)
+            assert common._get(index) == min(a, b)
+        assert merged.bits_set == sum(1 for i in range(size) if merged._get(i))
+        assert common.bits_set == sum(1 for i in range(size) if common._get(i))
+
+    def test_mixed_filter_types_raise_type_error(self) -> None:
+        """Звичайний фільтр і фільтр з лічильниками поєднувати не можна."""
+        plain = BloomFilter(2_000, 3)
+        counting = self.make(["apple"])
+        with pytest.raises(TypeError):
+            plain.union(counting)
+        with pytest.raises(TypeError):
+            counting.intersection(plain)
@@ -0,0 +1,69 @@
+"""
+Тести декоратора memoize: межа TTL та кешування результату -1.
+"""
+
+from memoize import memoize
+
+
+class TickingClock:
+    """Годинник, що зсувається на `step` при кожному зчитуванні часу."""
+
+    def __init__(self, step: float):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+class TestMemoizeTTL:
+    """Записи, що простигають під час звернення до кешу."""
+
+    def test_expiry_between_reads_never_leaks_miss_sentinel(self) -> None:
+        """Кожен виклик повертає результат функції, навіть якщо TTL минає посеред перевірки."""
+        clock = TickingClock(step=0.25)
+        calls = []
+
+        @memoize(maxsize=10, ttl=1.0, clock=clock)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        # кожне зчитування часу наближає запис до межі TTL, тож серед
+        # викликів обов'язково є такі, де запис простигає під час пошуку
+        results = [square(5) for _ in range(50)]
+        assert results == [25] * 50
+        info = square.cache_info()
+        assert info.hits + info.misses == 50
+        assert info.misses == len(calls) > 1
+
+    def test_entry_expires_exactly_at_deadline(self) -> None:
+        """Запис дійсний до дедлайну і вважається простроченим рівно на ньому."""
+        clock = TickingClock(step=0.0)
+        calls = []
+
+        @memoize(maxsize=10, ttl=1.0, clock=clock)
+        def double(x):
+            calls.append(x)
+            return 2 * x
+
+        assert double(3) == 6
+        clock.now = 0.999
+        assert double(3) == 6
+        clock.now = 1.0
+        assert double(3) == 6
+        assert calls == [3, 3]
+
+    def test_minus_one_result_is_cached(self) -> None:
+        """-1 — звичайний результат функції, а не ознака промаху."""
+        calls = []
+
+        @memoize(maxsize=10)
+        def negate(x):
+            calls.append(x)
+            return -x
+
+        assert negate(1) == -1
+        assert negate(1) == -1
+        assert calls == [1]
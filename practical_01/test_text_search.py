@@ -1,148 +1,39 @@
-import timeit
+import os
 
+from aho_corasick import AhoCorasick
+from text_search import (
+    boyer_moore_search,
+    kmp_search,
+    pick_patterns,
+    rabin_karp_search,
+    read_file,
+    search_aho_corasick,
+    search_each,
+)
 
-def polynomial_hash(s, base=256, modulus=101):
-    """
-    Повертає поліноміальний хеш рядка s.
-    """
-    n = len(s)
-    hash_value = 0
-    for i, char in enumerate(s):
-        power_of_base = pow(base, n - i - 1) % modulus
-        hash_value = (hash_value + ord(char) * power_of_base) % modulus
-    return hash_value
 
+def naive_find_all(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text.startswith(pattern, i)]
 
-def rabin_karp_search(main_string, substring):
-    # Довжини основного рядка та підрядка пошуку
-    substring_length = len(substring)
-    main_string_length = len(main_string)
 
-    # Базове число для хешування та модуль
-    base = 256
-    modulus = 101
-
-    # Хеш-значення для підрядка пошуку та поточного відрізка в основному рядку
-    substring_hash = polynomial_hash(substring, base, modulus)
-    current_slice_hash = polynomial_hash(main_string[:substring_length], base, modulus)
-
-    # Попереднє значення для перерахунку хешу
-    h_multiplier = pow(base, substring_length - 1) % modulus
-
-    # Проходимо крізь основний рядок
-    for i in range(main_string_length - substring_length + 1):
-        if substring_hash == current_slice_hash:
-            if main_string[i : i + substring_length] == substring:
-                return i
-
-        if i < main_string_length - substring_length:
-            current_slice_hash = (
-                current_slice_hash - ord(main_string[i]) * h_multiplier
-            ) % modulus
-            current_slice_hash = (
-                current_slice_hash * base + ord(main_string[i + substring_length])
-            ) % modulus
-            if current_slice_hash < 0:
-                current_slice_hash += modulus
-
-    return -1
-
-
-def build_shift_table(pattern):
-    """Створити таблицю зсувів для алгоритму Боєра-Мура."""
-    table = {}
-    length = len(pattern)
-    # Для кожного символу в підрядку встановлюємо зсув рівний довжині підрядка
-    for index, char in enumerate(pattern[:-1]):
-        table[char] = length - index - 1
-    # Якщо символу немає в таблиці, зсув буде дорівнювати довжині підрядка
-    table.setdefault(pattern[-1], length)
-    return table
-
-
-def boyer_moore_search(text, pattern):
-    shift_table = build_shift_table(pattern)
-    i = 0
-
-    while i <= len(text) - len(pattern):
-        j = len(pattern) - 1
-        while j >= 0 and text[i + j] == pattern[j]:
-            j -= 1
-
-        if j < 0:
-            return i  # Підрядок знайдено
-
-        # Зсув індексу i
-        i += shift_table.get(text[i + len(pattern) - 1], len(pattern))
-
-    return -1
-
-
-def compute_lps(pattern):
-    lps = [0] * len(pattern)
-    length = 0
-    i = 1
-
-    while i < len(pattern):
-        if pattern[i] == pattern[length]:
-            length += 1
-            lps[i] = length
-            i += 1
-        else:
-            if length != 0:
-                length = lps[length - 1]
-            else:
-                lps[i] = 0
-                i += 1
-
-    return lps
-
-
-def kmp_search(main_string, pattern):
-    M = len(pattern)
-    N = len(main_string)
-
-    lps = compute_lps(pattern)
-
-    i = j = 0
-
-    while i < N:
-        if pattern[j] == main_string[i]:
-            i += 1
-            j += 1
-        elif j != 0:
-            j = lps[j - 1]
-        else:
-            i += 1
-
-        if j == M:
-            return i - j
-
-    return -1  # якщо підрядок не знайдено
-
-
-def read_file(file_path):
-    with open(file_path, 'r', encoding='cp1251') as file:
-        return file.read()
+def test_search_all_finds_every_occurrence():
+    text = "abababa aba ababa"
+    for pattern in ["aba", "ababa", "a", " ", "abc"]:
+        expected = naive_find_all(text, pattern)
+        for search_func in [rabin_karp_search, boyer_moore_search, kmp_search]:
+            assert search_func(text, pattern, search_all=True) == expected
+            assert search_func(text, pattern) == (expected[0] if expected else -1)
 
-def test_search_time(func, text, pattern):
-    setup_code = f"from __main__ import {func.__name__}"
-    test_code = f"{func.__name__}(text, pattern)"
-    return timeit.timeit(test_code, setup=setup_code, globals={"text": text, "pattern": pattern}, number=10)
 
+def test_aho_corasick_matches_each_pattern_search():
+    text = read_file(os.path.join(os.path.dirname(__file__), "стаття 1.txt"))
+    patterns = pick_patterns(text, 20) + ["а", "ан", "на"]
+    expected = {pattern: naive_find_all(text, pattern) for pattern in patterns}
+    assert search_aho_corasick(text, patterns) == expected
+    assert search_each(kmp_search, text, patterns) == expected
 
-if __name__ == "__main__":
-    text = read_file("стаття 2.txt")
-    existing_pattern = "реалізація методів"
-    non_existing_pattern = "Буратіно дурачок"
-    result = []
-    for pattern in [existing_pattern, non_existing_pattern]:
-        for search_func in [rabin_karp_search, boyer_moore_search, kmp_search]:
-            time = test_search_time(search_func, text, pattern)
-            result.append((search_func.__name__, pattern, time))
 
-    # INSERT_YOUR_CODE
-    print(f"{'Алгоритм':<20} | {'Підрядок':<25} | {'Час виконання (сек)':<20}")
-    print("-" * 70)
-    for func_name, pat, exec_time in result:
-        print(f"{func_name:<20} | {pat:<25} | {exec_time:<20.6f}")
\ No newline at end of file
+def test_aho_corasick_overlapping_and_nested_patterns():
+    automaton = AhoCorasick(["he", "she", "his", "hers"])
+    assert sorted(automaton.iter_matches("ushers")) == [(1, "she"), (2, "he"), (2, "hers")]
+    assert list(AhoCorasick(["aa"]).iter_matches("aaaa")) == [(0, "aa"), (1, "aa"), (2, "aa")]
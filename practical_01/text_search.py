@@ -0,0 +1,225 @@
+import timeit
+
+from aho_corasick import AhoCorasick
+
+
+def polynomial_hash(s, base=256, modulus=101):
+    """
+    Повертає поліноміальний хеш рядка s.
+    """
+    n = len(s)
+    hash_value = 0
+    for i, char in enumerate(s):
+        power_of_base = pow(base, n - i - 1) % modulus
+        hash_value = (hash_value + ord(char) * power_of_base) % modulus
+    return hash_value
+
+
+def rabin_karp_search(main_string, substring, search_all=False):
+    # Довжини основного рядка та підрядка пошуку
+    substring_length = len(substring)
+    main_string_length = len(main_string)
+
+    # Базове число для хешування та модуль
+    base = 256
+    modulus = 101
+
+    # Хеш-значення для підрядка пошуку та поточного відрізка в основному рядку
+    substring_hash = polynomial_hash(substring, base, modulus)
+    current_slice_hash = polynomial_hash(main_string[:substring_length], base, modulus)
+
+    # Попереднє значення для перерахунку хешу
+    h_multiplier = pow(base, substring_length - 1) % modulus
+
+    # Усі знайдені позиції, якщо search_all=True
+    matches = []
+
+    # Проходимо крізь основний рядок
+    for i in range(main_string_length - substring_length + 1):
+        if substring_hash == current_slice_hash:
+            if main_string[i : i + substring_length] == substring:
+                if not search_all:
+                    return i
+                matches.append(i)
+
+        if i < main_string_length - substring_length:
+            current_slice_hash = (
+                current_slice_hash - ord(main_string[i]) * h_multiplier
+            ) % modulus
+            current_slice_hash = (
+                current_slice_hash * base + ord(main_string[i + substring_length])
+            ) % modulus
+            if current_slice_hash < 0:
+                current_slice_hash += modulus
+
+    return matches if search_all else -1
+
+
+def build_shift_table(pattern):
+    """Створити таблицю зсувів для алгоритму Боєра-Мура."""
+    table = {}
+    length = len(pattern)
+    # Для кожного символу в підрядку встановлюємо зсув рівний довжині підрядка
+    for index, char in enumerate(pattern[:-1]):
+        table[char] = length - index - 1
+    # Якщо символу немає в таблиці, зсув буде дорівнювати довжині підрядка
+    table.setdefault(pattern[-1], length)
+    return table
+
+
+def boyer_moore_search(text, pattern, search_all=False):
+    shift_table = build_shift_table(pattern)
+    m = len(pattern)
+    last = len(text) - m
+    i = 0
+    matches = []
+
+    while i <= last:
+        j = m - 1
+        while j >= 0 and text[i + j] == pattern[j]:
+            j -= 1
+
+        if j < 0:
+            if not search_all:
+                return i  # Підрядок знайдено
+            matches.append(i)
+
+        # Зсув індексу i (після збігу теж безпечний: входження, що
+        # перекриваються, не пропускаються)
+        i += shift_table.get(text[i + m - 1], m)
+
+    return matches if search_all else -1
+
+
+def compute_lps(pattern):
+    lps = [0] * len(pattern)
+    length = 0
+    i = 1
+
+    while i < len(pattern):
+        if pattern[i] == pattern[length]:
+            length += 1
+            lps[i] = length
+            i += 1
+        else:
+            if length != 0:
+                length = lps[length - 1]
+            else:
+                lps[i] = 0
+                i += 1
+
+    return lps
+
+
+def kmp_search(main_string, pattern, search_all=False):
+    M = len(pattern)
+    N = len(main_string)
+
+    lps = compute_lps(pattern)
+
+    i = j = 0
+    matches = []
+
+    while i < N:
+        if pattern[j] == main_string[i]:
+            i += 1
+            j += 1
+        elif j != 0:
+            j = lps[j - 1]
+        else:
+            i += 1
+
+        if j == M:
+            if not search_all:
+                return i - j
+            matches.append(i - j)
+            # продовжуємо з найдовшого власного префікса-суфікса
+            j = lps[j - 1]
+
+    return matches if search_all else -1  # якщо підрядок не знайдено
+
+
+def read_file(file_path):
+    with open(file_path, 'r', encoding='cp1251') as file:
+        return file.read()
+
+
+def test_search_time(func, text, pattern):
+    setup_code = f"from __main__ import {func.__name__}"
+    test_code = f"{func.__name__}(text, pattern)"
+    return timeit.timeit(test_code, setup=setup_code, globals={"text": text, "pattern": pattern}, number=10)
+
+
+def search_each(func, text, patterns):
+    """Пошук усіх входжень кожного шаблону окремим проходом по тексту."""
+    return {pattern: func(text, pattern, search_all=True) for pattern in patterns}
+
+
+def search_aho_corasick(text, patterns):
+    """Пошук усіх входжень усіх шаблонів одним проходом автомата."""
+    matches = {pattern: [] for pattern in patterns}
+    for position, pattern in AhoCorasick(patterns).iter_matches(text):
+        matches[pattern].append(position)
+    return matches
+
+
+def pick_patterns(text, count):
+    """Слова та пари слів з тексту як шаблони, плюс один відсутній."""
+    words = text.split()
+    candidates = dict.fromkeys(words[i] + " " + words[i + 1] for i in range(0, len(words) - 1, 3))
+    candidates = [pattern for pattern in candidates if len(pattern) > 5]
+    return candidates[: count - 1] + ["Буратіно дурачок"]
+
+
+def benchmark_multi_search(text, patterns, max_single_patterns=100):
+    """Час пошуку набору шаблонів: окремі алгоритми проти Ахо–Корасік."""
+    row = {}
+    for search_func in [rabin_karp_search, boyer_moore_search, kmp_search]:
+        if len(patterns) > max_single_patterns:
+            row[search_func.__name__] = None  # надто довго для окремих проходів
+            continue
+        row[search_func.__name__] = timeit.timeit(
+            lambda: search_each(search_func, text, patterns), number=1
+        )
+    row["aho_corasick"] = timeit.timeit(lambda: search_aho_corasick(text, patterns), number=1)
+    return row
+
+
+if __name__ == "__main__":
+    text = read_file("стаття 2.txt")
+    existing_pattern = "реалізація методів"
+    non_existing_pattern = "Буратіно дурачок"
+    result = []
+    for pattern in [existing_pattern, non_existing_pattern]:
+        for search_func in [rabin_karp_search, boyer_moore_search, kmp_search]:
+            time = test_search_time(search_func, text, pattern)
+            result.append((search_func.__name__, pattern, time))
+
+    # INSERT_YOUR_CODE
+    print(f"{'Алгоритм':<20} | {'Підрядок':<25} | {'Час виконання (сек)':<20}")
+    print("-" * 70)
+    for func_name, pat, exec_time in result:
+        print(f"{func_name:<20} | {pat:<25} | {exec_time:<20.6f}")
+
+    # Пошук усіх входжень набору шаблонів залежно від їх кількості та розміру тексту
+    texts = {
+        "стаття 1": read_file("стаття 1.txt"),
+        "стаття 2": read_file("стаття 2.txt"),
+    }
+    texts["обидві x4"] = (texts["стаття 1"] + texts["стаття 2"]) * 4
+
+    columns = ["rabin_karp_search", "boyer_moore_search", "kmp_search", "aho_corasick"]
+    print()
+    print(f"{'Текст':<10} | {'Символів':<8} | {'Шаблонів':<8} | " + " | ".join(f"{c:<18}" for c in columns))
+    print("-" * 120)
+    for text_name, text in texts.items():
+        for count in [1, 10, 100, 1000]:
+            patterns = pick_patterns(text, count)
+            expected = search_each(boyer_moore_search, text, patterns[:10])
+            found = search_aho_corasick(text, patterns)
+            assert all(found[pattern] == positions for pattern, positions in expected.items())
+            row = benchmark_multi_search(text, patterns)
+            cells = " | ".join(
+                f"{'—' if row[c] is None else format(row[c], '.6f'):<18}" for c in columns
+            )
+            print(f"{text_name:<10} | {len(text):<8} | {len(patterns):<8} | {cells}")
\ No newline at end of file
@@ -2,20 +2,31 @@
 Візуалізація алгоритму Едмондса-Карпа - максимально просто
 """
 
-import matplotlib.pyplot as plt
-import networkx as nx
+import random
+import sys
+import time
+import tracemalloc
 from collections import deque, defaultdict
-from matplotlib.widgets import Button
-from matplotlib.patches import Patch
-from matplotlib.lines import Line2D
 
 
 class EdmondsKarp:
-    def __init__(self):
+    def __init__(self, capture="full"):
+        """
+        capture="full" — після кожної ітерації зберігається копія всього потоку
+        (зручно для маленьких навчальних графів).
+        capture="delta" — зберігаються лише шлях і вузьке місце кожної ітерації,
+        а стан будь-якого кроку відтворюється на вимогу через get_step/flow_at.
+        """
+        if capture not in ("full", "delta"):
+            raise ValueError(f"невідомий режим запису: {capture}")
+        self.capture = capture
         self.graph = defaultdict(dict)
         self.original = {}
         self.steps = []
+        self.deltas = []  # (шлях, вузьке місце) кожної ітерації
+        self.max_flow = 0
         self.flow = defaultdict(lambda: defaultdict(int))  # Фактичний потік
+        self._replay_state = None  # (номер ітерації, потік) останнього відтворення
 
     def add_edge(self, u, v, cap):
         self.graph[u][v] = cap
@@ -45,22 +56,8 @@ class EdmondsKarp:
         iteration = 0
 
         # Початковий стан
-        self.steps.append(
-            {
-                "iter": 0,
-                "title": "ПОЧАТКОВИЙ СТАН",
-                "desc": "Всі ребра мають початкові пропускні здатності.\n"
-                "Мітки на ребрах: використано/загальна пропускна здатність.\n\n"
-                "S (зелена) = джерело (source) - звідки йде потік\n"
-                "T (рожева) = стік (sink) - куди йде потік\n\n"
-                "Зараз всі ребра показують 0/X (нічого не використано).\n"
-                "Знайдемо шлях від S до T і пропустимо через нього потік.",
-                "path": [],
-                "min_cap": 0,
-                "total": 0,
-                "flow": {k: dict(v) for k, v in self.flow.items()},
-            }
-        )
+        if self.capture == "full":
+            self.steps.append(self._initial_step(self._copy_flow(self.flow)))
 
         while self.bfs(src, sink, parent):
             iteration += 1
@@ -97,46 +94,74 @@ class EdmondsKarp:
                 v = u
 
             max_flow += min_cap
+            self.deltas.append((path, min_cap))
+            if self.capture == "full":
+                self.steps.append(
+                    self._iteration_step(iteration, path, min_cap, max_flow, self._copy_flow(self.flow))
+                )
+            parent = {}
 
-            # Пояснення для зворотніх ребер
-            has_reverse = any((u, v) not in self.original for (u, v) in path)
-            reverse_note = ""
-            if has_reverse:
-                reverse_note = "\n[!] Цей шлях використовує зворотне ребро!\n(Алгоритм 'відміняє' частину попереднього потоку)"
+        self.max_flow = max_flow
+        # Фінальний стан
+        if self.capture == "full":
+            self.steps.append(self._final_step(self._copy_flow(self.flow)))
 
-            # Детальний опис змін на ребрах
-            changes_desc = "\n\n─── Зміни на ребрах ───\n"
-            for u, v in path:
-                if (u, v) in self.original:
-                    prev = (
-                        self.steps[-1]["flow"].get(u, {}).get(v, 0)
-                        if len(self.steps) > 0
-                        else 0
-                    )
-                    new = self.flow[u][v]
-                    changes_desc += f"{u} → {v}: {prev} → {new} (+{min_cap})\n"
-
-            self.steps.append(
-                {
-                    "iter": iteration,
-                    "title": f"ІТЕРАЦІЯ {iteration}",
-                    "desc": f'Знайдено шлях (ЧЕРВОНІ стрілки): {" → ".join(str(e[0]) for e in path)} → {path[-1][1]}\n\n'
-                    f"Мінімальна пропускна здатність на шляху: {min_cap}\n"
-                    f"(найменше значення серед ребер на шляху)\n\n"
-                    f"Додаємо потік +{min_cap} до кожного ребра шляху.\n"
-                    f"Червоні мітки показують (+приріст).{reverse_note}"
-                    f"{changes_desc}\n"
-                    f"Загальний акумульований потік: {max_flow}",
-                    "path": path,
-                    "min_cap": min_cap,
-                    "total": max_flow,
-                    "flow": {k: dict(v) for k, v in self.flow.items()},
-                }
-            )
-            parent = {}
+        return max_flow
 
+    @staticmethod
+    def _copy_flow(flow):
+        return {k: dict(v) for k, v in flow.items()}
+
+    def _initial_step(self, flow):
+        return {
+            "iter": 0,
+            "title": "ПОЧАТКОВИЙ СТАН",
+            "desc": "Всі ребра мають початкові пропускні здатності.\n"
+            "Мітки на ребрах: використано/загальна пропускна здатність.\n\n"
+            "S (зелена) = джерело (source) - звідки йде потік\n"
+            "T (рожева) = стік (sink) - куди йде потік\n\n"
+            "Зараз всі ребра показують 0/X (нічого не використано).\n"
+            "Знайдемо шлях від S до T і пропустимо через нього потік.",
+            "path": [],
+            "min_cap": 0,
+            "total": 0,
+            "flow": flow,
+        }
+
+    def _iteration_step(self, iteration, path, min_cap, total, flow):
+        # Пояснення для зворотніх ребер
+        has_reverse = any((u, v) not in self.original for (u, v) in path)
+        reverse_note = ""
+        if has_reverse:
+            reverse_note = "\n[!] Цей шлях використовує зворотне ребро!\n(Алгоритм 'відміняє' частину попереднього потоку)"
+
+        # Детальний опис змін на ребрах: шлях простий, тож кожне ребро
+        # отримало рівно +min_cap відносно попереднього кроку
+        changes_desc = "\n\n─── Зміни на ребрах ───\n"
+        for u, v in path:
+            if (u, v) in self.original:
+                new = flow.get(u, {}).get(v, 0)
+                changes_desc += f"{u} → {v}: {new - min_cap} → {new} (+{min_cap})\n"
+
+        return {
+            "iter": iteration,
+            "title": f"ІТЕРАЦІЯ {iteration}",
+            "desc": f'Знайдено шлях (ЧЕРВОНІ стрілки): {" → ".join(str(e[0]) for e in path)} → {path[-1][1]}\n\n'
+            f"Мінімальна пропускна здатність на шляху: {min_cap}\n"
+            f"(найменше значення серед ребер на шляху)\n\n"
+            f"Додаємо потік +{min_cap} до кожного ребра шляху.\n"
+            f"Червоні мітки показують (+приріст).{reverse_note}"
+            f"{changes_desc}\n"
+            f"Загальний акумульований потік: {total}",
+            "path": path,
+            "min_cap": min_cap,
+            "total": total,
+            "flow": flow,
+        }
+
+    def _final_step(self, flow):
         # Підраховуємо скільки ребер використано
-        used_edges = sum(1 for (u, v) in self.original.keys() if self.flow[u][v] > 0)
+        used_edges = sum(1 for (u, v) in self.original.keys() if flow.get(u, {}).get(v, 0) > 0)
         total_edges = len(self.original)
 
         edge_note = ""
@@ -145,30 +170,90 @@ class EdmondsKarp:
         else:
             edge_note = f"\n\n{used_edges} з {total_edges} ребер використовуються (зелені).\nСірі ребра не беруть участі в потоці."
 
-        # Фінальний стан
-        self.steps.append(
-            {
-                "iter": len(self.steps),
-                "title": "РЕЗУЛЬТАТ",
-                "desc": f"Більше немає шляхів від S до T.\n"
-                f"Алгоритм завершено.\n\n"
-                f"═══ МАКСИМАЛЬНИЙ ПОТІК = {max_flow} ═══\n\n"
-                f"ЗЕЛЕНІ СТРІЛКИ = ребра через які йде потік (> 0)\n"
-                f"Товщина стрілки пропорційна потоку\n"
-                f"СІРІ стрілки = ребра без потоку{edge_note}\n\n"
-                f"Потік виходить з джерела S = {max_flow}\n"
-                f"Потік входить в стік T = {max_flow}",
-                "path": [],
-                "min_cap": 0,
-                "total": max_flow,
-                "flow": {k: dict(v) for k, v in self.flow.items()},
-            }
-        )
-
-        return max_flow
-
-    def visualize_interactive(self):
-        """Інтерактивна візуалізація з кнопками"""
+        max_flow = self.max_flow
+        return {
+            "iter": len(self.deltas) + 1,
+            "title": "РЕЗУЛЬТАТ",
+            "desc": f"Більше немає шляхів від S до T.\n"
+            f"Алгоритм завершено.\n\n"
+            f"═══ МАКСИМАЛЬНИЙ ПОТІК = {max_flow} ═══\n\n"
+            f"ЗЕЛЕНІ СТРІЛКИ = ребра через які йде потік (> 0)\n"
+            f"Товщина стрілки пропорційна потоку\n"
+            f"СІРІ стрілки = ребра без потоку{edge_note}\n\n"
+            f"Потік виходить з джерела S = {max_flow}\n"
+            f"Потік входить в стік T = {max_flow}",
+            "path": [],
+            "min_cap": 0,
+            "total": max_flow,
+            "flow": flow,
+        }
+
+    def _apply_delta(self, flow, path, min_cap):
+        for u, v in path:
+            if (u, v) in self.original:
+                flow[u][v] += min_cap
+            else:
+                flow[v][u] -= min_cap
+
+    def iter_flows(self):
+        """
+        Headless-відтворення: видає (номер ітерації, шлях, вузьке місце,
+        сумарний потік, потік) для кожної ітерації, застосовуючи дельти по черзі.
+        Потік — один і той самий словник, що оновлюється на місці;
+        щоб зберегти стан кроку, його треба скопіювати.
+        """
+        flow = defaultdict(lambda: defaultdict(int))
+        total = 0
+        for iteration, (path, min_cap) in enumerate(self.deltas, start=1):
+            self._apply_delta(flow, path, min_cap)
+            total += min_cap
+            yield iteration, path, min_cap, total, flow
+
+    def flow_at(self, iteration):
+        """
+        Потік після вказаної кількості ітерацій. Відтворення продовжується
+        з останнього запитаного кроку, тож перехід на крок уперед коштує O(шлях).
+        """
+        if not 0 <= iteration <= len(self.deltas):
+            raise IndexError(f"ітерації {iteration} немає")
+        if self._replay_state is None or self._replay_state[0] > iteration:
+            self._replay_state = (0, defaultdict(lambda: defaultdict(int)))
+        done, flow = self._replay_state
+        for path, min_cap in self.deltas[done:iteration]:
+            self._apply_delta(flow, path, min_cap)
+        self._replay_state = (iteration, flow)
+        return self._copy_flow(flow)
+
+    def num_steps(self):
+        """Кількість кроків: початковий стан, ітерації та результат."""
+        if self.capture == "full":
+            return len(self.steps)
+        return len(self.deltas) + 2
+
+    def get_step(self, index):
+        """Крок у тому самому форматі, що й елементи self.steps."""
+        if self.capture == "full":
+            return self.steps[index]
+        if not 0 <= index < self.num_steps():
+            raise IndexError(f"кроку {index} немає")
+        if index == 0:
+            return self._initial_step({})
+        if index > len(self.deltas):
+            return self._final_step(self.flow_at(len(self.deltas)))
+        path, min_cap = self.deltas[index - 1]
+        total = sum(cap for _, cap in self.deltas[:index])
+        return self._iteration_step(index, path, min_cap, total, self.flow_at(index))
+
+    def visualize_interactive(self, step_indices=None):
+        """
+        Інтерактивна візуалізація з кнопками.
+        step_indices — які кроки показувати (за замовчуванням усі); у режимі
+        capture="delta" стан кожного показаного кроку відтворюється на вимогу.
+        """
+        import matplotlib.pyplot as plt
+        from matplotlib.widgets import Button
+
+        self.step_indices = list(range(self.num_steps())) if step_indices is None else list(step_indices)
         self.current_step = 0
 
         self.fig = plt.figure(figsize=(16, 12))
@@ -196,7 +281,12 @@ class EdmondsKarp:
 
     def update_plot(self):
         """Оновлює графік для поточного кроку"""
-        step = self.steps[self.current_step]
+        import networkx as nx
+        from matplotlib.lines import Line2D
+        from matplotlib.patches import Patch
+
+        step_index = self.step_indices[self.current_step]
+        step = self.get_step(step_index)
 
         self.ax_graph.clear()
         self.ax_text.clear()
@@ -242,10 +332,9 @@ class EdmondsKarp:
 
             is_in_path = (u, v) in step["path"]
 
-            # Отримуємо попередній потік для показу приросту
-            if step["iter"] > 0 and not is_final_step:
-                prev_flow = self.steps[step["iter"] - 1]["flow"].get(u, {}).get(v, 0)
-                flow_delta = flow_value - prev_flow
+            # Приріст: шлях простий, тож кожне його оригінальне ребро отримало рівно +min_cap
+            if is_in_path and not is_final_step:
+                flow_delta = step["min_cap"]
             else:
                 flow_delta = 0
 
@@ -322,7 +411,7 @@ class EdmondsKarp:
                 bbox=bbox_props,
             )
 
-        title = f"{step['title']} (Крок {self.current_step}/{len(self.steps)-1})"
+        title = f"{step['title']} (Крок {step_index}/{self.num_steps()-1})"
         self.ax_graph.set_title(title, fontsize=18, fontweight="bold", pad=20)
         self.ax_graph.axis("off")
         self.ax_graph.set_xlim(-0.3, 2.3)
@@ -429,13 +518,13 @@ class EdmondsKarp:
 
         # Оновлюємо стан кнопок
         self.btn_prev.ax.set_visible(self.current_step > 0)
-        self.btn_next.ax.set_visible(self.current_step < len(self.steps) - 1)
+        self.btn_next.ax.set_visible(self.current_step < len(self.step_indices) - 1)
 
         self.fig.canvas.draw()
 
     def next_step(self, event):
         """Наступний крок"""
-        if self.current_step < len(self.steps) - 1:
+        if self.current_step < len(self.step_indices) - 1:
             self.current_step += 1
             self.update_plot()
 
@@ -446,6 +535,74 @@ class EdmondsKarp:
             self.update_plot()
 
 
+def build_layered_network(ek, num_layers, width, degree, seed=42):
+    """
+    Шарова мережа S → шари → T з випадковими пропускними здатностями.
+
+    Ребра від S і до T мають запас пропускної здатності, тож мінімальний
+    розріз проходить серединою мережі. Там найкоротші шляхи BFS змагаються
+    за ті самі ребра, і пізніші довші шляхи частину ітерацій проходять через
+    зворотні ребра залишкової мережі, скасовуючи раніше пущений потік.
+    """
+    rng = random.Random(seed)
+    layers = [["S"]] + [[f"{i}_{j}" for j in range(width)] for i in range(num_layers)] + [["T"]]
+    for current, following in zip(layers, layers[1:]):
+        for u in current:
+            if u == "S" or following == ["T"]:
+                # джерело і стік з'єднані з усім шаром і не бувають вузьким місцем
+                for v in following:
+                    ek.add_edge(u, v, 20 * degree)
+            else:
+                for v in rng.sample(following, degree):
+                    ek.add_edge(u, v, rng.randint(1, 20))
+        # ребра між сусідніми вершинами шару — обхідні шляхи в межах шару
+        for u, v in zip(current, current[1:]):
+            ek.add_edge(v, u, rng.randint(1, 5))
+    return ek
+
+
+def compare_capture_modes(num_layers=20, width=40, degree=4):
+    """Повний запис кроків проти запису дельт на великій мережі, без графіки."""
+    print("ВЕЛИКА МЕРЕЖА: ПОВНИЙ ЗАПИС ПРОТИ ДЕЛЬТ")
+    print("-" * 70)
+    results = {}
+    for capture in ["full", "delta"]:
+        ek = build_layered_network(EdmondsKarp(capture), num_layers, width, degree)
+        tracemalloc.start()
+        start = time.perf_counter()
+        max_flow = ek.run("S", "T")
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[capture] = ek
+        print(
+            f"{capture:<6}: ребер {len(ek.original)}, ітерацій {len(ek.deltas)}, "
+            f"потік {max_flow}, час {elapsed:.3f} с, пік пам'яті {peak / 2**20:.1f} МБ"
+        )
+
+    full, delta = results["full"], results["delta"]
+    assert full.max_flow == delta.max_flow and full.num_steps() == delta.num_steps()
+    for index in sorted({0, 1, delta.num_steps() // 2, delta.num_steps() - 1}):
+        expected = {u: {v: f for v, f in row.items() if f} for u, row in full.steps[index]["flow"].items()}
+        replayed = {u: {v: f for v, f in row.items() if f} for u, row in delta.get_step(index)["flow"].items()}
+        assert {u: row for u, row in expected.items() if row} == {u: row for u, row in replayed.items() if row}
+        assert full.steps[index]["desc"] == delta.get_step(index)["desc"]
+
+    # headless-аналіз: ітерації, що скасовують потік через зворотні ребра,
+    # і ітерації з найбільшим приростом — їх і варто малювати
+    with_reverse = [
+        iteration
+        for iteration, path, _, _, _ in delta.iter_flows()
+        if any(edge not in delta.original for edge in path)
+    ]
+    largest = sorted(range(1, len(delta.deltas) + 1), key=lambda i: -delta.deltas[i - 1][1])[:5]
+    print(f"Ітерацій зі зворотними ребрами: {len(with_reverse)} {with_reverse[:10]}")
+    print(f"Найбільші прирости на ітераціях: {sorted(largest)}")
+    print(f"Показати лише їх: visualize_interactive(step_indices={[0, *sorted(largest), delta.num_steps() - 1]})")
+    print("-" * 70)
+    print()
+
+
 def main():
     print("\n" + "=" * 70)
     print(" АЛГОРИТМ ЕДМОНДСА-КАРПА - ПОКРОКОВЕ ПОЯСНЕННЯ")
@@ -489,7 +646,8 @@ def main():
     print("-" * 70)
     print(f"МАКСИМАЛЬНИЙ ПОТІК: {max_flow}")
     print("-" * 70)
-    print(f"\nКількість ітерацій: {len(ek.steps) - 2}")  # без початку та кінця
+    print(f"\nКількість ітерацій: {len(ek.deltas)}")
+    print("Порівняння режимів запису на великій мережі: --benchmark")
     print()
 
     print("ПОКАЗУЮ ІНТЕРАКТИВНУ ВІЗУАЛІЗАЦІЮ...")
@@ -504,4 +662,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if "--benchmark" in sys.argv[1:]:
+        compare_capture_modes()
+    else:
+        main()
@@ -0,0 +1,477 @@
+import random
+import time
+from array import array
+from collections import deque
+
+
+class FlowNetwork:
+    """
+    Мережа для багаторазових запитів максимального потоку.
+
+    Граф будується один раз у компактному CSR-вигляді (compressed sparse row):
+    дуги кожної вершини лежать поспіль у цілочисельних масивах, а вершина u
+    володіє дугами start[u] .. start[u + 1] - 1. Кожне ребро дає пряму дугу з
+    його пропускною здатністю та зворотну з нулем; rev[a] — номер парної дуги.
+    Для кожного запиту копіюється лише масив залишкових пропускних здатностей,
+    а структура графа та словник імен вершин використовуються повторно.
+    """
+
+    def __init__(self, edges, nodes=None):
+        edges = list(edges)
+        self.nodes = list(nodes) if nodes is not None else []
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        for u, v, _ in edges:
+            for node in (u, v):
+                if node not in self.index:
+                    self.index[node] = len(self.nodes)
+                    self.nodes.append(node)
+        n = len(self.nodes)
+        self.num_nodes = n
+        self.edges = [(self.index[u], self.index[v], capacity) for u, v, capacity in edges]
+
+        # кількість дуг кожної вершини -> зміщення початку її дуг
+        degree = [0] * (n + 1)
+        for u, v, _ in self.edges:
+            degree[u + 1] += 1
+            degree[v + 1] += 1
+        for i in range(n):
+            degree[i + 1] += degree[i]
+        self.start = array("i", degree)
+
+        typecode = "q" if all(isinstance(c, int) for _, _, c in self.edges) else "d"
+        num_arcs = 2 * len(self.edges)
+        self.head = array("i", [0]) * num_arcs
+        self.rev = array("i", [0]) * num_arcs
+        self.capacity = array(typecode, [0]) * num_arcs
+        self.edge_arc = array("i", [0]) * len(self.edges)  # пряма дуга кожного ребра
+        position = list(degree[:n])
+        for e, (u, v, capacity) in enumerate(self.edges):
+            forward, backward = position[u], position[v]
+            position[u] += 1
+            position[v] += 1
+            self.head[forward], self.head[backward] = v, u
+            self.rev[forward], self.rev[backward] = backward, forward
+            self.capacity[forward] = capacity
+            self.edge_arc[e] = forward
+
+    @classmethod
+    def from_networkx(cls, graph, capacity: str = "capacity") -> "FlowNetwork":
+        return cls(graph.edges.data(capacity), nodes=graph.nodes)
+
+    def _residual(self):
+        return list(self.capacity)
+
+    def _dinic(self, source: int, sink: int, residual, limit=None) -> int:
+        """
+        Алгоритм Дініца: BFS будує шарову мережу, DFS шукає в ній блокуючий потік.
+
+        Працює з будь-яким залишковим графом, тож може лише доповнювати вже
+        наявний потік; limit обмежує, скільки одиниць потоку додати.
+        """
+        n, start, head, rev = self.num_nodes, self.start, self.head, self.rev
+        total = 0
+        while True:
+            level = [-1] * n
+            level[source] = 0
+            queue = deque([source])
+            while queue:
+                u = queue.popleft()
+                for a in range(start[u], start[u + 1]):
+                    v = head[a]
+                    if residual[a] > 0 and level[v] < 0:
+                        level[v] = level[u] + 1
+                        queue.append(v)
+            if level[sink] < 0 or total == limit:
+                return total
+
+            current_arc = list(start)  # наступна дуга для перегляду в кожній вершині
+            path = []  # дуги поточного шляху від джерела
+            u = source
+            while True:
+                if u == sink:
+                    bottleneck = min(residual[a] for a in path)
+                    if limit is not None:
+                        bottleneck = min(bottleneck, limit - total)
+                    for a in path:
+                        residual[a] -= bottleneck
+                        residual[rev[a]] += bottleneck
+                    total += bottleneck
+                    if total == limit:
+                        return total
+                    path.clear()
+                    u = source
+                    continue
+                end = start[u + 1]
+                a = current_arc[u]
+                while a < end and not (residual[a] > 0 and level[head[a]] == level[u] + 1):
+                    a += 1
+                current_arc[u] = a
+                if a < end:
+                    path.append(a)
+                    u = head[a]
+                    continue
+                # глухий кут: вершина більше не потрібна в цій фазі
+                if u == source:
+                    break
+                level[u] = -1
+                a = path.pop()
+                u = head[rev[a]]
+                current_arc[u] += 1
+
+    def _push_relabel(self, source: int, sink: int, residual) -> int:
+        """Проштовхування передпотоку (FIFO) з евристикою розриву (gap)."""
+        n, start, head, rev = self.num_nodes, self.start, self.head, self.rev
+        height = [0] * n
+        excess = [0] * n
+        count = [0] * (2 * n + 1)  # скільки вершин на кожній висоті
+        height[source] = n
+        count[0] = n - 1
+        count[n] = 1
+        active = deque()
+        for a in range(start[source], start[source + 1]):
+            pushed = residual[a]
+            if pushed > 0:
+                v = head[a]
+                residual[a] = 0
+                residual[rev[a]] += pushed
+                excess[v] += pushed
+                excess[source] -= pushed
+                if v != sink and excess[v] == pushed:
+                    active.append(v)
+        current_arc = list(start)
+        while active:
+            u = active.popleft()
+            end = start[u + 1]
+            while excess[u] > 0:
+                a = current_arc[u]
+                if a == end:
+                    # підняття: на 1 вище за найнижчого сусіда із залишковою дугою
+                    old_height = height[u]
+                    new_height = 2 * n
+                    for b in range(start[u], end):
+                        if residual[b] > 0 and height[head[b]] + 1 < new_height:
+                            new_height = height[head[b]] + 1
+                    count[old_height] -= 1
+                    height[u] = new_height
+                    count[new_height] += 1
+                    current_arc[u] = start[u]
+                    if count[old_height] == 0 and old_height < n:
+                        # розрив: вершини вище за порожній рівень не досягнуть стоку
+                        for v in range(n):
+                            if old_height < height[v] < n:
+                                count[height[v]] -= 1
+                                height[v] = n + 1
+                                count[n + 1] += 1
+                    continue
+                v = head[a]
+                if residual[a] > 0 and height[u] == height[v] + 1:
+                    pushed = min(excess[u], residual[a])
+                    residual[a] -= pushed
+                    residual[rev[a]] += pushed
+                    excess[u] -= pushed
+                    if v != source and v != sink and excess[v] == 0:
+                        active.append(v)
+                    excess[v] += pushed
+                else:
+                    current_arc[u] = a + 1
+        return excess[sink]
+
+    ALGORITHMS = {"dinic": _dinic, "push_relabel": _push_relabel}
+
+    def solve(self, source, sink, algorithm: str = "dinic"):
+        """Повертає (максимальний потік, масив залишкових пропускних здатностей)."""
+        try:
+            run = self.ALGORITHMS[algorithm]
+        except KeyError:
+            raise ValueError(f"невідомий алгоритм: {algorithm}") from None
+        residual = self._residual()
+        s, t = self.index[source], self.index[sink]
+        if s == t:
+            raise ValueError("джерело та стік мають відрізнятися")
+        return run(self, s, t, residual), residual
+
+    def max_flow(self, source, sink, algorithm: str = "dinic"):
+        return self.solve(source, sink, algorithm)[0]
+
+    def edge_flows(self, residual, capacity=None) -> dict:
+        """Потік через кожне ребро: {(u, v): потік}; паралельні ребра підсумовуються."""
+        nodes = self.nodes
+        capacity = self.capacity if capacity is None else capacity
+        flows = {}
+        for (u, v, _), a in zip(self.edges, self.edge_arc):
+            key = (nodes[u], nodes[v])
+            flows[key] = flows.get(key, 0) + capacity[a] - residual[a]
+        return flows
+
+    def flow_table(self, sources, sinks, algorithm: str = "dinic") -> dict:
+        """Максимальний потік для кожної пари {(джерело, стік): потік} за один виклик."""
+        return {
+            (source, sink): self.max_flow(source, sink, algorithm)
+            for source in sources
+            for sink in sinks
+        }
+
+    def multi_source_flow(self, sources, sinks, algorithm: str = "dinic"):
+        """
+        Один розв'язок для всіх джерел і стоків разом.
+
+        До мережі додаються суперджерело (ребра до кожного джерела) та суперстік
+        (ребра від кожного стоку) з необмеженою пропускною здатністю, і
+        максимальний потік шукається один раз. Потім він розкладається на шляхи,
+        тож таблиця {(джерело, стік): потік} узгоджена: усі її значення можна
+        реалізувати одночасно, на відміну від максимумів окремих пар.
+
+        Повертає (загальний потік, таблиця, список (шлях, потік)).
+        """
+        unlimited = sum(self.capacity) + 1
+        edges = [(self.nodes[u], self.nodes[v], capacity) for u, v, capacity in self.edges]
+        edges += [(SUPER_SOURCE, source, unlimited) for source in sources]
+        edges += [(sink, SUPER_SINK, unlimited) for sink in sinks]
+        extended = FlowNetwork(edges, nodes=self.nodes)
+        total, residual = extended.solve(SUPER_SOURCE, SUPER_SINK, algorithm)
+        paths = decompose_flow(extended.edge_flows(residual), SUPER_SOURCE, SUPER_SINK)
+
+        table = {(source, sink): 0 for source in sources for sink in sinks}
+        result_paths = []
+        for path, amount in paths:
+            path = path[1:-1]  # без суперджерела та суперстоку
+            table[(path[0], path[-1])] += amount
+            result_paths.append((path, amount))
+        return total, table, result_paths
+
+
+class _SuperNode:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+SUPER_SOURCE = _SuperNode("SUPER_SOURCE")
+SUPER_SINK = _SuperNode("SUPER_SINK")
+
+
+def decompose_flow(edge_flows: dict, source, sink) -> list:
+    """
+    Розкладає потік {(u, v): потік} на шляхи source → sink: [(шлях, потік)].
+
+    Кожен крок іде по ребрах з додатним потоком до стоку й віднімає вузьке
+    місце шляху. Якщо обхід повертається у вже відвідану вершину, знайдений
+    цикл лише скасовується: він не переносить потік від джерела до стоку.
+    """
+    outgoing = {}
+    for (u, v), flow in edge_flows.items():
+        if flow > 0:
+            outgoing.setdefault(u, {})
+            outgoing[u][v] = outgoing[u].get(v, 0) + flow
+    paths = []
+    while outgoing.get(source):
+        path = [source]
+        position = {source: 0}
+        while path[-1] != sink:
+            u = path[-1]
+            v = next(iter(outgoing[u]))
+            if v in position:
+                # цикл v → ... → u → v: віднімаємо його мінімум і продовжуємо з v
+                cycle = path[position[v] :] + [v]
+                _subtract(outgoing, cycle, min(outgoing[a][b] for a, b in zip(cycle, cycle[1:])))
+                for node in path[position[v] + 1 :]:
+                    del position[node]
+                del path[position[v] + 1 :]
+                continue
+            position[v] = len(path)
+            path.append(v)
+        amount = min(outgoing[a][b] for a, b in zip(path, path[1:]))
+        _subtract(outgoing, path, amount)
+        paths.append((path, amount))
+    return paths
+
+
+def _subtract(outgoing: dict, path, amount) -> None:
+    for u, v in zip(path, path[1:]):
+        outgoing[u][v] -= amount
+        if not outgoing[u][v]:
+            del outgoing[u][v]
+
+
+class IncrementalMaxFlow:
+    """
+    Максимальний потік між двома вершинами, що підтримується між змінами
+    пропускних здатностей, замість повного перерахунку з нульового потоку.
+
+    - Збільшення пропускної здатності лише додає залишкову здатність ребру,
+      і потік доповнюється від поточного, а не з нуля.
+    - Зменшення нижче поточного потоку через ребро u → v створює надлишок у u
+      та нестачу у v. Спершу надлишок перенаправляється іншими шляхами
+      u → v; те, що не вдалося перенаправити, скасовується: повертається з u
+      до джерела та забирається від стоку до v уздовж наявного потоку.
+    """
+
+    def __init__(self, network: FlowNetwork, source, sink):
+        self.network = network
+        self.source = network.index[source]
+        self.sink = network.index[sink]
+        if self.source == self.sink:
+            raise ValueError("джерело та стік мають відрізнятися")
+        # власна копія пропускних здатностей: update_capacity не змінює мережу
+        self.capacity = list(network.capacity)
+        self.residual = list(network.capacity)
+        self.edge_of = {}
+        for e, (u, v, _) in enumerate(network.edges):
+            self.edge_of.setdefault((u, v), e)
+        self.value = network._dinic(self.source, self.sink, self.residual)
+
+    def _augment(self, source: int, sink: int, limit=None) -> int:
+        if source == sink:
+            return 0 if limit is None else limit
+        return self.network._dinic(source, sink, self.residual, limit)
+
+    def update_capacity(self, u, v, new_capacity) -> int:
+        """Змінює пропускну здатність ребра u → v і відновлює максимальний потік."""
+        index = self.network.index
+        try:
+            e = self.edge_of[(index[u], index[v])]
+        except KeyError:
+            raise KeyError(f"ребра {u!r} → {v!r} немає в мережі") from None
+        if new_capacity < 0:
+            raise ValueError("пропускна здатність не може бути від'ємною")
+        a = self.network.edge_arc[e]
+        b = self.network.rev[a]
+        tail, head = self.network.edges[e][:2]
+        flow = self.capacity[a] - self.residual[a]
+        self.capacity[a] = new_capacity
+        if new_capacity >= flow:
+            self.residual[a] = new_capacity - flow
+        else:
+            excess = flow - new_capacity
+            # зрізаємо потік ребра до нової пропускної здатності
+            self.residual[a] = 0
+            self.residual[b] -= excess
+            rerouted = self._augment(tail, head, excess)
+            cancelled = excess - rerouted
+            if cancelled:
+                # шляхи tail → source та sink → head існують уздовж наявного потоку
+                self._augment(tail, self.source, cancelled)
+                self._augment(self.sink, head, cancelled)
+                self.value -= cancelled
+        self.value += self._augment(self.source, self.sink)
+        return self.value
+
+    def edge_flows(self) -> dict:
+        return self.network.edge_flows(self.residual, self.capacity)
+
+    def min_cut(self):
+        """
+        Мінімальний розріз як побічний результат: вершини, досяжні з джерела в
+        залишковому графі, та насичені ребра, що ведуть з них назовні.
+        """
+        network = self.network
+        start, head, residual = network.start, network.head, self.residual
+        reachable = [False] * network.num_nodes
+        reachable[self.source] = True
+        queue = deque([self.source])
+        while queue:
+            u = queue.popleft()
+            for a in range(start[u], start[u + 1]):
+                v = head[a]
+                if residual[a] > 0 and not reachable[v]:
+                    reachable[v] = True
+                    queue.append(v)
+        nodes = network.nodes
+        cut_edges = [
+            (nodes[u], nodes[v])
+            for (u, v, _), a in zip(network.edges, network.edge_arc)
+            if reachable[u] and not reachable[v] and self.capacity[a] > 0
+        ]
+        source_side = {nodes[u] for u in range(network.num_nodes) if reachable[u]}
+        return source_side, cut_edges
+
+
+def random_network(num_layers: int, width: int, degree: int, rng):
+    """Шаруватий граф: джерело → шари → стік, як склади та магазини, але більший."""
+    edges = [("S", (0, j), rng.randint(50, 100)) for j in range(width)]
+    for layer in range(num_layers - 1):
+        for j in range(width):
+            for k in rng.sample(range(width), degree):
+                edges.append(((layer, j), (layer + 1, k), rng.randint(1, 30)))
+    edges += [((num_layers - 1, j), "T", rng.randint(50, 100)) for j in range(width)]
+    return edges
+
+
+if __name__ == "__main__":
+    from task_1 import G, edmonds_karp, stores, terminals
+
+    network = FlowNetwork.from_networkx(G)
+
+    start = time.perf_counter()
+    expected = {(t, s): edmonds_karp(G, t, s) for t in terminals for s in stores}
+    reference_time = time.perf_counter() - start
+
+    print(f"{'Метод':<28} | {'Час (мс)':<8}")
+    print("-" * 40)
+    print(f"{'edmonds_karp x 28':<28} | {reference_time * 1000:<8.2f}")
+    for algorithm in FlowNetwork.ALGORITHMS:
+        start = time.perf_counter()
+        table = network.flow_table(terminals, stores, algorithm)
+        elapsed = time.perf_counter() - start
+        assert table == expected
+        print(f"{'FlowNetwork.' + algorithm:<28} | {elapsed * 1000:<8.2f}")
+
+    print("\n| Термінал     | Магазин     | Потік(одиниць) |")
+    print("|--------------|-------------|----------------|")
+    for (terminal, store), flow in table.items():
+        print(f"| {terminal:<12} | {store:<11} | {flow:<14} |")
+
+    # одна задача з суперджерелом і суперстоком замість 28 окремих
+    start = time.perf_counter()
+    total, consistent_table, paths = network.multi_source_flow(terminals, stores)
+    elapsed = time.perf_counter() - start
+    print(f"\nОдин розв'язок для всіх пар: загальний потік {total}, {elapsed * 1000:.2f} мс")
+    print("| Термінал     | Магазин     | Потік(одиниць) |")
+    print("|--------------|-------------|----------------|")
+    for (terminal, store), flow in consistent_table.items():
+        assert flow <= expected[(terminal, store)]
+        print(f"| {terminal:<12} | {store:<11} | {flow:<14} |")
+    for path, amount in paths:
+        print(f"{' → '.join(path)}: {amount}")
+
+    # більша мережа: Дініц проти проштовхування передпотоку
+    rng = random.Random(42)
+    for num_layers, width in [(10, 50), (20, 100), (30, 200)]:
+        network = FlowNetwork(random_network(num_layers, width, 5, rng))
+        results = []
+        for algorithm in FlowNetwork.ALGORITHMS:
+            start = time.perf_counter()
+            results.append((algorithm, network.max_flow("S", "T", algorithm), time.perf_counter() - start))
+        assert len({flow for _, flow, _ in results}) == 1
+        timings = ", ".join(f"{name}: {elapsed * 1000:.1f} мс" for name, _, elapsed in results)
+        print(f"{network.num_nodes} вершин, {len(network.edges)} ребер, потік {results[0][1]}: {timings}")
+
+    # кілька змін пропускних здатностей: інкрементальне відновлення проти перерахунку
+    network = FlowNetwork(random_network(20, 100, 5, rng))
+    incremental = IncrementalMaxFlow(network, "S", "T")
+    changes = [
+        (network.nodes[u], network.nodes[v], rng.randint(0, 30))
+        for u, v, _ in rng.sample(network.edges, 50)
+    ]
+    incremental_time = full_time = 0.0
+    for u, v, new_capacity in changes:
+        start = time.perf_counter()
+        value = incremental.update_capacity(u, v, new_capacity)
+        incremental_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        residual = list(incremental.capacity)
+        expected = network._dinic(network.index["S"], network.index["T"], residual)
+        full_time += time.perf_counter() - start
+        assert value == expected
+    source_side, cut_edges = incremental.min_cut()
+    flows = incremental.edge_flows()
+    # ребра мінімального розрізу насичені, тож їхній потік дорівнює пропускній здатності
+    assert sum(flows[edge] for edge in cut_edges) == value
+    print(
+        f"\n{len(changes)} змін: інкрементально {incremental_time * 1000:.1f} мс, "
+        f"з нуля {full_time * 1000:.1f} мс; потік {value}, "
+        f"мінімальний розріз — {len(cut_edges)} ребер"
+    )
@@ -0,0 +1,49 @@
+import random
+import sys
+import timeit
+from pathlib import Path
+
+from splay_tree import SplayMap
+
+# AVL-дерево з уроку 15 для порівняння
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lesson_15"))
+from avl import AVLTree  # noqa: E402
+
+
+def access_patterns(keys, num_queries: int, rng):
+    """Послідовності запитів з різним ступенем перекосу."""
+    hot_keys = rng.sample(keys, 100)
+    sorted_keys = sorted(keys)
+    return {
+        "рівномірний": [rng.choice(keys) for _ in range(num_queries)],
+        "90% до 100 ключів": [
+            rng.choice(hot_keys) if rng.random() < 0.9 else rng.choice(keys)
+            for _ in range(num_queries)
+        ],
+        "Zipf (s=1.2)": rng.choices(
+            keys, weights=[1 / (rank + 1) ** 1.2 for rank in range(len(keys))], k=num_queries
+        ),
+        "послідовний обхід": (sorted_keys * (num_queries // len(keys) + 1))[:num_queries],
+        "один ключ": [hot_keys[0]] * num_queries,
+    }
+
+
+if __name__ == "__main__":
+    rng = random.Random(42)
+    n = 50_000
+    num_queries = 200_000
+    keys = rng.sample(range(10 * n), n)
+
+    avl_tree = AVLTree()
+    splay_map = SplayMap()
+    for key in keys:
+        avl_tree.insert(key)
+        splay_map[key] = key
+
+    print(f"{n} ключів, {num_queries} запитів")
+    print(f"{'Розподіл запитів':<20} | {'AVL (сек)':<10} | {'Splay (сек)':<11} | {'Splay / AVL':<10}")
+    print("-" * 62)
+    for name, queries in access_patterns(keys, num_queries, rng).items():
+        avl_time = timeit.timeit(lambda: [avl_tree.search(key) for key in queries], number=1)
+        splay_time = timeit.timeit(lambda: [key in splay_map for key in queries], number=1)
+        print(f"{name:<20} | {avl_time:<10.3f} | {splay_time:<11.3f} | {splay_time / avl_time:<10.2f}")
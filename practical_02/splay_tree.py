@@ -1,7 +1,3 @@
-import matplotlib.pyplot as plt
-import networkx as nx
-
-
 class Node:
     def __init__(self, data, parent=None):
         self.data = data
@@ -17,20 +13,23 @@ class SplayTree:
     def insert(self, data):
         if self.root is None:
             self.root = Node(data)
-        else:
-            self._insert_node(data, self.root)
-
-    def _insert_node(self, data, current_node):
-        if data < current_node.data:
-            if current_node.left_node:
-                self._insert_node(data, current_node.left_node)
-            else:
-                current_node.left_node = Node(data, current_node)
-        else:
-            if current_node.right_node:
-                self._insert_node(data, current_node.right_node)
+            return
+        current_node = self.root
+        while True:
+            if data < current_node.data:
+                if current_node.left_node is None:
+                    current_node.left_node = Node(data, current_node)
+                    current_node = current_node.left_node
+                    break
+                current_node = current_node.left_node
             else:
-                current_node.right_node = Node(data, current_node)
+                if current_node.right_node is None:
+                    current_node.right_node = Node(data, current_node)
+                    current_node = current_node.right_node
+                    break
+                current_node = current_node.right_node
+        # новий вузол теж піднімається до кореня, як і знайдений у find()
+        self._splay(current_node)
 
     def find(self, data):
         node = self.root
@@ -107,6 +106,10 @@ class SplayTree:
 
     def visualize(self):
         """Візуалізує дерево за допомогою бібліотеки networkx у вигляді дерева."""
+        # бібліотеки візуалізації потрібні лише тут, тож імпортуються ліниво
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
         if self.root is None:
             print("Дерево порожнє.")
             return
@@ -183,7 +186,286 @@ class SplayTree:
             self.print_tree(node.left_node, level + 1)
 
 
+class MapNode:
+    __slots__ = ("key", "value", "left", "right")
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+        self.left: MapNode | None = None
+        self.right: MapNode | None = None
+
+
+class SplayMap:
+    """
+    Впорядкований словник ключ → значення на розширюваному дереві.
+
+    На відміну від SplayTree, сплаювання виконується зверху вниз (Sleator,
+    Tarjan): одним ітеративним проходом від кореня, без посилань на батьків і
+    без рекурсії. Кожна операція — вставка, пошук, видалення, floor/ceiling —
+    піднімає ключ (або найближчий до нього) до кореня, тож часто запитувані
+    ключі залишаються біля вершини дерева.
+    """
+
+    def __init__(self, items=None):
+        self.root: MapNode | None = None
+        self._size = 0
+        self._header = MapNode(None, None)
+        if items is not None:
+            for key, value in items.items() if hasattr(items, "items") else items:
+                self[key] = value
+
+    def _splay(self, key) -> None:
+        """Піднімає до кореня вузол з ключем key або останній вузол на шляху до нього."""
+        node = self.root
+        if node is None or node.key == key:
+            return
+        header = self._header  # один допоміжний вузол на дерево, без алокацій
+        header.left = header.right = None
+        # left_tail / right_tail — найбільший вузол лівого та найменший правого дерева
+        left_tail = right_tail = header
+        while True:
+            if key < node.key:
+                if node.left is None:
+                    break
+                if key < node.left.key:
+                    child = node.left  # поворот праворуч (zig-zig)
+                    node.left = child.right
+                    child.right = node
+                    node = child
+                    if node.left is None:
+                        break
+                right_tail.left = node  # приєднуємо до правого дерева
+                right_tail = node
+                node = node.left
+            elif key > node.key:
+                if node.right is None:
+                    break
+                if key > node.right.key:
+                    child = node.right  # поворот ліворуч (zag-zag)
+                    node.right = child.left
+                    child.left = node
+                    node = child
+                    if node.right is None:
+                        break
+                left_tail.right = node  # приєднуємо до лівого дерева
+                left_tail = node
+                node = node.right
+            else:
+                break
+        # збираємо: ліве дерево, вузол, праве дерево
+        left_tail.right = node.left
+        right_tail.left = node.right
+        node.left = header.right
+        node.right = header.left
+        self.root = node
+
+    def _splay_edge(self, rightmost: bool) -> None:
+        """Піднімає до кореня найменший (або найбільший) вузол."""
+        node = self.root
+        while node is not None and (node.right if rightmost else node.left) is not None:
+            node = node.right if rightmost else node.left
+        if node is not None:
+            self._splay(node.key)
+
+    def __setitem__(self, key, value) -> None:
+        root = self.root
+        if root is None:
+            self.root = MapNode(key, value)
+            self._size = 1
+            return
+        self._splay(key)
+        root = self.root
+        if key == root.key:
+            root.value = value
+            return
+        node = MapNode(key, value)
+        if key < root.key:
+            node.left = root.left
+            node.right = root
+            root.left = None
+        else:
+            node.right = root.right
+            node.left = root
+            root.right = None
+        self.root = node
+        if self._size is not None:
+            self._size += 1
+
+    def get(self, key, default=None):
+        self._splay(key)
+        if self.root is not None and self.root.key == key:
+            return self.root.value
+        return default
+
+    def __getitem__(self, key):
+        self._splay(key)
+        if self.root is None or self.root.key != key:
+            raise KeyError(key)
+        return self.root.value
+
+    def __contains__(self, key) -> bool:
+        self._splay(key)
+        return self.root is not None and self.root.key == key
+
+    def pop(self, key, *default):
+        self._splay(key)
+        root = self.root
+        if root is None or root.key != key:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        if root.left is None:
+            self.root = root.right
+        else:
+            # усі ключі лівого піддерева менші за key: після сплаю максимум стає
+            # коренем без правого сина, і до нього підвішуємо праве піддерево
+            right = root.right
+            self.root = root.left
+            self._splay(key)
+            self.root.right = right
+        if self._size is not None:
+            self._size -= 1
+        return root.value
+
+    def __delitem__(self, key) -> None:
+        self.pop(key)
+
+    def __len__(self) -> int:
+        if self._size is None:  # після split/join розмір перераховується ліниво
+            self._size = sum(1 for _ in self._iter_nodes(self.root))
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self.root is not None
+
+    @staticmethod
+    def _iter_nodes(node, lo=None, hi=None):
+        """Симетричний обхід з явним стеком; лише вузли з lo <= key < hi."""
+        stack = []
+        while stack or node is not None:
+            if node is not None:
+                if lo is not None and node.key < lo:
+                    node = node.right  # ліве піддерево теж менше за lo
+                    continue
+                stack.append(node)
+                node = node.left
+                continue
+            node = stack.pop()
+            if hi is not None and not node.key < hi:
+                return
+            yield node
+            node = node.right
+
+    def __iter__(self):
+        return (node.key for node in self._iter_nodes(self.root))
+
+    def items(self):
+        return ((node.key, node.value) for node in self._iter_nodes(self.root))
+
+    def range(self, lo=None, hi=None):
+        """Пари (ключ, значення) з lo <= ключ < hi у порядку зростання."""
+        if lo is not None:
+            self._splay(lo)  # амортизує наступні запити біля lo
+        return ((node.key, node.value) for node in self._iter_nodes(self.root, lo, hi))
+
+    def floor(self, key):
+        """Пара з найбільшим ключем <= key або None."""
+        self._splay(key)
+        root = self.root
+        if root is None:
+            return None
+        if not key < root.key:
+            return root.key, root.value
+        node = root.left
+        if node is None:
+            return None
+        while node.right is not None:
+            node = node.right
+        self._splay(node.key)
+        return node.key, node.value
+
+    def ceiling(self, key):
+        """Пара з найменшим ключем >= key або None."""
+        self._splay(key)
+        root = self.root
+        if root is None:
+            return None
+        if not root.key < key:
+            return root.key, root.value
+        node = root.right
+        if node is None:
+            return None
+        while node.left is not None:
+            node = node.left
+        self._splay(node.key)
+        return node.key, node.value
+
+    def min(self):
+        self._splay_edge(rightmost=False)
+        if self.root is None:
+            raise ValueError("Дерево порожнє")
+        return self.root.key, self.root.value
+
+    def max(self):
+        self._splay_edge(rightmost=True)
+        if self.root is None:
+            raise ValueError("Дерево порожнє")
+        return self.root.key, self.root.value
+
+    def split(self, key):
+        """
+        Ділить словник на два: ключі < key та ключі >= key. Вузли переходять
+        у нові словники без копіювання, а цей словник стає порожнім.
+        """
+        left, right = SplayMap(), SplayMap()
+        self._splay(key)
+        root = self.root
+        if root is not None:
+            if root.key < key:
+                right.root = root.right
+                root.right = None
+                left.root = root
+            else:
+                left.root = root.left
+                root.left = None
+                right.root = root
+        left._size = right._size = None
+        self.root = None
+        self._size = 0
+        return left, right
+
+    def join(self, other: "SplayMap") -> None:
+        """Приєднує other, усі ключі якого більші за ключі цього словника; other стає порожнім."""
+        if other.root is None:
+            return
+        if self.root is not None:
+            self._splay_edge(rightmost=True)
+            other._splay_edge(rightmost=False)
+            if not self.root.key < other.root.key:
+                raise ValueError("усі ключі other мають бути більшими за ключі цього словника")
+            self.root.right = other.root
+            self._size = None if self._size is None or other._size is None else self._size + other._size
+        else:
+            self.root = other.root
+            self._size = other._size
+        other.root = None
+        other._size = 0
+
+    def __repr__(self):
+        return f"SplayMap({dict(self.items())!r})"
+
+
 if __name__ == "__main__":
+    prices = SplayMap({10: "десять", 8: "вісім", 3: "три", 7: "сім", 15: "п'ятнадцять"})
+    print("Ключі 5..12:", list(prices.range(5, 12)))
+    print("floor(9):", prices.floor(9), "ceiling(9):", prices.ceiling(9))
+    del prices[8]
+    smaller, larger = prices.split(10)
+    print("split(10):", smaller, larger)
+    smaller.join(larger)
+    print("join:", smaller, "корінь:", smaller.root.key)
+
     splay_tree = SplayTree()
     splay_tree.insert(10)
     splay_tree.insert(8)
@@ -100,11 +100,13 @@ def edmonds_karp(G, source, sink):
 
 terminals = [node for node in G.nodes if "Термінал" in node]
 stores = [node for node in G.nodes if "Магазин" in node]
-print(" Таблиця з результатами")
-print("|--------------|-------------|----------------|")
-print("| Термінал     | Магазин     | Потік(одиниць) |")
-print("|--------------|-------------|----------------|")
-for terminal in terminals:
-    for store in stores:
-        max_flow = edmonds_karp(G, terminal, store)
-        print(f"| {terminal:<12} | {store:<11} | {max_flow:<14} |")
+
+if __name__ == "__main__":
+    print(" Таблиця з результатами")
+    print("|--------------|-------------|----------------|")
+    print("| Термінал     | Магазин     | Потік(одиниць) |")
+    print("|--------------|-------------|----------------|")
+    for terminal in terminals:
+        for store in stores:
+            max_flow = edmonds_karp(G, terminal, store)
+            print(f"| {terminal:<12} | {store:<11} | {max_flow:<14} |")
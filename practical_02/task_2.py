@@ -1,34 +1,171 @@
+import codecs
 import heapq
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import timeit
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from pathlib import Path
 
+# купа по головах джерел — спільна реалізація з practical_01
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "practical_01"))
+from merge_list import merge_k_iterators  # noqa: E402
 
-def merge_k_lists(lists):
-    # Ініціалізуємо мінімальну купу
-    min_heap = []
-    # Ініціалізуємо ітератори для кожного списку
-    iterators = [iter(x) for x in lists]
 
-    # Додаємо перший елемент кожного списку в купу разом з індексом списку і ітератором
-    for list_idx, it in enumerate(iterators):
-        first_element = next(it, None)
-        if first_element is not None:
-            heapq.heappush(min_heap, (first_element, list_idx, it))
-    # print(min_heap)
-    # Ініціалізуємо результат
-    result = []
+def merge_k_lists(lists, key=None):
+    return list(iter_merge_k(lists, key=key))
 
-    # Поки купа не порожня, витягуємо найменший елемент і додаємо його до результату
-    while min_heap:
-        val, list_idx, it = heapq.heappop(min_heap)
-        result.append(val)
-        # Беремо наступний елемент з того ж списку та додаємо його до купи
-        next_element = next(it, None)
-        if next_element is not None:
-            heapq.heappush(min_heap, (next_element, list_idx, it))
 
-    return result
+def iter_merge_k(sources, key=None, batch_size=None):
+    """
+    Ліниве злиття k відсортованих джерел: елементи видаються по одному,
+    а в пам'яті лежить лише по одному елементу з кожного джерела — O(k).
+
+    Джерелом може бути будь-який ітерований об'єкт: список, генератор,
+    read_sorted() над файлом чи сокетом. `key` має той самий зміст, що й у
+    sorted(). Злиття стабільне: рівні елементи йдуть у порядку джерел.
+    Поелементний режим — це merge_k_iterators з practical_01/merge_list.py.
+
+    batch_size — пакетний режим: з кожного джерела забирається блок
+    елементів, і все, що гарантовано менше за наступні блоки, зливається
+    одним sorted() замість next() та heappush на кожен елемент.
+    Пам'ять тоді O(k * batch_size).
+    """
+    if batch_size is not None:
+        yield from _merge_batched(sources, key, batch_size)
+    else:
+        yield from merge_k_iterators(*sources, key=key)
+
+
+def _merge_batched(sources, key, batch_size):
+    if batch_size < 1:
+        raise ValueError("batch_size має бути додатним")
+    key_func = key or (lambda value: value)
+    # для кожного джерела: [ітератор, буфер ще не виданих елементів]
+    pending = []
+    for source in sources:
+        iterator = iter(source)
+        buffer = list(islice(iterator, batch_size))
+        if buffer:
+            pending.append([iterator, buffer])
+
+    while len(pending) > 1:
+        # Поріг — найменший з останніх ключів буферів: наступні елементи
+        # кожного джерела не менші за його останній ключ, тож усе, що менше
+        # порогу, можна видавати. Рівні порогу елементи видають лише джерела
+        # до першого, на якому поріг досягнуто, — так зберігається стабільність.
+        last_keys = [key_func(buffer[-1]) for _, buffer in pending]
+        threshold = min(last_keys)
+        first = last_keys.index(threshold)
+        ready = []
+        for index, state in enumerate(pending):
+            buffer = state[1]
+            if index <= first:
+                cut = bisect_right(buffer, threshold, key=key)
+            else:
+                cut = bisect_left(buffer, threshold, key=key)
+            ready += buffer[:cut]
+            del buffer[:cut]
+        # ready складається з відсортованих серій, які Timsort зливає майже лінійно
+        ready.sort(key=key)
+        yield from ready
+
+        remaining = []
+        for state in pending:
+            if not state[1]:
+                state[1] = list(islice(state[0], batch_size))
+            if state[1]:
+                remaining.append(state)
+        pending = remaining
+
+    if pending:
+        iterator, buffer = pending[0]
+        yield from buffer
+        yield from iterator
+
+
+def read_sorted(source, parse=int, block_size=1 << 16, encoding="utf-8"):
+    """
+    Генератор записів з відсортованого текстового джерела (один запис у рядку).
+
+    source — шлях до файлу, відкритий файл (read) або сокет (recv). Дані
+    читаються блоками по block_size, рядок, розрізаний межею блоків,
+    склеюється з наступним блоком. Порожні рядки пропускаються.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            yield from read_sorted(file, parse, block_size, encoding)
+        return
+
+    read = source.recv if hasattr(source, "recv") else source.read
+    decoder = codecs.getincrementaldecoder(encoding)()
+    tail = ""
+    while chunk := read(block_size):
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        lines = (tail + chunk).split("\n")
+        tail = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield parse(line)
+    tail += decoder.decode(b"", final=True)
+    if tail.strip():
+        yield parse(tail)
+
+
+def serve_sorted(connection, values):
+    """Надсилає відсортовані значення в сокет по одному в рядку і закриває його."""
+    with connection:
+        connection.sendall("".join(f"{value}\n" for value in values).encode("utf-8"))
 
 
 if __name__ == "__main__":
     lists = [[1, 4, 5], [1, 3, 4], [2, 6]]
     merged_list = merge_k_lists(lists)
     print("Відсортований список:", merged_list)
+
+    # злиття за ключем: рівні оцінки лишаються в порядку списків
+    groups = [[("Олена", 3), ("Іван", 5)], [("Петро", 3), ("Марія", 4)]]
+    print("За ключем:", list(iter_merge_k(groups, key=lambda item: item[1])))
+
+    # джерела: два файли і сокет, у який пише окремий потік
+    rng = random.Random(42)
+    runs = [sorted(rng.randrange(1000) for _ in range(20)) for _ in range(3)]
+    directory = tempfile.mkdtemp()
+    file_paths = []
+    for number, run in enumerate(runs[:2]):
+        file_path = os.path.join(directory, f"run_{number}.txt")
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(map(str, run)))
+        file_paths.append(file_path)
+    reader, writer = socket.socketpair()
+    sender = threading.Thread(target=serve_sorted, args=(writer, runs[2]))
+    sender.start()
+    with reader:
+        sources = [read_sorted(path, block_size=16) for path in file_paths]
+        sources.append(read_sorted(reader, block_size=16))
+        merged = list(iter_merge_k(sources, batch_size=8))
+    sender.join()
+    for file_path in file_paths:
+        os.remove(file_path)
+    os.rmdir(directory)
+    assert merged == sorted(value for run in runs for value in run)
+    print("Файли і сокет:", merged[:10], "...")
+
+    # порівняння: по елементу через купу, пакетний режим і heapq.merge
+    total = 400_000
+    print(f"\n{total} елементів")
+    print(f"{'k':<6} | {'купа, с':<9} | {'пакети 1024, с':<15} | {'heapq.merge, с':<14}")
+    print("-" * 54)
+    for k in [4, 64, 1024]:
+        runs = [sorted(rng.randrange(10**6) for _ in range(total // k)) for _ in range(k)]
+        expected = sorted(value for run in runs for value in run)
+        assert list(iter_merge_k(runs, batch_size=1024)) == expected
+        heap_time = timeit.timeit(lambda: list(iter_merge_k(runs)), number=1)
+        batch_time = timeit.timeit(lambda: list(iter_merge_k(runs, batch_size=1024)), number=1)
+        merge_time = timeit.timeit(lambda: list(heapq.merge(*runs)), number=1)
+        print(f"{k:<6} | {heap_time:<9.3f} | {batch_time:<15.3f} | {merge_time:<14.3f}")
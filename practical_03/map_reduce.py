@@ -1,6 +1,19 @@
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from pathlib import Path
+
 from seed_data import all_feeds
 from divide_and_conquer import merge_k_feeds
-from collections import defaultdict
+
+# k-шляхове злиття через купу — спільна реалізація з practical_01
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "practical_01"))
+from merge_list import merge_k_iterators  # noqa: E402
 
 
 # Імітація Mapper (Агент)
@@ -31,42 +44,100 @@ def shuffle(mapped_by_agent):
 
 # Імітація Reducer
 def reducer(key, lists_to_merge):
-    # lists_to_merge - масив відсортованих списків від агентів
-    return merge_k_feeds(lists_to_merge)
+    # lists_to_merge - масив відсортованих списків від агентів;
+    # k-шляхове злиття через купу за O(n log k) без проміжних копій
+    return list(merge_k_iterators(*lists_to_merge, key=lambda post: post["timestamp"]))
+
+
+def map_chunk(feeds):
+    """Задача для процесу: mapper для групи агентів."""
+    return [mapper(agent_feed) for agent_feed in feeds]
+
+
+def reduce_chunk(items):
+    """Задача для процесу: reduce для групи ключів."""
+    return [(key, reducer(key, lists_to_merge)) for key, lists_to_merge in items]
+
+
+def split_into(items, parts):
+    """Ділить список на `parts` суцільних груп майже однакового розміру."""
+    size = max(1, -(-len(items) // parts))
+    return [items[start : start + size] for start in range(0, len(items), size)]
 
 
 # MapReduce workflow
-def map_reduce_pipeline(feeds):
-    # 1. MAP: кожен агент генерує пари (key, value)
-    mapped_by_agent = []
-    for agent_feed in feeds:
-        mapped = mapper(agent_feed)
-        mapped_by_agent.append(mapped)
-
-    print(f"MAP фаза: {len(feeds)} агентів згенерували пари (key, value)")
-    for agent_idx, agent_mapped in enumerate(mapped_by_agent):
-        print(f"  Агент {agent_idx}: {len(agent_mapped)} пар (key, value)")
-
-    # 2. SHUFFLE: групуємо за датами, зберігаючи окремі потоки від агентів
-    grouped = shuffle(mapped_by_agent)
-    print(f"SHUFFLE фаза: згруповано в {len(grouped)} унікальних дат")
-    print(f"Ключі після shuffle: {list(grouped.keys())}")
-    for key in sorted(grouped.keys()):
-        total_news = sum(len(feed) for feed in grouped[key])
-        print(f"  Дата {key}: {total_news} новин від {len(grouped[key])} агентів")
-
-    # 3. REDUCE: використовуємо merge_k_feeds для кожної дати
-    results = {}
-    for key, feeds_to_merge in grouped.items():
-        results[key] = reducer(key, feeds_to_merge)
-        print(f"REDUCE фаза: дата {key} -> {len(feeds_to_merge)} потоків об'єднано")
+def map_reduce_pipeline(feeds, parallel=False, max_workers=None, verbose=True):
+    """
+    parallel=True — mapper'и та reducer'и виконуються на пулі процесів:
+    одна задача на групу агентів і одна на групу ключів, shuffle лишається
+    в головному процесі.
+
+    Кожна новина при цьому двічі серіалізується туди й назад (map і reduce),
+    а самі mapper і reducer тут дешеві, тож пул окупається лише на кількох
+    ядрах і коли обробка запису важча за його pickle. На одному ядрі
+    паралельний режим у кілька разів повільніший за послідовний.
+    """
+    log = print if verbose else lambda *args: None
+    with ProcessPoolExecutor(max_workers=max_workers) if parallel else nullcontext() as executor:
+        workers = max_workers or os.cpu_count() or 1
+
+        # 1. MAP: кожен агент генерує пари (key, value)
+        if executor is None:
+            mapped_by_agent = [mapper(agent_feed) for agent_feed in feeds]
+        else:
+            chunks = executor.map(map_chunk, split_into(feeds, workers))
+            mapped_by_agent = [mapped for chunk in chunks for mapped in chunk]
+
+        log(f"MAP фаза: {len(feeds)} агентів згенерували пари (key, value)")
+        for agent_idx, agent_mapped in enumerate(mapped_by_agent):
+            log(f"  Агент {agent_idx}: {len(agent_mapped)} пар (key, value)")
+
+        # 2. SHUFFLE: групуємо за датами, зберігаючи окремі потоки від агентів
+        grouped = shuffle(mapped_by_agent)
+        log(f"SHUFFLE фаза: згруповано в {len(grouped)} унікальних дат")
+        log(f"Ключі після shuffle: {list(grouped.keys())}")
+        for key in sorted(grouped.keys()):
+            total_news = sum(len(feed) for feed in grouped[key])
+            log(f"  Дата {key}: {total_news} новин від {len(grouped[key])} агентів")
+
+        # 3. REDUCE: зливаємо потоки агентів для кожної дати через купу
+        if executor is None:
+            results = {key: reducer(key, feeds_to_merge) for key, feeds_to_merge in grouped.items()}
+        else:
+            chunks = executor.map(reduce_chunk, split_into(list(grouped.items()), workers))
+            results = dict(pair for chunk in chunks for pair in chunk)
+        for key, feeds_to_merge in grouped.items():
+            log(f"REDUCE фаза: дата {key} -> {len(feeds_to_merge)} потоків об'єднано")
 
     return results
 
 
+def make_feeds(num_agents, posts_per_agent, num_days, seed=42):
+    """Випадкові відсортовані за часом потоки агентів для порівняння швидкодії."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 5)
+    minutes = num_days * 24 * 60
+    categories = ["Tech", "Politics", "Sport", "Science"]
+    feeds = []
+    for agent in range(num_agents):
+        offsets = sorted(rng.randrange(minutes) for _ in range(posts_per_agent))
+        feeds.append(
+            [
+                {
+                    "timestamp": start + timedelta(minutes=offset),
+                    "source": f"Agent_{agent + 1}",
+                    "category": rng.choice(categories),
+                    "content": f"Новина {number} від агента {agent + 1}",
+                }
+                for number, offset in enumerate(offsets)
+            ]
+        )
+    return feeds
+
+
 if __name__ == "__main__":
     print("=" * 60)
-    print("MapReduce Pipeline з merge_k_feeds")
+    print("MapReduce Pipeline з k-шляховим злиттям через купу")
     print("=" * 60)
     results = map_reduce_pipeline(all_feeds)
 
@@ -76,3 +147,30 @@ if __name__ == "__main__":
             print(
                 f"  {news['timestamp'].strftime('%H:%M')} | {news['source']} | {news['category']}: {news['content']}"
             )
+
+    # Порівняння reduce: рекурсивний merge_k_feeds проти купи, один день
+    print("\n" + "=" * 60)
+    print(f"{'Агентів':<8} | {'merge_k_feeds, с':<17} | {'купа, с':<8}")
+    print("-" * 40)
+    for num_agents in [10, 100, 1000]:
+        day_feeds = make_feeds(num_agents, 100_000 // num_agents, num_days=1)
+        start = time.perf_counter()
+        expected = merge_k_feeds(day_feeds)
+        recursive_time = time.perf_counter() - start
+        start = time.perf_counter()
+        merged = reducer(None, day_feeds)
+        heap_time = time.perf_counter() - start
+        assert merged == expected
+        print(f"{num_agents:<8} | {recursive_time:<17.3f} | {heap_time:<8.3f}")
+
+    # Послідовний конвеєр проти пулу процесів
+    feeds = make_feeds(1000, 200, num_days=7)
+    print(f"\n1000 агентів x 200 новин за 7 днів, ядер: {os.cpu_count()}")
+    start = time.perf_counter()
+    serial = map_reduce_pipeline(feeds, verbose=False)
+    serial_time = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = map_reduce_pipeline(feeds, parallel=True, verbose=False)
+    parallel_time = time.perf_counter() - start
+    assert serial == parallel
+    print(f"послідовно: {serial_time:.3f} с, пул процесів: {parallel_time:.3f} с")